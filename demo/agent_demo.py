@@ -2,8 +2,6 @@ import sys
 from pathlib import Path
 import json
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from echos.core import DAWManager
 from echos.backends.pedalboard import (
     PedalboardEngineFactory,
@@ -16,6 +14,15 @@ from echos.facade import DAWFacade
 from echos.services import *
 from echos.agent.tools import AgentToolkit, tool
 
+# the two-note phrase every demo writes, built once and sent column-wise
+# (one list per Note field) instead of as a dict per note
+DEMO_NOTES = {
+    "pitch": [60, 64],
+    "velocity": [100, 100],
+    "start_beat": [0.0, 1.0],
+    "duration_beats": [1.0, 1.0],
+}
+
 
 def initialize_daw_system():
 
@@ -81,13 +88,14 @@ def create_agent_toolkit(facade: DAWFacade):
             categories[tool.category] = []
         categories[tool.category].append(tool.name)
 
-    print(f"\nTool Categories:")
+    lines = ["\nTool Categories:"]
     for category, tool_names in sorted(categories.items()):
-        print(f"  {category}: {len(tool_names)} tools")
-        for name in tool_names[:3]:  # Display first 3
-            print(f"    - {name}")
+        lines.append(f"  {category}: {len(tool_names)} tools")
+        # Display first 3
+        lines.extend(f"    - {name}" for name in tool_names[:3])
         if len(tool_names) > 3:
-            print(f"    ... and {len(tool_names) - 3} more")
+            lines.append(f"    ... and {len(tool_names) - 3} more")
+    print("\n".join(lines))
 
     return toolkit
 
@@ -142,16 +150,14 @@ def demo_2_create_song_structure(toolkit: AgentToolkit):
     toolkit.execute("transport.set_time_signature", numerator=4, denominator=4)
     print(f"  ✓ Set tempo: 120 BPM, time signature: 4/4")
 
-    tracks = []
-
-    for name in ["Drums", "Bass", "Piano"]:
-        result = toolkit.execute("node.create_instrument_track",
-                                 project_id=project_id,
-                                 name=name)
-        print(result)
-        tracks.append(result.data["node_id"])
-
-        print(f"  ✓ Created track: {name}")
+    result = toolkit.execute("node.create_tracks",
+                             project_id=project_id,
+                             specs=[("instrument", name)
+                                    for name in ["Drums", "Bass", "Piano"]])
+    print(result)
+    tracks = [track["node_id"] for track in result.data["tracks"]]
+    for track in result.data["tracks"]:
+        print(f"  ✓ Created track: {track['name']}")
 
     result = toolkit.execute("editing.create_midi_clip",
                              project_id=project_id,
@@ -165,17 +171,7 @@ def demo_2_create_song_structure(toolkit: AgentToolkit):
                              project_id=project_id,
                              track_id=result.data['track_id'],
                              clip_id=result.data['clip_id'],
-                             notes=[{
-                                 "pitch": 60,
-                                 "velocity": 100,
-                                 "start_beat": 0.0,
-                                 "duration_beats": 1.0
-                             }, {
-                                 "pitch": 64,
-                                 "velocity": 100,
-                                 "start_beat": 1.0,
-                                 "duration_beats": 1.0
-                             }])
+                             notes=DEMO_NOTES)
 
     print(f"  ✓ {result.message}")
 
@@ -415,17 +411,7 @@ def demo_7_interactive_agent():
             project_id=project_id,
             track_id=track_id,
             clip_id=clip_id,
-            notes=[{
-                "pitch": 60,
-                "velocity": 100,
-                "start_beat": 0.0,
-                "duration_beats": 1.0
-            }, {
-                "pitch": 64,
-                "velocity": 100,
-                "start_beat": 1.0,
-                "duration_beats": 1.0
-            }]),
+            notes=DEMO_NOTES),
     }
 
     simulated_inputs = [
@@ -731,17 +717,7 @@ def scenario_1_beginner_tutorial():
                 "track 1",
                 "clip_id":
                 "clip 1",
-                "notes": [{
-                    "pitch": 60,
-                    "velocity": 100,
-                    "start_beat": 0.0,
-                    "duration_beats": 1.0
-                }, {
-                    "pitch": 64,
-                    "velocity": 100,
-                    "start_beat": 1.0,
-                    "duration_beats": 1.0
-                }]
+                "notes": DEMO_NOTES
             }),
             "explanation":
             "This is a simple 4-bar drum pattern"
@@ -2,8 +2,6 @@ import sys
 from pathlib import Path
 import time
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from echos.core import DAWManager
 from echos.backends.pedalboard import (
     PedalboardEngineFactory,
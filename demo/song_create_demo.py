@@ -1,9 +1,5 @@
-import sys
-from pathlib import Path
+import asyncio
 import json
-import time
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from echos.core import DAWManager
 from echos.backends.pedalboard import (
@@ -40,13 +36,14 @@ def create_agent_toolkit(facade: DAWFacade):
             categories[tool.category] = []
         categories[tool.category].append(tool.name)
 
-    print(f"\nTool Categories:")
+    lines = ["\nTool Categories:"]
     for category, tool_names in sorted(categories.items()):
-        print(f"  {category}: {len(tool_names)} tools")
-        for name in tool_names[:3]:  # Display the first 3
-            print(f"    - {name}")
+        lines.append(f"  {category}: {len(tool_names)} tools")
+        # Display the first 3
+        lines.extend(f"    - {name}" for name in tool_names[:3])
         if len(tool_names) > 3:
-            print(f"    ... and {len(tool_names) - 3} more")
+            lines.append(f"    ... and {len(tool_names) - 3} more")
+    print("\n".join(lines))
 
     return toolkit
 
@@ -173,7 +170,7 @@ def initialize_daw_system():
     return facade, manager
 
 
-def song_create_demo(toolkit: AgentToolkit, facade: DAWFacade):
+async def song_create_demo(toolkit: AgentToolkit, facade: DAWFacade):
 
     print("\n" + "=" * 70)
     print("Demo 3: Agent chain execution for a complex task")
@@ -251,9 +248,18 @@ def song_create_demo(toolkit: AgentToolkit, facade: DAWFacade):
 
     toolkit.execute("transport.play", **{"project_id": "test project"})
 
-    time.sleep(200)
+    # the engine renders on its own audio thread; the loop only has to stay
+    # free while it plays, so the report runs alongside the playback wait
+    report = asyncio.create_task(report_chain_results(results))
+    await asyncio.sleep(200)
 
     toolkit.execute("transport.stop", **{"project_id": "test project"})
+    await report
+
+    return results
+
+
+async def report_chain_results(results):
     for i, result in enumerate(results, 1):
         status_icon = "✓" if result.status == "success" else "✗"
         print(f"  {status_icon} Step {i}: {result.message}")
@@ -267,10 +273,8 @@ def song_create_demo(toolkit: AgentToolkit, facade: DAWFacade):
     else:
         print("\n✗ Execution chain was interrupted")
 
-    return results
-
 
 if __name__ == "__main__":
     facade, manager = initialize_daw_system()
     toolkit = create_agent_toolkit(facade)
-    song_create_demo(toolkit, facade)
+    asyncio.run(song_create_demo(toolkit, facade))
@@ -2,7 +2,7 @@ import numpy as np
 from .sync_controller import MockSyncController
 from ...interfaces.system.iengine import IEngine
 from ...interfaces.system.itimeline import ITimeline
-from ...models import TransportStatus
+from ...models import TransportSnapshot, TransportStatus
 
 
 class Engine(IEngine):
@@ -72,3 +72,11 @@ class Engine(IEngine):
     @property
     def transport_status(self) -> TransportStatus:
         return self._status
+
+    def transport_snapshot(self) -> TransportSnapshot:
+        status = self._status
+        return TransportSnapshot(current_beat=self._current_beat,
+                                 is_playing=status == TransportStatus.PLAYING,
+                                 sample_rate=self._sample_rate,
+                                 block_size=self._block_size,
+                                 status=status)
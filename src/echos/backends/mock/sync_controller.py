@@ -5,35 +5,20 @@ from ...interfaces.system.ievent_bus import IEventBus
 
 class MockSyncController(ISyncController):
 
-    def _on_mount(self, event_bus: IEventBus):
-        self._event_bus = event_bus
-
-        event_bus.subscribe(event_model.ProjectLoaded, self.on_project_loaded)
-        event_bus.subscribe(event_model.ProjectClosed, self.on_project_closed)
+    _HANDLER_SPECS = ISyncController._HANDLER_SPECS + (
+        (event_model.TempoChanged, "on_tempo_changed"),
+        (event_model.TimeSignatureChanged, "on_time_signature_changed"),
+    )
 
-        event_bus.subscribe(event_model.NodeAdded, self.on_node_added)
-        event_bus.subscribe(event_model.NodeRemoved, self.on_node_removed)
-        event_bus.subscribe(event_model.ConnectionAdded,
-                            self.on_connection_added)
-        event_bus.subscribe(event_model.ConnectionRemoved,
-                            self.on_connection_removed)
+    def __init__(self):
+        super().__init__()
+        self._handlers = self._event_handlers()
 
-        event_bus.subscribe(event_model.InsertAdded, self.on_insert_added)
-        event_bus.subscribe(event_model.InsertRemoved, self.on_insert_removed)
-        event_bus.subscribe(event_model.PluginEnabledChanged,
-                            self.on_plugin_enabled_changed)
-        event_bus.subscribe(event_model.ParameterChanged,
-                            self.on_parameter_changed)
-
-        event_bus.subscribe(event_model.TempoChanged, self.on_tempo_changed)
-        event_bus.subscribe(event_model.TimeSignatureChanged,
-                            self.on_time_signature_changed)
-
-        event_bus.subscribe(event_model.ClipAdded, self.on_clip_added)
-        event_bus.subscribe(event_model.ClipRemoved, self.on_clip_removed)
+    def _on_mount(self, event_bus: IEventBus):
+        self._event_bus = event_bus
 
-        event_bus.subscribe(event_model.NoteAdded, self.on_notes_added)
-        event_bus.subscribe(event_model.NoteRemoved, self.on_notes_removed)
+        for event_type, handler in self._handlers.items():
+            event_bus.subscribe(event_type, handler)
 
         print(
             "MockSyncController: All ISyncController methods have been registered as event handlers."
@@ -41,44 +26,12 @@ class MockSyncController(ISyncController):
 
     def _on_unmount(self):
         event_bus = self._event_bus
-        event_bus.unsubscribe(event_model.ProjectLoaded,
-                              self.on_project_loaded)
-        event_bus.unsubscribe(event_model.ProjectClosed,
-                              self.on_project_closed)
-
-        # IGraphSync Events
-        event_bus.unsubscribe(event_model.NodeAdded, self.on_node_added)
-        event_bus.unsubscribe(event_model.NodeRemoved, self.on_node_removed)
-        event_bus.unsubscribe(event_model.ConnectionAdded,
-                              self.on_connection_added)
-        event_bus.unsubscribe(event_model.ConnectionRemoved,
-                              self.on_connection_removed)
-
-        # IMixerSync Events
-        event_bus.unsubscribe(event_model.InsertAdded, self.on_insert_added)
-        event_bus.unsubscribe(event_model.InsertRemoved,
-                              self.on_insert_removed)
-        event_bus.unsubscribe(event_model.PluginEnabledChanged,
-                              self.on_plugin_enabled_changed)
-        event_bus.unsubscribe(event_model.ParameterChanged,
-                              self.on_parameter_changed)
-
-        # ITransportSync Events
-        event_bus.unsubscribe(event_model.TempoChanged, self.on_tempo_changed)
-        event_bus.unsubscribe(event_model.TimeSignatureChanged,
-                              self.on_time_signature_changed)
-
-        # ITrackSync Events
-        event_bus.unsubscribe(event_model.ClipAdded, self.on_clip_added)
-        event_bus.unsubscribe(event_model.ClipRemoved, self.on_clip_removed)
-
-        # IClipSync Events
-        event_bus.unsubscribe(event_model.NoteAdded, self.on_notes_added)
-        event_bus.unsubscribe(event_model.NoteRemoved, self.on_notes_removed)
+        for event_type, handler in self._handlers.items():
+            event_bus.unsubscribe(event_type, handler)
 
         self._event_bus = None
         print(
-            "DawDreamerSyncController: All ISyncController methods have been registered as event handlers."
+            "MockSyncController: All ISyncController event handlers have been unregistered."
         )
 
     def on_project_loaded(self, event: event_model.ProjectLoaded):
@@ -108,14 +61,27 @@ class MockSyncController(ISyncController):
     def on_insert_moved(self, event: event_model.InsertMoved):
         print(f"Mock Sync: on_insert_moved called with event: {event}")
 
+    def on_insert_chain_reordered(self,
+                                  event: event_model.InsertChainReordered):
+        print(
+            f"Mock Sync: on_insert_chain_reordered called with event: {event}")
+
     def on_plugin_enabled_changed(self,
                                   event: event_model.PluginEnabledChanged):
         print(
             f"Mock Sync: on_plugin_enabled_changed called with event: {event}")
 
+    def on_plugin_latency_changed(self,
+                                  event: event_model.PluginLatencyChanged):
+        print(
+            f"Mock Sync: on_plugin_latency_changed called with event: {event}")
+
     def on_parameter_changed(self, event: event_model.ParameterChanged):
         print(f"Mock Sync: on_parameter_changed called with event: {event}")
 
+    def on_parameters_changed(self, event: event_model.ParametersChanged):
+        print(f"Mock Sync: on_parameters_changed called with event: {event}")
+
     def on_tempo_changed(self, event: event_model.TempoChanged):
         print(f"Mock Sync: on_tempo_changed called with event: {event}")
 
@@ -1,7 +1,12 @@
+import ctypes
 import numpy as np
+import os
+import sys
 import threading
 import time
-from typing import Optional, List
+import traceback
+from collections import deque
+from typing import Dict, Optional, List
 import sounddevice as sd
 from .sync_controller import PedalboardSyncController
 from .messages import BaseMessage, NonRealTimeMessage, RealTimeMessage, GraphMessage
@@ -12,11 +17,17 @@ from .plugin_ins_manager import PedalboardPluginInstanceManager
 from .context import AudioEngineContext
 from ..common.message_queue import RealTimeMessageQueue
 from ...interfaces.system import IEngine, IEngineTimeline
-from ...models import TransportStatus, TransportContext
+from ...models import TransportStatus, TransportContext, TransportSnapshot
+
+
+_MCL_CURRENT = 1
 
 
 class PedalboardEngine(IEngine):
 
+    _device_list = None
+    _RT_PRIORITY = 80
+
     def __init__(
         self,
         sample_rate: int = 48000,
@@ -36,8 +47,12 @@ class PedalboardEngine(IEngine):
                                                    self._plugin_ins_manager)
 
         self._rt_message_queue = RealTimeMessageQueue()
-        self._nrt_message_queue = RealTimeMessageQueue()
+        # non-real-time edits pile up while playing and only drain once
+        # the transport stops, so they get the deeper ring
+        self._nrt_message_queue = RealTimeMessageQueue(capacity=65536)
         self._nrt_queue_lock = threading.Lock()
+        # message type -> queue, filled on first post of each type
+        self._queues_by_type: Dict[type, RealTimeMessageQueue] = {}
 
         self._sync_controller = PedalboardSyncController(self)
         self._realtime_timeline = RealTimeTimeline()
@@ -46,6 +61,16 @@ class PedalboardEngine(IEngine):
         self._current_beat = 0.0
         self._is_running = False
 
+        # reused every block; the tempo only changes at segment boundaries
+        self._transport_context = TransportContext(current_beat=0.0,
+                                                   sample_rate=sample_rate,
+                                                   block_size=block_size,
+                                                   tempo=120.0)
+        self._tempo_version = -1
+        self._tempo_start_beat = 0.0
+        self._tempo_end_beat = -1.0
+        self._beats_per_block = 0.0
+
         self._audio_stream: Optional[sd.OutputStream] = None
         self._stream_lock = threading.Lock()
 
@@ -55,6 +80,16 @@ class PedalboardEngine(IEngine):
         self._dropped_frames = 0
         self._peak_cpu_load = 0.0
 
+        # the audio callback must not block on stdout, so it only appends
+        # (fmt, args, exc) here and a background thread does the printing
+        self._log_queue: deque = deque(maxlen=1024)
+        self._log_thread: Optional[threading.Thread] = None
+        self._log_running = False
+
+        self._saved_switch_interval: Optional[float] = None
+        self._memory_locked = False
+        self._rt_thread_configured = False
+
         print(f"\n{'='*70}")
         print("PedalboardEngine Initialized (Real-time Mode)")
         print(f"{'='*70}")
@@ -93,6 +128,14 @@ class PedalboardEngine(IEngine):
     def transport_status(self) -> TransportStatus:
         return self._status
 
+    def transport_snapshot(self) -> TransportSnapshot:
+        status = self._status
+        return TransportSnapshot(current_beat=self._current_beat,
+                                 is_playing=status == TransportStatus.PLAYING,
+                                 sample_rate=self._sample_rate,
+                                 block_size=self._block_size,
+                                 status=status)
+
     @property
     def cpu_load(self) -> float:
         with self._stats_lock:
@@ -100,12 +143,20 @@ class PedalboardEngine(IEngine):
 
     def post_command(self, msg: BaseMessage):
 
-        if isinstance(msg, RealTimeMessage):
-            self._rt_message_queue.push(msg)
-        elif isinstance(msg, NonRealTimeMessage):
-            self._nrt_message_queue.push(msg)
-        else:
-            print(f"Warning: Unknown message type received: {type(msg)}")
+        msg_type = type(msg)
+        queue = self._queues_by_type.get(msg_type)
+        if queue is None:
+            if issubclass(msg_type, RealTimeMessage):
+                queue = self._rt_message_queue
+            elif issubclass(msg_type, NonRealTimeMessage):
+                queue = self._nrt_message_queue
+            else:
+                print(f"Warning: Unknown message type received: {msg_type}")
+                return
+            self._queues_by_type[msg_type] = queue
+        queue.push(msg)
+        if queue is self._rt_message_queue and self._audio_stream is None:
+            self._drain_rt_while_idle()
 
     def play(self):
         self.refresh()
@@ -113,6 +164,8 @@ class PedalboardEngine(IEngine):
             print("PedalboardEngine: Already playing")
             return
         print("\nPedalboardEngine: Starting playback...")
+        self._start_log_thread()
+        self._lock_memory()
         self._start_audio_stream()
         self._status = TransportStatus.PLAYING
         print("✓ Playback started\n")
@@ -132,6 +185,8 @@ class PedalboardEngine(IEngine):
 
         print("\nPedalboardEngine: Stopping playback...")
         self._stop_audio_stream()
+        self._stop_log_thread()
+        self._unlock_memory()
         self._status = TransportStatus.STOPPED
         self._current_beat = 0.0
         print("✓ Playback stopped\n")
@@ -149,14 +204,17 @@ class PedalboardEngine(IEngine):
                 return
 
             try:
+                self._rt_thread_configured = False
                 self._audio_stream = sd.OutputStream(
                     samplerate=self._sample_rate,
                     blocksize=self._block_size,
                     channels=self._output_channels,
+                    dtype='float32',
                     device=self._device_id,
                     callback=self._audio_callback,
                     finished_callback=self._stream_finished_callback,
                 )
+                self._shorten_switch_interval()
                 self._audio_stream.start()
                 print(
                     f"✓ Audio stream started (device: {self._audio_stream.device})"
@@ -165,6 +223,7 @@ class PedalboardEngine(IEngine):
             except Exception as e:
                 print(f"✗ Failed to start audio stream: {e}")
                 self._audio_stream = None
+                self._restore_switch_interval()
                 raise
 
     def _stop_audio_stream(self):
@@ -182,33 +241,116 @@ class PedalboardEngine(IEngine):
             except Exception as e:
                 print(f"Warning: Error stopping audio stream: {e}")
 
+            finally:
+                self._restore_switch_interval()
+
+    def _shorten_switch_interval(self):
+        # let PortAudio's callback thread take the GIL back from busy Python
+        # threads well within one block (the default interval is 5 ms)
+        if self._saved_switch_interval is not None:
+            return
+        self._saved_switch_interval = sys.getswitchinterval()
+        block_duration = self._block_size / self._sample_rate
+        sys.setswitchinterval(
+            min(self._saved_switch_interval, block_duration / 10))
+
+    def _restore_switch_interval(self):
+        if self._saved_switch_interval is None:
+            return
+        sys.setswitchinterval(self._saved_switch_interval)
+        self._saved_switch_interval = None
+
+    def _start_log_thread(self):
+        if self._log_thread is not None:
+            return
+        self._log_running = True
+        self._log_thread = threading.Thread(target=self._log_worker,
+                                            name="PedalboardEngineLog",
+                                            daemon=True)
+        self._log_thread.start()
+
+    def _stop_log_thread(self):
+        if self._log_thread is None:
+            return
+        self._log_running = False
+        self._log_thread.join()
+        self._log_thread = None
+
+    def _log_worker(self):
+        while self._log_running:
+            self._flush_log()
+            time.sleep(0.05)
+        self._flush_log()
+
+    def _flush_log(self):
+        while self._log_queue:
+            fmt, args, exc = self._log_queue.popleft()
+            print(fmt.format(*args))
+            if exc is not None:
+                traceback.print_exception(exc)
+
+    def _lock_memory(self):
+        # render buffers are allocated up front, so locking what is mapped
+        # now keeps the audio callback from taking page faults
+        if self._memory_locked or not sys.platform.startswith('linux'):
+            return
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            if libc.mlockall(_MCL_CURRENT) != 0:
+                print(f"Warning: Could not lock engine memory: "
+                      f"{os.strerror(ctypes.get_errno())}")
+                return
+            self._memory_locked = True
+        except (OSError, AttributeError) as e:
+            print(f"Warning: Could not lock engine memory: {e}")
+
+    def _unlock_memory(self):
+        if not self._memory_locked:
+            return
+        ctypes.CDLL(None).munlockall()
+        self._memory_locked = False
+
+    def _configure_rt_thread(self):
+        # runs once on PortAudio's callback thread, which pid 0 refers to
+        self._rt_thread_configured = True
+        if not hasattr(os, 'sched_setscheduler'):
+            return
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO,
+                                  os.sched_param(self._RT_PRIORITY))
+        except OSError as e:
+            self._rt_log(
+                "Warning: Could not set real-time audio thread priority: {}",
+                e)
+
+    def _rt_log(self, fmt: str, *args, exc: Optional[BaseException] = None):
+        self._log_queue.append((fmt, args, exc))
+
     def _audio_callback(self, outdata: np.ndarray, frames: int, time_info,
                         status: sd.CallbackFlags):
 
         start_time = time.perf_counter()
 
+        if not self._rt_thread_configured:
+            self._configure_rt_thread()
+
         try:
             if status:
                 if status.output_underflow:
                     with self._stats_lock:
                         self._dropped_frames += 1
-                    print("Warning: Audio output underflow!")
+                    self._rt_log("Warning: Audio output underflow!")
 
             self._process_rt_messages()
 
             if self._status == TransportStatus.PLAYING:
-                audio_block = self._process_audio_block()
+                outdata[:] = self._process_audio_block().T
             else:
-                audio_block = np.zeros((self._output_channels, frames),
-                                       dtype=np.float32)
-
-            outdata[:] = audio_block.T
+                outdata.fill(0)
 
         except Exception as e:
-            print(f"✗ Error in audio callback: {e}")
             outdata.fill(0)
-            import traceback
-            traceback.print_exc()
+            self._rt_log("✗ Error in audio callback: {}", e, exc=e)
 
         process_time = time.perf_counter() - start_time
         self._update_performance_stats(process_time, frames)
@@ -217,22 +359,29 @@ class PedalboardEngine(IEngine):
         print("Audio stream finished")
 
     def _process_audio_block(self) -> np.ndarray:
-        current_tempo = self._realtime_timeline.get_tempo_at_beat(
-            self._current_beat)
-        current_tempo = current_tempo.bpm
+        beat = self._current_beat
+        if (self._tempo_version != self._realtime_timeline.tempo_map_version
+                or not self._tempo_start_beat <= beat < self._tempo_end_beat):
+            self._update_tempo_segment(beat)
 
-        context = TransportContext(current_beat=self._current_beat,
-                                   sample_rate=self._sample_rate,
-                                   block_size=self._block_size,
-                                   tempo=current_tempo)
+        context = self._transport_context
+        context.current_beat = beat
 
         output_buffer = self._render_graph.process_block(context)
 
-        beats_per_sample = (current_tempo / 60.0) / self._sample_rate
-        self._current_beat += beats_per_sample * self._block_size
+        self._current_beat = beat + self._beats_per_block
 
         return output_buffer
 
+    def _update_tempo_segment(self, beat: float):
+        tempo, end_beat = self._realtime_timeline.get_tempo_segment(beat)
+        self._tempo_version = self._realtime_timeline.tempo_map_version
+        self._tempo_start_beat = tempo.beat
+        self._tempo_end_beat = end_beat
+        self._transport_context.tempo = tempo.bpm
+        self._beats_per_block = (tempo.bpm / 60.0) * (self._block_size /
+                                                      self._sample_rate)
+
     def _update_performance_stats(self, process_time: float, frames: int):
 
         with self._stats_lock:
@@ -245,8 +394,18 @@ class PedalboardEngine(IEngine):
                 self._peak_cpu_load = self._cpu_load
 
     def refresh(self):
+        self._drain_rt_while_idle()
         self._process_nrt_messages()
 
+    def _drain_rt_while_idle(self):
+        # without an audio stream nothing consumes the real-time queue, so
+        # its messages are applied here rather than left to fill the ring.
+        # The stream lock keeps a starting stream from draining alongside.
+        with self._stream_lock:
+            if (self._audio_stream is None
+                    and self._status != TransportStatus.PLAYING):
+                self._process_rt_messages()
+
     def _process_rt_messages(self):
         self._rt_message_queue.drain(lambda msg: process_message(
             msg,
@@ -312,6 +471,9 @@ class PedalboardEngine(IEngine):
         print(f"Dropped Frames:  {dropped_frames}")
         print(f"Stream Active:   {self._audio_stream is not None}")
         print(f"Pending NRT Msgs:{len(self._nrt_message_queue)}")
+        print(f"Dropped Msgs:    "
+              f"{self._rt_message_queue.get_dropped_count()} RT, "
+              f"{self._nrt_message_queue.get_dropped_count()} NRT")
         print(f"{'='*70}\n")
 
     def get_performance_stats(self) -> dict:
@@ -331,6 +493,9 @@ class PedalboardEngine(IEngine):
             'dropped_frames': dropped,
             'is_streaming': self._audio_stream is not None,
             'pending_nrt_messages': pending_nrt,
+            'dropped_rt_messages': self._rt_message_queue.get_dropped_count(),
+            'dropped_nrt_messages':
+            self._nrt_message_queue.get_dropped_count(),
             'render_graph_stats': self._render_graph.get_stats(),
         }
 
@@ -341,11 +506,23 @@ class PedalboardEngine(IEngine):
             self._peak_cpu_load = 0.0
         print("Performance statistics reset")
 
-    @staticmethod
-    def list_audio_devices():
+    @classmethod
+    def query_devices(cls, refresh: bool = False):
+        # PortAudio enumeration is slow and the device list only changes
+        # on hotplug, so keep it until a refresh is requested
+        if refresh or cls._device_list is None:
+            cls._device_list = sd.query_devices()
+        return cls._device_list
+
+    @classmethod
+    def invalidate_device_cache(cls):
+        cls._device_list = None
+
+    @classmethod
+    def list_audio_devices(cls, refresh: bool = False):
         print("\nAvailable Audio Devices:")
         print(f"{'='*70}")
-        devices = sd.query_devices()
+        devices = cls.query_devices(refresh)
         for idx, device in enumerate(devices):
             if device['max_output_channels'] > 0:
                 default = " (DEFAULT)" if idx == sd.default.device[1] else ""
@@ -384,8 +561,9 @@ class PedalboardEngine(IEngine):
 
             for block_idx in range(total_blocks):
                 self._process_rt_messages()
+                # the render graph reuses its output buffer between blocks
                 audio_block = self._process_audio_block()
-                output_audio.append(audio_block)
+                output_audio.append(audio_block.copy())
                 if block_idx % 100 == 0:
                     progress = (block_idx / total_blocks) * 100
                     print(f"  Progress: {progress:.1f}%", end='\r')
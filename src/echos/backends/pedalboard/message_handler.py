@@ -1,9 +1,11 @@
-from typing import Dict, Callable, Any
+from typing import Dict, Callable, Any, Optional, Tuple
 
 from .messages import (AnyMessage, AddNode, RemoveNode, AddConnection,
-                       RemoveConnection, SetParameter, AddPlugin, RemovePlugin,
+                       RemoveConnection, SetParameter, SetParameters,
+                       AddPlugin, RemovePlugin,
                        SetBypass, ClearProject, UpdateTrackClips, AddTrackClip,
-                       MovePlugin, SetPluginBypass, AddNotesToClip,
+                       MovePlugin, ReorderPlugins, SetPluginLatency,
+                       SetPluginBypass, AddNotesToClip,
                        RemoveNotesFromClip, SetTimelineState, GraphMessage,
                        TimelineMessage)
 
@@ -53,9 +55,27 @@ def _handle_move_plugin(msg: MovePlugin, graph: PedalboardRenderGraph):
                               msg.new_index)
 
 
+def _handle_reorder_plugins(msg: ReorderPlugins,
+                            graph: PedalboardRenderGraph):
+    graph.reorder_plugins_in_node(msg.owner_node_id, msg.plugin_instance_ids)
+
+
+def _handle_set_plugin_latency(msg: SetPluginLatency,
+                               graph: PedalboardRenderGraph):
+    graph.set_plugin_latency(msg.plugin_instance_id, msg.latency_samples)
+
+
 def _handle_set_parameter(msg: SetParameter, graph: PedalboardRenderGraph):
 
-    graph.set_parameter(msg.node_id, msg.parameter_path, msg.value)
+    graph.set_parameter(msg.owner_node_id, msg.parameter_path, msg.value)
+
+
+def _handle_set_parameters(msg: SetParameters, graph: PedalboardRenderGraph):
+
+    for node_id, parameter_path, value in zip(msg.owner_node_ids,
+                                              msg.parameter_paths,
+                                              msg.values):
+        graph.set_parameter(node_id, parameter_path, value)
 
 
 def _handle_update_track_clips(msg: UpdateTrackClips,
@@ -91,9 +111,12 @@ _MESSAGE_HANDLERS: Dict[Any, Callable] = {
     AddPlugin: _handle_add_plugin,
     RemovePlugin: _handle_remove_plugin,
     MovePlugin: _handle_move_plugin,
+    ReorderPlugins: _handle_reorder_plugins,
+    SetPluginLatency: _handle_set_plugin_latency,
 
     # 参数设置（新消息类型）
     SetParameter: _handle_set_parameter,
+    SetParameters: _handle_set_parameters,
 
     # Clip管理
     UpdateTrackClips: _handle_update_track_clips,
@@ -106,16 +129,36 @@ _MESSAGE_HANDLERS: Dict[Any, Callable] = {
 }
 
 
+# message type -> (handler, context attribute the handler works on), resolved
+# on first use so each message costs one dict probe instead of isinstance
+# checks against the message hierarchy
+_ROUTES: Dict[type, Tuple[Callable, Optional[str]]] = {}
+
+
+def _resolve_route(message_type: type) -> Optional[Tuple[Callable,
+                                                          Optional[str]]]:
+    handler = _MESSAGE_HANDLERS.get(message_type)
+    if handler is None:
+        return None
+    if issubclass(message_type, GraphMessage):
+        target = "graph"
+    elif issubclass(message_type, TimelineMessage):
+        target = "timeline"
+    else:
+        target = None
+    route = _ROUTES[message_type] = (handler, target)
+    return route
+
+
 def process_message(msg: AnyMessage, context: AudioEngineContext):
 
-    handler = _MESSAGE_HANDLERS.get(type(msg))
+    route = _ROUTES.get(type(msg)) or _resolve_route(type(msg))
 
-    if handler:
+    if route:
+        handler, target = route
         try:
-            if isinstance(msg, GraphMessage):
-                handler(msg, context.graph)
-            elif isinstance(msg, TimelineMessage):
-                handler(msg, context.timeline)
+            if target is not None:
+                handler(msg, getattr(context, target))
         except Exception as e:
             print(
                 f"[Audio Thread Handler] CRITICAL: Error handling {type(msg).__name__}: {e}"
@@ -130,12 +173,14 @@ def process_message(msg: AnyMessage, context: AudioEngineContext):
 
 def register_custom_handler(message_type: type, handler: Callable):
     _MESSAGE_HANDLERS[message_type] = handler
+    _ROUTES.pop(message_type, None)
     print(f"[Handler] Registered custom handler for {message_type.__name__}")
 
 
 def unregister_handler(message_type: type):
     if message_type in _MESSAGE_HANDLERS:
         del _MESSAGE_HANDLERS[message_type]
+        _ROUTES.pop(message_type, None)
         print(f"[Handler] Unregistered handler for {message_type.__name__}")
 
 
@@ -90,6 +90,20 @@ class MovePlugin(NonRealTimeMessage, GraphMessage):
     new_index: int
 
 
+@dataclass(frozen=True)
+class ReorderPlugins(NonRealTimeMessage, GraphMessage):
+
+    owner_node_id: str
+    plugin_instance_ids: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class SetPluginLatency(NonRealTimeMessage, GraphMessage):
+
+    plugin_instance_id: str
+    latency_samples: int
+
+
 @dataclass(frozen=True)
 class UpdateTrackClips(NonRealTimeMessage, GraphMessage):
 
@@ -135,6 +149,14 @@ class SetParameter(RealTimeMessage, GraphMessage):
     value: Any
 
 
+@dataclass(frozen=True)
+class SetParameters(RealTimeMessage, GraphMessage):
+
+    owner_node_ids: Tuple[str, ...]
+    parameter_paths: Tuple[str, ...]
+    values: Tuple[Any, ...]
+
+
 @dataclass(frozen=True)
 class SetBypass(RealTimeMessage, GraphMessage):
 
@@ -155,6 +177,7 @@ class UpdatePluginRegistry(NonRealTimeMessage):
 
 AnyMessage = Union[ClearProject, AddNode, RemoveNode, AddConnection,
                    RemoveConnection, AddPlugin, RemovePlugin, MovePlugin,
-                   SetPluginBypass, SetParameter, SetBypass, UpdateTrackClips,
+                   ReorderPlugins, SetPluginLatency, SetPluginBypass, SetParameter, SetParameters, SetBypass,
+                   UpdateTrackClips,
                    AddTrackClip, AddNotesToClip, RemoveNotesFromClip,
                    SetTimelineState]
@@ -1,9 +1,8 @@
 import numpy as np
 import pedalboard as pb
 from abc import ABC, abstractmethod
-from typing import List, Dict, Tuple
+from typing import List, Dict, Sequence, Tuple
 
-from mido import Message
 from ...models import TransportContext, AnyClip, MIDIClip, Note
 
 
@@ -17,14 +16,21 @@ class IAudioNode(ABC):
         self.block_size = block_size
 
     @abstractmethod
-    def process(self, context: TransportContext,
-                inputs: Dict[str, np.ndarray]) -> np.ndarray:
+    def process(self, context: TransportContext) -> np.ndarray:
+        # must return a C-contiguous float32 (2, block_size) block, reusing
+        # a node-owned buffer where it can. The render graph mixes it with
+        # casting='no', so a wrong dtype fails instead of converting, and
+        # checks dtype, shape and layout while assertions are enabled.
         pass
 
 
 NOTE_ON = 0
 NOTE_OFF = 1
 
+# MIDI status bytes, channel 1
+_STATUS_NOTE_ON = 0x90
+_STATUS_NOTE_OFF = 0x80
+
 
 class BaseEffectNode(IAudioNode):
 
@@ -38,34 +44,59 @@ class BaseEffectNode(IAudioNode):
         self.pedalboard = pb.Pedalboard([])
         self.plugin_instance_map: Dict[str, pb.Plugin] = {}
         self.clips: List[AnyClip] = []
-        self.volume: float = 1.0
-        self.pan: float = 0.0
+        self._volume: float = 1.0
+        self._pan: float = 0.0
+        # per-channel volume * pan gain, applied to a block in one multiply
+        self._channel_gains = np.ones((2, 1), dtype=np.float32)
         self.muted: bool = False
         self._output_channels = output_channels
         self.latency_samples = 0
 
-    def process(self, context: TransportContext,
-                inputs: Dict[str, np.ndarray]) -> np.ndarray:
+        # reused every block so the audio thread does not allocate;
+        # the render graph mixes upstream audio into input_buffer
+        self.input_buffer = np.zeros((2, block_size), dtype=np.float32)
+        self.output_buffer = np.zeros((2, block_size), dtype=np.float32)
+        # False when the last processed block is known to be silent
+        self.has_output = True
 
-        mixed_input = np.zeros((2, self.block_size), dtype=np.float32)
-        for input_audio in inputs.values():
-            mixed_input += input_audio
+    def process(self, context: TransportContext) -> np.ndarray:
 
         if self.muted:
-            mixed_input.fill(0.0)
-            return mixed_input
+            self.has_output = False
+            self.output_buffer.fill(0.0)
+            return self.output_buffer
 
-        processed_audio = self.pedalboard(mixed_input, self.sample_rate)
+        self.has_output = True
+        processed_audio = self.pedalboard(self.input_buffer, self.sample_rate)
+        np.multiply(processed_audio, self._channel_gains, out=processed_audio)
+        return processed_audio
 
-        processed_audio *= self.volume
-        if self.pan != 0.0:
-            angle = (self.pan + 1.0) * np.pi / 4.0
-            left_gain = np.cos(angle)
-            right_gain = np.sin(angle)
-            processed_audio[0] *= left_gain
-            processed_audio[1] *= right_gain
+    @property
+    def volume(self) -> float:
+        return self._volume
 
-        return processed_audio
+    @volume.setter
+    def volume(self, value: float):
+        self._volume = value
+        self._update_channel_gains()
+
+    @property
+    def pan(self) -> float:
+        return self._pan
+
+    @pan.setter
+    def pan(self, value: float):
+        self._pan = value
+        self._update_channel_gains()
+
+    def _update_channel_gains(self):
+        if self._pan != 0.0:
+            angle = (self._pan + 1.0) * np.pi / 4.0
+            left_gain, right_gain = np.cos(angle), np.sin(angle)
+        else:
+            left_gain = right_gain = 1.0
+        self._channel_gains[0, 0] = self._volume * left_gain
+        self._channel_gains[1, 0] = self._volume * right_gain
 
     def update_clips(self, clips: List[AnyClip]):
         self.clips = clips
@@ -126,6 +157,20 @@ class BaseEffectNode(IAudioNode):
                 f"[Node {self.node_id[:6]}] Moved plugin {instance_id[:6]} to index {new_index}."
             )
 
+    def reorder_plugins(self, instance_ids: Sequence[str]):
+        if set(instance_ids) != self.plugin_instance_map.keys():
+            print(f"[Node {self.node_id[:6]}] Warning: Reorder does not match "
+                  f"the node's plugins; ignored.")
+            return
+        self._set_effect_chain(
+            [self.plugin_instance_map[i] for i in instance_ids])
+        print(f"[Node {self.node_id[:6]}] Reordered {len(instance_ids)} "
+              f"plugins.")
+
+    def _set_effect_chain(self, plugins: List[pb.Plugin]):
+        for index, plugin_instance in enumerate(plugins):
+            self.pedalboard[index] = plugin_instance
+
     def set_plugin_parameter(self, instance_id: str, param_name: str,
                              value: any):
         plugin_instance = self.plugin_instance_map.get(instance_id)
@@ -155,7 +200,10 @@ class InstrumentTrackNode(BaseEffectNode):
         self.instrument = None
 
         self._active_notes: Dict[str, int] = {}
-        self._sorted_events: List[Tuple[float, int, Note]] = []
+        # (beat, NOTE_ON/NOTE_OFF, note, raw MIDI bytes), sorted by beat
+        self._sorted_events: List[Tuple[float, int, Note, bytes]] = []
+        # beat column of _sorted_events, searched to find each block's events
+        self._event_beats = np.empty(0, dtype=np.float64)
         self._event_idx = 0
         self._needs_resort = True
         self._last_beat = -1.0  # 用于检测播放指针的跳跃
@@ -171,11 +219,20 @@ class InstrumentTrackNode(BaseEffectNode):
                 note_start_beat = clip.start_beat + note.start_beat
                 note_end_beat = note_start_beat + note.duration_beats
 
-                self._sorted_events.append((note_start_beat, NOTE_ON, note))
+                # the wire bytes are built here, once per resort, so the
+                # audio callback only pairs them with a timestamp
+                self._sorted_events.append(
+                    (note_start_beat, NOTE_ON, note,
+                     bytes((_STATUS_NOTE_ON, note.pitch, note.velocity))))
 
-                self._sorted_events.append((note_end_beat, NOTE_OFF, note))
+                self._sorted_events.append(
+                    (note_end_beat, NOTE_OFF, note,
+                     bytes((_STATUS_NOTE_OFF, note.pitch, 0))))
 
         self._sorted_events.sort(key=lambda x: x[0])
+        self._event_beats = np.fromiter((e[0] for e in self._sorted_events),
+                                        dtype=np.float64,
+                                        count=len(self._sorted_events))
         self._event_idx = 0
         self._needs_resort = False
         print(
@@ -191,12 +248,13 @@ class InstrumentTrackNode(BaseEffectNode):
         super().add_clip(clip)
         self._needs_resort = True
 
-    def process(self, context: TransportContext,
-                inputs: Dict[str, np.ndarray]) -> np.ndarray:
+    def process(self, context: TransportContext) -> np.ndarray:
         assert self.instrument
 
         if self.muted or not self.instrument:
-            return np.zeros((2, self.block_size), dtype=np.float32)
+            self.has_output = False
+            self.output_buffer.fill(0.0)
+            return self.output_buffer
 
         if self._needs_resort:
             self._prepare_events()
@@ -206,7 +264,8 @@ class InstrumentTrackNode(BaseEffectNode):
 
         if abs(context.current_beat - self._last_beat) > beats_per_block * 2:
 
-            self._event_idx = 0
+            self._event_idx = int(
+                self._event_beats.searchsorted(context.current_beat))
             self._active_notes.clear()
 
         self._last_beat = context.current_beat
@@ -218,35 +277,27 @@ class InstrumentTrackNode(BaseEffectNode):
 
         midi_messages = []
 
-        while self._event_idx < len(self._sorted_events):
-            event_beat, event_type, note = self._sorted_events[self._event_idx]
-
-            if event_beat >= block_end_beat:
-                break
+        end_idx = int(self._event_beats.searchsorted(block_end_beat))
+        for event_beat, event_type, note, midi_bytes in self._sorted_events[
+                self._event_idx:end_idx]:
 
             if event_beat >= block_start_beat:
                 time_in_beats = event_beat - block_start_beat
                 time_in_seconds = max(0, time_in_beats / beats_per_second)
 
+                # pedalboard takes (bytes, seconds) tuples directly, which
+                # skips building and validating a mido.Message per event
                 if event_type == NOTE_ON:
                     if note.note_id not in self._active_notes:
-                        msg = Message('note_on',
-                                      note=note.pitch,
-                                      velocity=note.velocity,
-                                      time=time_in_seconds)
-                        midi_messages.append(msg)
+                        midi_messages.append((midi_bytes, time_in_seconds))
                         self._active_notes[note.note_id] = note.pitch
 
                 elif event_type == NOTE_OFF:
                     if note.note_id in self._active_notes:
-                        msg = Message('note_off',
-                                      note=note.pitch,
-                                      velocity=0,
-                                      time=time_in_seconds)
-                        midi_messages.append(msg)
+                        midi_messages.append((midi_bytes, time_in_seconds))
                         del self._active_notes[note.note_id]
 
-            self._event_idx += 1
+        self._event_idx = max(self._event_idx, end_idx)
 
         try:
             audio_after_instrument = self.instrument.process(
@@ -259,8 +310,11 @@ class InstrumentTrackNode(BaseEffectNode):
         except Exception as e:
             print(
                 f"[Node {self.node_id[:6]}] Error processing instrument: {e}")
-            return np.zeros((2, self.block_size), dtype=np.float32)
+            self.has_output = False
+            self.output_buffer.fill(0.0)
+            return self.output_buffer
 
+        self.has_output = True
         if len(self.pedalboard) > 0:
             try:
                 audio_after_instrument = self.pedalboard(
@@ -269,13 +323,8 @@ class InstrumentTrackNode(BaseEffectNode):
                 print(
                     f"[Node {self.node_id[:6]}] Error processing effects: {e}")
 
-        final_audio = audio_after_instrument * self.volume
-
-        if self.pan != 0.0:
-            angle = (self.pan + 1.0) * np.pi / 4.0
-            final_audio[0] *= np.cos(angle)
-            final_audio[1] *= np.sin(angle)
-
+        final_audio = audio_after_instrument
+        np.multiply(final_audio, self._channel_gains, out=final_audio)
         return final_audio
 
     def add_plugin(self, plugin_instance: pb.Plugin, instance_id: str,
@@ -292,6 +341,7 @@ class InstrumentTrackNode(BaseEffectNode):
                 print(
                     f"[Node {self.node_id[:6]}] Warning: Replacing existing instrument"
                 )
+                self._forget_instance(self.instrument)
 
             self.instrument = plugin_instance
             print(
@@ -312,6 +362,26 @@ class InstrumentTrackNode(BaseEffectNode):
                 f"[Node {self.node_id[:6]}] Added effect {plugin_instance.name} at index {index}"
             )
 
+        self.plugin_instance_map[instance_id] = plugin_instance
+
+    def _forget_instance(self, plugin_instance: pb.Plugin):
+        for instance_id, mapped in list(self.plugin_instance_map.items()):
+            if mapped is plugin_instance:
+                del self.plugin_instance_map[instance_id]
+
+    def move_plugin(self, instance_id: str, new_index: int):
+        # the instrument sits at index 0 of the insert chain but outside
+        # the pedalboard, so effect indices are shifted down by one
+        if self.instrument is not None:
+            if self.plugin_instance_map.get(instance_id) is self.instrument:
+                return
+            new_index = max(new_index - 1, 0)
+        super().move_plugin(instance_id, new_index)
+
+    def _set_effect_chain(self, plugins: List[pb.Plugin]):
+        super()._set_effect_chain(
+            [p for p in plugins if p is not self.instrument])
+
     def remove_plugin(self, instance_id: str):
 
         if instance_id not in self.plugin_instance_map:
@@ -346,6 +416,5 @@ class BusNode(BaseEffectNode):
 
 class AudioTrackNode(BaseEffectNode):
 
-    def process(self, context: TransportContext,
-                inputs: Dict[str, np.ndarray]) -> np.ndarray:
-        return super().process(context, inputs)
+    def process(self, context: TransportContext) -> np.ndarray:
+        return super().process(context)
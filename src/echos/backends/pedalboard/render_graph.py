@@ -1,5 +1,6 @@
 import numpy as np
-from typing import Any, Dict, List, Optional, Tuple
+from collections import deque
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 import pedalboard as pb
 from .nodes import BusNode, InstrumentTrackNode, AudioTrackNode, IAudioNode, BaseEffectNode
@@ -7,19 +8,11 @@ from ...models import AnyClip, TransportContext
 from ...interfaces.system import IPluginInstanceManager
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AudioConnection:
     source_id: str
     dest_id: str
 
-    def __hash__(self):
-        return hash((self.source_id, self.dest_id))
-
-    def __eq__(self, other):
-        if not isinstance(other, AudioConnection):
-            return False
-        return self.source_id == other.source_id and self.dest_id == other.dest_id
-
 
 class PedalboardRenderGraph:
 
@@ -31,10 +24,19 @@ class PedalboardRenderGraph:
         self._plugin_instance_manager = plugin_instance_manager
 
         self._nodes: Dict[str, BaseEffectNode] = {}
-        self._connections: List[AudioConnection] = []
+        # insertion-ordered set: O(1) membership and removal
+        self._connections: Dict[AudioConnection, None] = {}
         self._processing_order: List[str] = []
+        self._process_plan: List[Tuple[BaseEffectNode, List[np.ndarray],
+                                       bool]] = []
+        self._mixed_input_buffers: List[np.ndarray] = []
+        self._master_output = np.zeros((2, block_size), dtype=np.float32)
+        self._render_fn = self._compile_render_fn()
 
         self._plugin_to_node_map: Dict[str, str] = {}
+        # latency each plugin reported through the domain model; plugins
+        # without an entry fall back to what the instance exposes
+        self._plugin_latencies: Dict[str, int] = {}
 
         self._stats = {
             'total_blocks_processed': 0,
@@ -43,6 +45,7 @@ class PedalboardRenderGraph:
             'nodes_removed': 0,
             'plugins_added': 0,
             'plugins_removed': 0,
+            'plugins_moved': 0,
         }
 
         print(
@@ -73,10 +76,11 @@ class PedalboardRenderGraph:
     def remove_node(self, node_id: str):
         if node_id not in self._nodes: return
 
-        self._connections = [
-            c for c in self._connections
+        self._connections = {
+            c: None
+            for c in self._connections
             if c.source_id != node_id and c.dest_id != node_id
-        ]
+        }
 
         node_to_remove = self._nodes[node_id]
         for instance_id in list(node_to_remove.plugin_instance_map.keys()):
@@ -106,7 +110,7 @@ class PedalboardRenderGraph:
                   f"{dest_id[:8]}... would create a cycle!")
             return
 
-        self._connections.append(new_conn)
+        self._connections[new_conn] = None
         self._update_processing_order()
 
         print(
@@ -118,7 +122,7 @@ class PedalboardRenderGraph:
         conn_to_remove = AudioConnection(source_id, dest_id)
 
         if conn_to_remove in self._connections:
-            self._connections.remove(conn_to_remove)
+            del self._connections[conn_to_remove]
             self._update_processing_order()
             print(
                 f"RenderGraph: ✓ Disconnected {source_id[:8]}... -> {dest_id[:8]}..."
@@ -156,9 +160,15 @@ class PedalboardRenderGraph:
 
         cache_instance_id, instance = result
 
-        node.add_plugin(plugin_instance=instance,
-                        instance_id=cache_instance_id,
-                        index=index)
+        try:
+            node.add_plugin(plugin_instance=instance,
+                            instance_id=cache_instance_id,
+                            index=index)
+        except Exception as e:
+            self._plugin_instance_manager.release_instance(cache_instance_id)
+            print(f"RenderGraph: Error - Failed to add plugin "
+                  f"'{cache_instance_id[:8]}...' to node '{node_id[:8]}...': {e}")
+            return
 
         self._plugin_to_node_map[cache_instance_id] = node_id
         self._update_node_latency(node)
@@ -181,6 +191,7 @@ class PedalboardRenderGraph:
         node.remove_plugin(plugin_instance_id)
         self._plugin_instance_manager.release_instance(plugin_instance_id)
         self._plugin_to_node_map.pop(plugin_instance_id, None)
+        self._plugin_latencies.pop(plugin_instance_id, None)
         self._update_node_latency(node)
         self._stats['plugins_removed'] += 1
         print(f"RenderGraph: ✓ Removed plugin '{plugin_instance_id[:8]}...' "
@@ -198,6 +209,26 @@ class PedalboardRenderGraph:
         print(f"RenderGraph: ✓ Moved plugin '{plugin_instance_id[:8]}...' "
               f"to index {new_index} in node '{node_id[:8]}...'")
 
+    def reorder_plugins_in_node(self, node_id: str,
+                                plugin_instance_ids: Sequence[str]):
+        node = self._nodes.get(node_id)
+        if not node:
+            print(f"RenderGraph: Warning - Node {node_id[:8]}... not found")
+            return
+        node.reorder_plugins(plugin_instance_ids)
+        self._update_node_latency(node)
+        self._stats['plugins_moved'] += 1
+        print(f"RenderGraph: ✓ Reordered {len(plugin_instance_ids)} plugins "
+              f"in node '{node_id[:8]}...'")
+
+    def set_plugin_latency(self, plugin_instance_id: str,
+                           latency_samples: int):
+        self._plugin_latencies[plugin_instance_id] = latency_samples
+        node = self._nodes.get(
+            self._plugin_to_node_map.get(plugin_instance_id))
+        if node:
+            self._update_node_latency(node)
+
     def set_parameter(self, node_id: str, parameter_path: str, value: Any):
         node = self._nodes.get(node_id)
         if not node:
@@ -276,34 +307,17 @@ class PedalboardRenderGraph:
         self._nodes.clear()
         self._connections.clear()
         self._processing_order.clear()
+        self._process_plan.clear()
+        self._mixed_input_buffers.clear()
+        self._render_fn = self._compile_render_fn()
         self._plugin_to_node_map.clear()
+        self._plugin_latencies.clear()
 
         print("RenderGraph: ✓ Cleared all nodes and connections")
 
     def process_block(self, context: TransportContext) -> np.ndarray:
 
-        master_output = np.zeros((2, self._block_size), dtype=np.float32)
-        processed_outputs: Dict[str, np.ndarray] = {}
-
-        for node_id in self._processing_order:
-
-            node = self._nodes.get(node_id)
-            if not node: continue
-
-            inputs: Dict[str, np.ndarray] = {}
-            for conn in self._connections:
-                if conn.dest_id == node_id and conn.source_id in processed_outputs:
-                    inputs[conn.source_id] = processed_outputs[conn.source_id]
-
-            output_audio = node.process(context, inputs)
-            processed_outputs[node_id] = output_audio
-
-        for node_id, final_output in processed_outputs.items():
-
-            is_output_node = not any(c.source_id == node_id
-                                     for c in self._connections)
-            if is_output_node:
-                master_output += final_output
+        master_output = self._render_fn(context)
 
         self._stats['total_blocks_processed'] += 1
         self._stats['total_samples_processed'] += self._block_size
@@ -508,30 +522,35 @@ class PedalboardRenderGraph:
 
     def _update_node_latency(self, node: BaseEffectNode):
 
+        latencies = self._plugin_latencies
         total_latency = sum(
-            getattr(p, 'latency_samples', 0) for p in node.pedalboard)
+            latencies.get(instance_id, getattr(p, 'latency_samples', 0))
+            for instance_id, p in node.plugin_instance_map.items())
         node.latency_samples = total_latency
 
     def _update_processing_order(self):
         in_degree = {node_id: 0 for node_id in self._nodes}
+        successors: Dict[str, List[str]] = {
+            node_id: []
+            for node_id in self._nodes
+        }
         for conn in self._connections:
-            if conn.dest_id in in_degree:
+            if conn.dest_id in in_degree and conn.source_id in successors:
                 in_degree[conn.dest_id] += 1
+                successors[conn.source_id].append(conn.dest_id)
 
-        queue = [
-            node_id for node_id, degree in in_degree.items() if degree == 0
-        ]
+        queue = deque(node_id for node_id, degree in in_degree.items()
+                      if degree == 0)
         order = []
 
         while queue:
-            node_id = queue.pop(0)
+            node_id = queue.popleft()
             order.append(node_id)
 
-            for conn in self._connections:
-                if conn.source_id == node_id and conn.dest_id in in_degree:
-                    in_degree[conn.dest_id] -= 1
-                    if in_degree[conn.dest_id] == 0:
-                        queue.append(conn.dest_id)
+            for dest_id in successors[node_id]:
+                in_degree[dest_id] -= 1
+                if in_degree[dest_id] == 0:
+                    queue.append(dest_id)
 
         if len(order) != len(self._nodes):
             print(
@@ -540,3 +559,75 @@ class PedalboardRenderGraph:
             self._processing_order = list(self._nodes.keys())
         else:
             self._processing_order = order
+        self._rebuild_process_plan()
+
+    def _rebuild_process_plan(self):
+        dest_inputs: Dict[str, List[np.ndarray]] = {
+            node_id: []
+            for node_id in self._nodes
+        }
+        mixed_input_ids = set()
+        for conn in self._connections:
+            if conn.source_id in dest_inputs and conn.dest_id in self._nodes:
+                dest_inputs[conn.source_id].append(
+                    self._nodes[conn.dest_id].input_buffer)
+                mixed_input_ids.add(conn.dest_id)
+
+        # nodes without inputs are never written to again, so clear any
+        # audio left over from a removed connection once here
+        for node in self._nodes.values():
+            node.input_buffer.fill(0.0)
+
+        self._process_plan = [(self._nodes[node_id], dest_inputs[node_id],
+                               not dest_inputs[node_id])
+                              for node_id in self._processing_order
+                              if node_id in self._nodes]
+        self._mixed_input_buffers = [
+            self._nodes[node_id].input_buffer for node_id in mixed_input_ids
+        ]
+        self._render_fn = self._compile_render_fn()
+
+    def _compile_render_fn(self):
+        # the graph only changes between blocks, so unroll the process plan
+        # into straight-line code bound directly to the nodes and buffers.
+        # Each node output is pushed into downstream inputs and the master
+        # bus while it is still hot in cache; the first master write copies.
+        # Nodes that report a silent block are not mixed anywhere.
+        namespace = {
+            'np': np,
+            'master': self._master_output,
+            'shape': self._master_output.shape
+        }
+        lines = ['def render(ctx):']
+        for i, input_buffer in enumerate(self._mixed_input_buffers):
+            namespace[f'z{i}'] = input_buffer
+            lines.append(f'    z{i}.fill(0.0)')
+        lines.append('    empty = True')
+
+        for i, (node, dest_inputs, is_output) in enumerate(self._process_plan):
+            namespace[f'n{i}'] = node
+            lines.append(f'    out = n{i}.process(ctx)')
+            if __debug__:
+                lines.append("    assert (out.dtype == np.float32 and "
+                             "out.shape == shape and "
+                             "out.flags.c_contiguous), "
+                             "(out.dtype, out.shape)")
+            lines.append(f'    if n{i}.has_output:')
+            for j, dest_input in enumerate(dest_inputs):
+                namespace[f'd{i}_{j}'] = dest_input
+                lines.append(f'        np.add(d{i}_{j}, out, out=d{i}_{j}, '
+                             "casting='no')")
+            if is_output:
+                lines.append('        if empty:')
+                lines.append("            np.copyto(master, out, casting='no')")
+                lines.append('            empty = False')
+                lines.append('        else:')
+                lines.append("            np.add(master, out, out=master, "
+                             "casting='no')")
+
+        lines.append('    if empty:')
+        lines.append('        master.fill(0.0)')
+        lines.append('    return master')
+
+        exec(compile('\n'.join(lines), '<render_graph>', 'exec'), namespace)
+        return namespace['render']
@@ -2,8 +2,11 @@ from typing import TYPE_CHECKING
 from .messages import (AnyMessage, AddNode, RemoveNode, AddConnection,
                        RemoveConnection, AddPlugin, RemovePlugin,
                        SetPluginBypass, ClearProject, UpdateTrackClips,
-                       AddTrackClip, MovePlugin, SetTimelineState,
-                       AddNotesToClip, RemoveNotesFromClip, SetParameter)
+                       AddTrackClip, MovePlugin, ReorderPlugins,
+                       SetPluginLatency,
+                       SetTimelineState,
+                       AddNotesToClip, RemoveNotesFromClip, SetParameter,
+                       SetParameters)
 from ...interfaces.system.isync import ISyncController
 from ...models import event_model
 from .messages import BaseMessage
@@ -17,6 +20,7 @@ class PedalboardSyncController(ISyncController):
     def __init__(self, engine: 'PedalboardEngine'):
         super().__init__()
         self._engine = engine
+        self._handlers = self._event_handlers()
         print(
             "PedalboardSyncController: Created as an internal component of the Engine."
         )
@@ -33,32 +37,8 @@ class PedalboardSyncController(ISyncController):
     def _on_mount(self, event_bus):
         self._event_bus = event_bus
 
-        event_bus.subscribe(event_model.ProjectLoaded, self.on_project_loaded)
-        event_bus.subscribe(event_model.ProjectClosed, self.on_project_closed)
-
-        event_bus.subscribe(event_model.NodeAdded, self.on_node_added)
-        event_bus.subscribe(event_model.NodeRemoved, self.on_node_removed)
-        event_bus.subscribe(event_model.ConnectionAdded,
-                            self.on_connection_added)
-        event_bus.subscribe(event_model.ConnectionRemoved,
-                            self.on_connection_removed)
-
-        event_bus.subscribe(event_model.InsertAdded, self.on_insert_added)
-        event_bus.subscribe(event_model.InsertRemoved, self.on_insert_removed)
-        event_bus.subscribe(event_model.InsertMoved, self.on_insert_moved)
-        event_bus.subscribe(event_model.PluginEnabledChanged,
-                            self.on_plugin_enabled_changed)
-        event_bus.subscribe(event_model.ParameterChanged,
-                            self.on_parameter_changed)
-
-        event_bus.subscribe(event_model.TimelineStateChanged,
-                            self.on_timeline_state_changed)
-
-        event_bus.subscribe(event_model.ClipAdded, self.on_clip_added)
-        event_bus.subscribe(event_model.ClipRemoved, self.on_clip_removed)
-
-        event_bus.subscribe(event_model.NoteAdded, self.on_notes_added)
-        event_bus.subscribe(event_model.NoteRemoved, self.on_notes_removed)
+        for event_type, handler in self._handlers.items():
+            event_bus.subscribe(event_type, handler)
 
         print("PedalboardSyncController: Mounted - all events subscribed")
 
@@ -67,38 +47,16 @@ class PedalboardSyncController(ISyncController):
         if not self._event_bus:
             return
 
-        event_bus = self._event_bus
-        event_bus.unsubscribe(event_model.ProjectLoaded,
-                              self.on_project_loaded)
-        event_bus.unsubscribe(event_model.ProjectClosed,
-                              self.on_project_closed)
-        event_bus.unsubscribe(event_model.NodeAdded, self.on_node_added)
-        event_bus.unsubscribe(event_model.NodeRemoved, self.on_node_removed)
-        event_bus.unsubscribe(event_model.ConnectionAdded,
-                              self.on_connection_added)
-        event_bus.unsubscribe(event_model.ConnectionRemoved,
-                              self.on_connection_removed)
-        event_bus.unsubscribe(event_model.InsertAdded, self.on_insert_added)
-        event_bus.unsubscribe(event_model.InsertRemoved,
-                              self.on_insert_removed)
-        event_bus.unsubscribe(event_model.InsertMoved, self.on_insert_moved)
-        event_bus.unsubscribe(event_model.PluginEnabledChanged,
-                              self.on_plugin_enabled_changed)
-        event_bus.unsubscribe(event_model.ParameterChanged,
-                              self.on_parameter_changed)
-        event_bus.unsubscribe(event_model.TempoChanged, self.on_tempo_changed)
-        event_bus.unsubscribe(event_model.TimeSignatureChanged,
-                              self.on_time_signature_changed)
-        event_bus.unsubscribe(event_model.ClipAdded, self.on_clip_added)
-        event_bus.unsubscribe(event_model.ClipRemoved, self.on_clip_removed)
-        event_bus.unsubscribe(event_model.NoteAdded, self.on_notes_added)
-        event_bus.unsubscribe(event_model.NoteRemoved, self.on_notes_removed)
+        # the same table as _on_mount, so every subscription is undone
+        for event_type, handler in self._handlers.items():
+            self._event_bus.unsubscribe(event_type, handler)
 
         self._event_bus = None
         print("PedalboardSyncController: Unmounted")
 
     def on_project_loaded(self, event: event_model.ProjectLoaded):
-        pass
+        # the whole tempo and meter map goes over in one message
+        self._post_command(SetTimelineState(event.timeline_state))
 
     def on_project_closed(self, event: event_model.ProjectClosed):
         pass
@@ -113,14 +71,14 @@ class PedalboardSyncController(ISyncController):
     def on_connection_added(self, event: event_model.ConnectionAdded):
         conn = event.connection
         self._post_command(
-            AddConnection(source_node_id=conn.source_port.owner_node_id,
-                          dest_node_id=conn.dest_port.owner_node_id))
+            AddConnection(source_node_id=conn.source_node_id,
+                          dest_node_id=conn.dest_node_id))
 
     def on_connection_removed(self, event: event_model.ConnectionRemoved):
         conn = event.connection
         self._post_command(
-            RemoveConnection(source_node_id=conn.source_port.owner_node_id,
-                             dest_node_id=conn.dest_port.owner_node_id))
+            RemoveConnection(source_node_id=conn.source_node_id,
+                             dest_node_id=conn.dest_node_id))
 
     def on_insert_added(self, event: event_model.InsertAdded):
         self._post_command(
@@ -132,16 +90,22 @@ class PedalboardSyncController(ISyncController):
     def on_insert_removed(self, event: event_model.InsertRemoved):
         self._post_command(
             RemovePlugin(owner_node_id=event.owner_node_id,
-                         plugin_instance_id=event.plugin_id))
+                         plugin_instance_id=event.plugin_instance_id))
 
     def on_insert_moved(self, event: event_model.InsertMoved):
         self._post_command(
             MovePlugin(owner_node_id=event.owner_node_id,
-                       plugin_instance_id=event.plugin_id,
+                       plugin_instance_id=event.plugin_instance_id,
                        old_index=event.old_index,
                        new_index=event.new_index))
-        print(
-            f"Sync: Plugin move command posted for plugin {event.plugin_id}.")
+        print(f"Sync: Plugin move command posted for plugin "
+              f"{event.plugin_instance_id}.")
+
+    def on_insert_chain_reordered(self,
+                                  event: event_model.InsertChainReordered):
+        self._post_command(
+            ReorderPlugins(owner_node_id=event.owner_node_id,
+                           plugin_instance_ids=event.plugin_instance_ids))
 
     def on_plugin_enabled_changed(self,
                                   event: event_model.PluginEnabledChanged):
@@ -150,12 +114,24 @@ class PedalboardSyncController(ISyncController):
             SetPluginBypass(plugin_instance_id=event.plugin_id,
                             is_bypassed=not event.is_enabled))
 
+    def on_plugin_latency_changed(self,
+                                  event: event_model.PluginLatencyChanged):
+        self._post_command(
+            SetPluginLatency(plugin_instance_id=event.plugin_id,
+                             latency_samples=event.latency_samples))
+
     def on_parameter_changed(self, event: event_model.ParameterChanged):
         self._post_command(
             SetParameter(owner_node_id=event.owner_node_id,
                          parameter_path=event.param_name,
                          value=event.new_value))
 
+    def on_parameters_changed(self, event: event_model.ParametersChanged):
+        self._post_command(
+            SetParameters(owner_node_ids=event.owner_node_ids,
+                          parameter_paths=event.param_names,
+                          values=event.new_values))
+
     def on_clip_added(self, event: event_model.ClipAdded):
         self._post_command(
             AddTrackClip(track_id=event.owner_track_id, clip=event.clip))
@@ -1,18 +1,32 @@
 from typing import List, Tuple
-import bisect
 import math
+
+import numpy as np
+
 from ...interfaces.system import IEngineTimeline, IDomainTimeline
-from ...models import Tempo, TimeSignature
+from ...interfaces.system.itimeline import IMusicalTimeConverter
+from ...models import Tempo, TimeSignature, TempoMap
+from ...models.timeline_model import segment_index
 from ...models.state_model import TimelineState
 
 
-class RealTimeTimeline(IEngineTimeline):
+class RealTimeTimeline(IEngineTimeline, IMusicalTimeConverter):
 
     def __init__(self):
         self._tempos: List[Tempo] = [Tempo(beat=0, bpm=120)]
         self._time_signatures: List[TimeSignature] = [
             TimeSignature(beat=0, numerator=4, denominator=4)
         ]
+        self._version = 0
+        self._tempo_map = TempoMap.from_tempos(self._tempos)
+        self._signature_beats = tuple(ts.beat for ts in self._time_signatures)
+        # last answers of the tempo / signature lookups, tried first
+        self._tempo_hint = 0
+        self._signature_hint = 0
+
+    @property
+    def tempo_map_version(self) -> int:
+        return self._version
 
     @property
     def tempos(self) -> List[Tempo]:
@@ -23,22 +37,54 @@ class RealTimeTimeline(IEngineTimeline):
         return list(self._time_signatures)
 
     def set_state(self, new_state: TimelineState) -> TimelineState:
-        self._tempos = new_state.tempos
-        self._time_signatures = new_state.time_signatures
+        # only the tables that actually differ are rebuilt, and an
+        # unchanged state leaves the version alone so the audio thread
+        # keeps its cached tempo segment
+        changed = False
+        if new_state.tempos != self._tempos:
+            self._tempos = new_state.tempos
+            self._tempo_map = TempoMap.from_tempos(self._tempos)
+            changed = True
+        if new_state.time_signatures != self._time_signatures:
+            self._time_signatures = new_state.time_signatures
+            self._signature_beats = tuple(
+                ts.beat for ts in self._time_signatures)
+            changed = True
+        if changed:
+            self._version += 1
+
+    @property
+    def tempo_map(self) -> TempoMap:
+        return self._tempo_map
+
+    def beats_to_seconds(self, target_beats: float) -> float:
+        return self._tempo_map.beats_to_seconds(target_beats)
+
+    def seconds_to_beats(self, target_seconds: float) -> float:
+        return self._tempo_map.seconds_to_beats(target_seconds)
+
+    def beats_to_seconds_array(self, beats: np.ndarray) -> np.ndarray:
+        return self._tempo_map.beats_to_seconds_array(beats)
+
+    def seconds_to_beats_array(self, seconds: np.ndarray) -> np.ndarray:
+        return self._tempo_map.seconds_to_beats_array(seconds)
 
     def get_tempo_at_beat(self, beat: float) -> Tempo:
+        idx = self._tempo_map.segment_index(beat, self._tempo_hint)
+        self._tempo_hint = idx
+        return self._tempos[idx]
 
-        idx = bisect.bisect_right(self._tempos, beat, key=lambda t: t.beat)
-        return self._tempos[idx - 1]
+    def get_tempo_segment(self, beat: float) -> Tuple[Tempo, float]:
+        idx = self._tempo_map.segment_index(beat, self._tempo_hint)
+        self._tempo_hint = idx
+        if idx + 1 < len(self._tempos):
+            return self._tempos[idx], self._tempos[idx + 1].beat
+        return self._tempos[idx], math.inf
 
     def get_time_signature_at_beat(self, beat: float) -> TimeSignature:
         if not self._time_signatures:
             return TimeSignature(beat=0.0, numerator=4, denominator=4)
 
-        idx = bisect.bisect_right(self._time_signatures,
-                                  beat,
-                                  key=lambda t: t.beat)
-        if idx == 0:
-            return self._time_signatures[0]
-
-        return self._time_signatures[idx - 1]
+        idx = segment_index(self._signature_beats, beat, self._signature_hint)
+        self._signature_hint = idx
+        return self._time_signatures[idx]
@@ -1,4 +1,5 @@
 from typing import Optional
+from .parameter import Parameter
 from ..interfaces.system import IEngineController, IEngine, IEventBus, IDomainTimeline, IRouter
 
 
@@ -46,12 +47,16 @@ class EngineController(IEngineController):
         self._audio_engine.play()
 
     def stop(self):
+        # the engine should stop on the final values, not one window behind
+        Parameter.flush_batched_changes()
         self._audio_engine.stop()
 
     def pause(self):
+        Parameter.flush_batched_changes()
         self._audio_engine.pause()
 
     def seek(self, beat: float):
+        Parameter.flush_batched_changes()
         self._audio_engine.seek(beat=beat)
 
     @property
@@ -63,7 +68,7 @@ class EngineController(IEngineController):
         return self._audio_engine.current_beat
 
     def _get_children(self):
-        return []
+        return ()
 
     def _on_mount(self, bus: IEventBus):
         self._event_bus = bus
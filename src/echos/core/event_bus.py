@@ -1,5 +1,8 @@
-from collections import defaultdict
-from typing import Callable, List, Dict, Type
+import dataclasses
+import uuid
+from collections import defaultdict, deque
+from datetime import datetime
+from typing import Any, Callable, Deque, List, Dict, Tuple, Type
 from ..interfaces.system.ievent_bus import IEventBus
 from ..models.event_model import BaseEvent
 
@@ -9,10 +12,14 @@ class EventBus(IEventBus):
     def __init__(self):
         self._subscribers: Dict[Type[BaseEvent],
                                 List[Callable]] = defaultdict(list)
+        # per published type: its own handlers followed by the catch-all
+        # BaseEvent handlers, rebuilt lazily after any (un)subscribe
+        self._dispatch: Dict[Type[BaseEvent], Tuple[Callable, ...]] = {}
         print("EventBus: Initialized.")
 
     def subscribe(self, event_type: Type[BaseEvent], handler: Callable):
         self._subscribers[event_type].append(handler)
+        self._dispatch.clear()
         print(
             f"EventBus: Handler '{handler.__name__}' subscribed to '{event_type.__name__}'"
         )
@@ -22,6 +29,7 @@ class EventBus(IEventBus):
         if event_type in self._subscribers:
             try:
                 self._subscribers[event_type].remove(handler)
+                self._dispatch.clear()
                 print(
                     f"EventBus: Handler '{handler.__name__}' unsubscribed from '{event_type.__name__}'"
                 )
@@ -31,24 +39,76 @@ class EventBus(IEventBus):
     def publish(self, event: BaseEvent):
 
         event_type = type(event)
-        if event_type in self._subscribers:
-            for handler in self._subscribers[event_type]:
-                try:
-                    handler(event)
-                except Exception as e:
-                    print(
-                        f"EventBus Error: Handler '{handler.__name__}' failed for {event_type.__name__}: {e}"
-                    )
-
-        if BaseEvent in self._subscribers and event_type != BaseEvent:
-            for handler in self._subscribers[BaseEvent]:
-                try:
-                    handler(event)
-                except Exception as e:
-                    print(
-                        f"EventBus Error: Catch-all handler '{handler.__name__}' failed: {e}"
-                    )
+        handlers = self._dispatch.get(event_type)
+        if handlers is None:
+            handlers = self._build_dispatch(event_type)
+
+        # a tuple snapshot, so handlers may (un)subscribe while it runs
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception as e:
+                print(
+                    f"EventBus Error: Handler '{handler.__name__}' failed for {event_type.__name__}: {e}"
+                )
+
+    def _build_dispatch(self,
+                        event_type: Type[BaseEvent]) -> Tuple[Callable, ...]:
+        handlers = tuple(self._subscribers.get(event_type, ()))
+        if event_type is not BaseEvent:
+            handlers += tuple(self._subscribers.get(BaseEvent, ()))
+        self._dispatch[event_type] = handlers
+        return handlers
 
     def clear(self):
         self._subscribers.clear()
+        self._dispatch.clear()
         print("EventBus: All subscriptions cleared.")
+
+
+class EventPool:
+    # recycles event instances for emitters that publish at a high rate.
+    # EventBus.publish is synchronous, so an emitter can hand an event back
+    # as soon as publish returns; handlers on pooled types must copy what
+    # they need rather than keep the event.
+
+    def __init__(self, max_per_type: int = 1024):
+        self._max_per_type = max_per_type
+        self._free: Dict[Type[BaseEvent], Deque[BaseEvent]] = {}
+        # event type -> its payload field names, cleared on release
+        self._payload_fields: Dict[Type[BaseEvent], Tuple[str, ...]] = {}
+
+    def acquire(self, event_type: Type[BaseEvent], **fields: Any) -> BaseEvent:
+        # every field of the event type must be passed; a recycled
+        # instance keeps whatever a missing field held last time
+        free = self._free.get(event_type)
+        if free:
+            try:
+                event = free.pop()
+            except IndexError:
+                return event_type(**fields)
+            for name, value in fields.items():
+                setattr(event, name, value)
+            event.timestamp = datetime.now()
+            event.event_id = uuid.uuid4()
+            return event
+        return event_type(**fields)
+
+    def release(self, event: BaseEvent):
+        event_type = type(event)
+        payload = self._payload_fields.get(event_type)
+        if payload is None:
+            payload = self._payload_fields[event_type] = tuple(
+                f.name for f in dataclasses.fields(event_type)
+                if f.name not in ("timestamp", "event_id"))
+        # drop the payload so a pooled event does not keep it alive
+        for name in payload:
+            setattr(event, name, None)
+        free = self._free.get(event_type)
+        if free is None:
+            free = self._free.setdefault(event_type,
+                                         deque(maxlen=self._max_per_type))
+        free.append(event)
+
+
+event_pool = EventPool()
@@ -1,6 +1,7 @@
 import threading
+from datetime import datetime
 from typing import List, Dict, Optional
-from .command_base import BaseCommand
+from .command_base import BaseCommand, CommandState
 from ...interfaces.system import ICommandManager
 
 
@@ -20,6 +21,10 @@ class MacroCommand(BaseCommand):
     def finalize(self):
 
         self._is_recording = False
+        # the recorded commands already ran as they were added, so the
+        # macro itself is executed and can be undone as one step
+        self._state = CommandState.EXECUTED
+        self._executed_at = datetime.now()
 
     def _do_execute(self) -> bool:
 
@@ -218,6 +223,7 @@ class CommandManager(ICommandManager):
                 return
 
             macro = self._current_macro
+            macro.finalize()
             macro.undo()  # 撤销所有在宏中执行的命令
 
             # 恢复父宏
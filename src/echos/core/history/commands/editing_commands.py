@@ -73,13 +73,10 @@ class AddNotesToClipCommand(BaseCommand):
 
     def _do_execute(self) -> bool:
         initial_count = len(self._clip.notes)
-        for note in self._notes_to_add:
-            self._clip.notes.add(note)
+        self._clip.notes.update(self._notes_to_add)
         return len(self._clip.notes) > initial_count
 
     def _do_undo(self) -> bool:
         initial_count = len(self._clip.notes)
-        for note in self._notes_to_add:
-            if note in self._clip.notes:
-                self._clip.notes.remove(note)
+        self._clip.notes.difference_update(self._notes_to_add)
         return len(self._clip.notes) < initial_count
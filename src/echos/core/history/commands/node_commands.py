@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Sequence
 from ....interfaces import IRouter, INode, ITrack, IPlugin, IProject
 from ....interfaces.system.ifactory import INodeFactory
 from ....models import Connection, PluginDescriptor
@@ -16,6 +16,10 @@ class CreateTrackCommand(BaseCommand):
         self._name = name
         self._created_track: Optional[ITrack] = None
 
+    @property
+    def created_track(self) -> Optional[ITrack]:
+        return self._created_track
+
     def _do_execute(self) -> bool:
         if self._track_type == "InstrumentTrack":
             self._created_track = self._node_factory.create_instrument_track(
@@ -90,8 +94,7 @@ class DeleteNodeCommand(BaseCommand):
         if self._deleted_node:
             self._router.add_node(self._deleted_node)
             # 重新建立连接
-            for conn in self._connections:
-                self._router.connect(conn.source_port, conn.dest_port)
+            self._router.connect_many(self._connections)
             return True
         return False
 
@@ -121,7 +124,7 @@ class AddInsertPluginCommand(BaseCommand):
     def _do_undo(self) -> bool:
         if self._added_plugin and hasattr(self._track, 'mixer_channel'):
             return self._track.mixer_channel.remove_insert(
-                self._added_plugin.node_id)
+                self._added_plugin.plugin_instance_id)
         return False
 
 
@@ -133,8 +136,7 @@ class RemoveInsertPluginCommand(BaseCommand):
         self._removed_plugin: Optional[IPlugin] = None
         self._removed_index: Optional[int] = None
 
-        plugin = next((p for p in track.mixer_channel.inserts
-                       if p.node_id == plugin_instance_id), None)
+        plugin = track.mixer_channel.get_insert(plugin_instance_id)
         super().__init__(
             f"Remove Plugin '{plugin.descriptor.name if plugin else plugin_instance_id}' from '{track.name}'"
         )
@@ -145,13 +147,10 @@ class RemoveInsertPluginCommand(BaseCommand):
             return False
 
         mixer = self._track.mixer_channel
-        for i, plugin in enumerate(mixer.inserts):
-            if plugin.node_id == self._plugin_instance_id:
-                self._removed_index = i
-                self._removed_plugin = plugin
-                break
-
-        if self._removed_plugin:
+        plugin = mixer.get_insert(self._plugin_instance_id)
+        if plugin:
+            self._removed_index = mixer.inserts.index(plugin)
+            self._removed_plugin = plugin
             return mixer.remove_insert(self._plugin_instance_id)
 
         self._error = f"Plugin instance '{self._plugin_instance_id}' not found."
@@ -164,3 +163,38 @@ class RemoveInsertPluginCommand(BaseCommand):
                                                  self._removed_index)
             return True
         return False
+
+
+class ReorderInsertPluginsCommand(BaseCommand):
+
+    def __init__(self, track: ITrack, plugin_instance_ids: Sequence[str]):
+        super().__init__(f"Reorder Plugins on '{track.name}'")
+        self._track = track
+        self._new_order = list(plugin_instance_ids)
+        self._old_order: List[str] = []
+
+    def _do_execute(self) -> bool:
+        if not hasattr(self._track, 'mixer_channel'):
+            self._error = f"Track '{self._track.name}' has no mixer channel."
+            return False
+
+        mixer = self._track.mixer_channel
+        current = [p.plugin_instance_id for p in mixer.inserts]
+        if sorted(current) != sorted(self._new_order):
+            self._error = "Plugin order must list every insert exactly once."
+            return False
+
+        self._old_order = current
+        self._apply(self._new_order)
+        return True
+
+    def _do_undo(self) -> bool:
+        self._apply(self._old_order)
+        return True
+
+    def _apply(self, order: List[str]):
+        # one chain update reaches the engine for the whole reorder
+        mixer = self._track.mixer_channel
+        with mixer.batch_moves():
+            for index, plugin_instance_id in enumerate(order):
+                mixer.move_insert(plugin_instance_id, index)
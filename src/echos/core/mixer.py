@@ -1,10 +1,14 @@
-from typing import List, Dict, Optional, Any
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Iterator, List, Dict, Mapping, Optional, Any, Tuple
 import uuid
+
+import numpy as np
+
 from .parameter import Parameter
 from ..interfaces import IMixerChannel, IPlugin, IParameter, IEventBus
 from ..interfaces.system.ilifecycle import ILifecycleAware
-from ..interfaces.system.iplugin import IPlugin
-from ..models.mixer_model import Send
+from ..models.mixer_model import InsertChainView, Send
 from ..models.state_model import SendState, MixerState
 
 
@@ -25,7 +29,23 @@ class MixerChannel(IMixerChannel):
         self.is_solo = False
 
         self._inserts: List[IPlugin] = []
+        # plugin_instance_id -> insert, so lookups skip the ordered scan
+        self._inserts_by_id: Dict[str, IPlugin] = {}
         self._sends: List[Send] = []
+        # lifecycle children and the parameter index are rebuilt lazily
+        # after inserts or sends change
+        self._children: Optional[Tuple[ILifecycleAware, ...]] = None
+        self._parameter_list: Optional[List[IParameter]] = None
+        self._parameter_handles: Optional[Dict[str, int]] = None
+        self._parameters: Optional[Mapping[str, IParameter]] = None
+        self._insert_view: Optional[InsertChainView] = None
+        # fill_gain_ramp state: the gain the last block ended on and a
+        # 0..1 ramp of the block length, reused while the length holds
+        self._last_gain: Optional[float] = None
+        self._unit_ramp = np.empty(0, dtype=np.float32)
+        # open batch_moves blocks, and whether a move happened inside them
+        self._move_batch_depth = 0
+        self._moves_pending = False
 
     @property
     def channel_id(self) -> str:
@@ -47,26 +67,94 @@ class MixerChannel(IMixerChannel):
     def sends(self) -> List[Send]:
         return list(self._sends)
 
-    def get_parameters(self) -> Dict[str, Parameter]:
+    def get_insert(self, plugin_instance_id: str) -> Optional[IPlugin]:
+        return self._inserts_by_id.get(plugin_instance_id)
 
-        params = {
-            "volume": self._volume,
-            "pan": self._pan,
-            "input_gain": self._input_gain
-        }
+    def insert_chain_view(self) -> InsertChainView:
+        view = self._insert_view
+        if view is None:
+            view = self._insert_view = InsertChainView.from_inserts(
+                self._inserts)
+        else:
+            # ids and latencies follow the structure; bypass can be toggled
+            # on the plugin itself, so the mask is refreshed in place
+            enabled = view.enabled
+            for i, plugin in enumerate(self._inserts):
+                enabled[i] = plugin.is_enabled
+        return view
+
+    def fill_gain_ramp(self, out: np.ndarray, start_beat: float,
+                       end_beat: float) -> np.ndarray:
+        frames = len(out)
+        lane = self._volume.automation_lane
+        if lane.is_enabled and lane.points:
+            beats = np.linspace(start_beat, end_beat, frames, endpoint=False)
+            db = self._volume.get_values_at(beats)
+            gains = np.power(10.0, db / 20.0)
+            gains[db <= -96.0] = 0.0
+            out[...] = gains
+            if frames:
+                self._last_gain = float(gains[-1])
+            return out
+
+        db = self._volume.value
+        target = 10**(db / 20.0) if db > -96 else 0.0
+        start = target if self._last_gain is None else self._last_gain
+        if start == target:
+            out.fill(target)
+        else:
+            # glide from the previous block's gain instead of stepping
+            if len(self._unit_ramp) != frames:
+                self._unit_ramp = np.arange(1, frames + 1,
+                                            dtype=np.float32) / frames
+            np.multiply(self._unit_ramp, target - start, out=out)
+            out += start
+        self._last_gain = target
+        return out
+
+    def get_parameters(self) -> Mapping[str, IParameter]:
+        # shared between calls until the structure changes
+        if self._parameters is None:
+            self._build_parameter_index()
+        return self._parameters
+
+    def get_parameter_handle(self, name: str) -> int:
+        if self._parameter_handles is None:
+            self._build_parameter_index()
+        return self._parameter_handles[name]
+
+    def get_parameter_by_handle(self, handle: int) -> IParameter:
+        if self._parameter_list is None:
+            self._build_parameter_index()
+        return self._parameter_list[handle]
+
+    def set_parameter(self, name: str, value: Any):
+        self.get_parameter_by_handle(
+            self.get_parameter_handle(name)).set_value(value)
+
+    def _build_parameter_index(self):
+        names = ["volume", "pan", "input_gain"]
+        params = [self._volume, self._pan, self._input_gain]
 
         for i, plugin in enumerate(self._inserts):
             for name, param in plugin.get_parameters().items():
-                params[f"insert_{i}_{name}"] = param
+                names.append(f"insert_{i}_{name}")
+                params.append(param)
 
         for i, send in enumerate(self._sends):
-            params[f"send_{i}_level"] = send.level
+            names.append(f"send_{i}_level")
+            params.append(send.level)
 
-        return params
+        self._parameter_list = params
+        self._parameter_handles = {name: i for i, name in enumerate(names)}
+        self._parameters = MappingProxyType(dict(zip(names, params)))
 
-    def set_parameter(self, name: str, value: Any):
-        parameters = self.get_parameters()
-        parameters[name].set_value(value)
+    def _invalidate_structure(self):
+        self._children = None
+        self._parameter_list = None
+        self._parameter_handles = None
+        self._parameters = None
+        self._insert_view = None
 
     def add_insert(self, plugin: IPlugin, index: Optional[int] = None):
 
@@ -76,6 +164,8 @@ class MixerChannel(IMixerChannel):
         else:
             self._inserts.insert(index, plugin)
             actual_index = index
+        self._inserts_by_id[plugin.plugin_instance_id] = plugin
+        self._invalidate_structure()
 
         if self.is_mounted:
             plugin.mount(self._event_bus)
@@ -91,45 +181,61 @@ class MixerChannel(IMixerChannel):
 
     def remove_insert(self, plugin_id: str) -> bool:
 
-        for i, plugin in enumerate(self._inserts):
-            if plugin.node_id == plugin_id:
-                removed = self._inserts.pop(i)
-                removed.unmount()
+        removed = self._inserts_by_id.pop(plugin_id, None)
+        if removed is None:
+            return False
 
-                if self.is_mounted:
-                    from ..models.event_model import InsertRemoved
-                    self._event_bus.publish(
-                        InsertRemoved(owner_node_id=self._channel_id,
-                                      plugin_id=plugin_id))
-                return True
-        return False
+        self._inserts.remove(removed)
+        self._invalidate_structure()
+        removed.unmount()
+
+        if self.is_mounted:
+            from ..models.event_model import InsertRemoved
+            self._event_bus.publish(
+                InsertRemoved(owner_node_id=self._channel_id,
+                              plugin_instance_id=plugin_id))
+        return True
 
     def move_insert(self, plugin_id: str, new_index: int) -> bool:
 
-        old_index = -1
-        plugin_to_move = None
-
-        for i, plugin in enumerate(self._inserts):
-            if plugin.node_id == plugin_id:
-                plugin_to_move = plugin
-                old_index = i
-                break
+        plugin_to_move = self._inserts_by_id.get(plugin_id)
 
         if plugin_to_move:
+            old_index = self._inserts.index(plugin_to_move)
             self._inserts.pop(old_index)
             actual_new_index = max(0, min(new_index, len(self._inserts)))
             self._inserts.insert(actual_new_index, plugin_to_move)
+            self._invalidate_structure()
 
-            if self.is_mounted:
+            if self._move_batch_depth:
+                self._moves_pending = True
+            elif self.is_mounted:
                 from ..models.event_model import InsertMoved
                 self._event_bus.publish(
                     InsertMoved(owner_node_id=self._channel_id,
-                                plugin_id=plugin_id,
+                                plugin_instance_id=plugin_id,
                                 old_index=old_index,
                                 new_index=actual_new_index))
             return True
         return False
 
+    @contextmanager
+    def batch_moves(self) -> Iterator[None]:
+        self._move_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._move_batch_depth -= 1
+            if not self._move_batch_depth and self._moves_pending:
+                self._moves_pending = False
+                if self.is_mounted:
+                    from ..models.event_model import InsertChainReordered
+                    self._event_bus.publish(
+                        InsertChainReordered(
+                            owner_node_id=self._channel_id,
+                            plugin_instance_ids=tuple(
+                                p.plugin_instance_id for p in self._inserts)))
+
     def add_send(self, target_bus_id: str, is_post_fader: bool = True) -> Send:
 
         send_level = Parameter(owner_node_id=self._channel_id,
@@ -145,6 +251,7 @@ class MixerChannel(IMixerChannel):
                     is_post_fader=is_post_fader)
 
         self._sends.append(send)
+        self._invalidate_structure()
 
         if self.is_mounted:
             send_level.mount(self._event_bus)
@@ -160,6 +267,7 @@ class MixerChannel(IMixerChannel):
         for i, send in enumerate(self._sends):
             if send.send_id == send_id:
                 removed = self._sends.pop(i)
+                self._invalidate_structure()
                 removed.level.unmount()
 
                 if self.is_mounted:
@@ -230,6 +338,10 @@ class MixerChannel(IMixerChannel):
         channel._inserts = [
             Plugin.from_state(p_state, **kwargs) for p_state in state.inserts
         ]
+        channel._inserts_by_id = {
+            plugin.plugin_instance_id: plugin
+            for plugin in channel._inserts
+        }
 
         # Recreate sends
         channel._sends = [
@@ -242,6 +354,7 @@ class MixerChannel(IMixerChannel):
                 is_enabled=s.is_enabled,
             ) for s in state.sends
         ]
+        channel._invalidate_structure()
         return channel
 
     def _on_mount(self, event_bus: IEventBus):
@@ -250,10 +363,12 @@ class MixerChannel(IMixerChannel):
     def _on_unmount(self):
         self._event_bus = None
 
-    def _get_children(self) -> List[ILifecycleAware]:
+    def _get_children(self) -> Tuple[ILifecycleAware, ...]:
 
-        children = [self._volume, self._pan, self._input_gain]
-        children.extend(self._inserts)
-        for send in self._sends:
-            children.append(send.level)
-        return children
+        if self._children is None:
+            children = [self._volume, self._pan, self._input_gain]
+            children.extend(self._inserts)
+            for send in self._sends:
+                children.append(send.level)
+            self._children = tuple(children)
+        return self._children
@@ -1,14 +1,22 @@
-from typing import Any, Dict, List, Optional, Callable, Tuple
+from typing import Any, Dict, List, Optional, Callable, Sequence, Tuple
 
+import sys
 import threading
+from bisect import bisect_right
+from operator import attrgetter
 import time
 
-from ..models.parameter_model import AutomationPoint, AutomationLane, AutomationCurveType
+import numpy as np
+
+from ..models.parameter_model import (AutomationPoint, AutomationLane,
+                                     AutomationCurveType, ParameterDescriptor)
 from ..models.engine_model import TransportContext
+from ..models.event_model import ParameterChanged, ParametersChanged
 
 from ..interfaces.system import IParameter, IEventBus
 from ..interfaces.system.ilifecycle import ILifecycleAware
 from ..models.state_model import ParameterState
+from .event_bus import event_pool
 
 
 class ParameterBatchUpdater:
@@ -18,6 +26,9 @@ class ParameterBatchUpdater:
         self._flush_interval = flush_interval
         self._pending_changes: Dict[Tuple[str, str], Any] = {}
         self._lock = threading.Lock()
+        # held from swap to publish so a caller's flush cannot overtake a
+        # batch the flush thread has taken but not yet published
+        self._flush_lock = threading.RLock()
         self._flush_thread: Optional[threading.Thread] = None
         self._stop_flag = threading.Event()
         self._is_running = False
@@ -46,6 +57,10 @@ class ParameterBatchUpdater:
 
         self.flush_now()
 
+    def set_flush_interval(self, seconds: float):
+        # the coalescing window; takes effect from the next tick
+        self._flush_interval = seconds
+
     def queue_change(self, node_id: str, param_name: str, new_value: Any):
 
         with self._lock:
@@ -53,29 +68,70 @@ class ParameterBatchUpdater:
 
     def flush_now(self):
 
-        with self._lock:
-            if not self._pending_changes:
-                return
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending_changes:
+                    return
 
-            changes = self._pending_changes.copy()
-            self._pending_changes.clear()
+                changes = self._pending_changes.copy()
+                self._pending_changes.clear()
 
-        from ..models.event_model import ParameterChanged
-        for (node_id, param_name), new_value in changes.items():
-            self._event_bus.publish(
-                ParameterChanged(owner_node_id=node_id,
-                                 param_name=param_name,
-                                 new_value=new_value))
+            # one event per flush instead of one per parameter
+            keys = changes.keys()
+            event = event_pool.acquire(
+                ParametersChanged,
+                owner_node_ids=tuple(node_id for node_id, _ in keys),
+                param_names=tuple(param_name for _, param_name in keys),
+                new_values=tuple(changes.values()))
+            self._event_bus.publish(event)
+            event_pool.release(event)
 
     def _flush_loop(self):
 
+        deadline = time.perf_counter()
         while not self._stop_flag.is_set():
-            time.sleep(self._flush_interval)
+            deadline += self._flush_interval
+            remaining = deadline - time.perf_counter()
+            if remaining > 0 and self._stop_flag.wait(remaining):
+                break
             self.flush_now()
 
 
+_DESCRIPTORS: Dict[tuple, ParameterDescriptor] = {}
+
+
+def _shared_descriptor(name: str, min_value: Any, max_value: Any,
+                       unit: str) -> ParameterDescriptor:
+    # every channel carries the same volume/pan/mute triple, so parameters
+    # with equal static data share one descriptor instead of a copy each
+    key = (name, min_value, max_value, unit)
+    try:
+        descriptor = _DESCRIPTORS.get(key)
+    except TypeError:
+        return ParameterDescriptor(name, min_value, max_value, unit)
+    if descriptor is None:
+        descriptor = _DESCRIPTORS.setdefault(
+            key, ParameterDescriptor(name, min_value, max_value, unit))
+    return descriptor
+
+
+_CURVE_LINEAR = 0
+_CURVE_EXPONENTIAL = 1
+# every other curve type holds the segment's start value
+_CURVE_HOLD = 2
+_CURVE_CODES = {
+    AutomationCurveType.LINEAR: _CURVE_LINEAR,
+    AutomationCurveType.EXPONENTIAL: _CURVE_EXPONENTIAL,
+}
+
+
 class Parameter(IParameter):
 
+    __slots__ = ("_owner_node_id", "_descriptor", "_default_value",
+                 "_base_value", "_automation_lane", "_lane_points",
+                 "_lane_beats", "_lane_arrays", "_immediate_mode",
+                 "_change_callbacks")
+
     _batch_updater: Optional[ParameterBatchUpdater] = None
 
     def __init__(self,
@@ -86,15 +142,21 @@ class Parameter(IParameter):
                  max_value: Optional[Any] = None,
                  unit: str = ""):
         super().__init__()
-        self._owner_node_id = owner_node_id
-        self._name = name
+        # interned so the (node, name) keys built for every change compare
+        # by identity against the ids and names held elsewhere
+        self._owner_node_id = sys.intern(owner_node_id)
+        self._descriptor = _shared_descriptor(sys.intern(name), min_value,
+                                              max_value, unit)
         self._default_value = default_value
         self._base_value = default_value
-        self._min_value = min_value
-        self._max_value = max_value
-        self._unit = unit
 
         self._automation_lane = AutomationLane()
+        # the lane's points sorted by beat, with their beats as a list for
+        # bisect and as columns (beats, values, curve codes, curve shapes)
+        # for numpy; _lane_points is None when the lane has changed since
+        self._lane_points: Optional[Tuple[AutomationPoint, ...]] = None
+        self._lane_beats: List[float] = []
+        self._lane_arrays: Tuple[np.ndarray, ...] = ()
         self._immediate_mode = False
         self._change_callbacks = []
 
@@ -105,15 +167,25 @@ class Parameter(IParameter):
             cls._batch_updater = ParameterBatchUpdater(event_bus)
             cls._batch_updater.start()
 
+    @classmethod
+    def flush_batched_changes(cls):
+        # delivers queued changes now instead of at the next tick
+        if cls._batch_updater:
+            cls._batch_updater.flush_now()
+
     @classmethod
     def shutdown_batch_updater(cls):
         if cls._batch_updater:
             cls._batch_updater.stop()
             cls._batch_updater = None
 
+    @property
+    def descriptor(self) -> ParameterDescriptor:
+        return self._descriptor
+
     @property
     def name(self) -> str:
-        return self._name
+        return self._descriptor.name
 
     @property
     def value(self) -> Any:
@@ -121,20 +193,11 @@ class Parameter(IParameter):
 
     @property
     def automation_lane(self) -> AutomationLane:
+        # points are added unsorted and put in order on the next read
+        if self._lane_points is None:
+            self._build_lane_cache()
         return self._automation_lane
 
-    @property
-    def max_value(self):
-        return self._max_value
-
-    @property
-    def min_value(self):
-        return self._min_value
-
-    @property
-    def unit(self):
-        return self._unit
-
     def set_value(self, new_value: Any, immediate: bool = False):
         old_value = self._base_value
         clamped_value = self._clamp(new_value)
@@ -152,14 +215,16 @@ class Parameter(IParameter):
 
         if self.is_mounted:
             if immediate or self._immediate_mode:
-                from ..models.event_model import ParameterChanged
-                self._event_bus.publish(
-                    ParameterChanged(owner_node_id=self._owner_node_id,
-                                     param_name=self._name,
-                                     new_value=self._base_value))
+                event = event_pool.acquire(ParameterChanged,
+                                           owner_node_id=self._owner_node_id,
+                                           param_name=self._descriptor.name,
+                                           new_value=self._base_value)
+                self._event_bus.publish(event)
+                event_pool.release(event)
             elif self._batch_updater:
                 self._batch_updater.queue_change(self._owner_node_id,
-                                                 self._name, self._base_value)
+                                                 self._descriptor.name,
+                                                 self._base_value)
 
     def get_value_at(self, context: TransportContext) -> Any:
         if not self._automation_lane.is_enabled or not self._automation_lane.points:
@@ -167,6 +232,25 @@ class Parameter(IParameter):
 
         return self._interpolate_automation(context.current_beat)
 
+    def get_values_at(self,
+                      beats: np.ndarray,
+                      out: Optional[np.ndarray] = None) -> np.ndarray:
+        lane = self._automation_lane
+        if not lane.is_enabled or not lane.points:
+            if out is None:
+                return np.full(len(beats), self._base_value, dtype=np.float64)
+            out.fill(self._base_value)
+            return out
+
+        if self._lane_points is None:
+            self._build_lane_cache()
+        values = self._interpolate_automation_block(np.asarray(beats))
+
+        if out is None:
+            return values
+        out[...] = values
+        return out
+
     def add_automation_point(self,
                              beat: float,
                              value: Any,
@@ -178,20 +262,44 @@ class Parameter(IParameter):
                                 curve_type=curve_type,
                                 curve_shape=curve_shape)
         self._automation_lane.points.append(point)
-        self._automation_lane.points.sort(key=lambda p: p.beat)
+        self._lane_points = None
+
+    def add_automation_points_batch(
+            self,
+            beats: Sequence[float],
+            values: Sequence[Any],
+            curve_types: Optional[Sequence[str]] = None,
+            curve_shapes: Optional[Sequence[float]] = None):
+
+        count = len(beats)
+        if curve_types is None:
+            curve_types = (AutomationCurveType.LINEAR, ) * count
+        if curve_shapes is None:
+            curve_shapes = (0.0, ) * count
+        clamp = self._clamp
+        self._automation_lane.points.extend(
+            AutomationPoint(beat=float(beat),
+                            value=clamp(value),
+                            curve_type=curve_type,
+                            curve_shape=float(curve_shape))
+            for beat, value, curve_type, curve_shape in zip(
+                beats, values, curve_types, curve_shapes))
+        self._lane_points = None
 
     def remove_automation_point_at(self,
                                    beat: float,
                                    tolerance: float = 0.01) -> bool:
 
-        for i, point in enumerate(self._automation_lane.points):
+        for i, point in enumerate(self.automation_lane.points):
             if abs(point.beat - beat) <= tolerance:
                 self._automation_lane.points.pop(i)
+                self._lane_points = None
                 return True
         return False
 
     def clear_automation(self):
         self._automation_lane.points.clear()
+        self._lane_points = None
 
     def enable_automation(self, enabled: bool = True):
         self._automation_lane.is_enabled = enabled
@@ -209,14 +317,15 @@ class Parameter(IParameter):
         self.set_value(self._default_value, immediate=True)
 
     def to_state(self) -> ParameterState:
+        descriptor = self._descriptor
         return ParameterState(
-            name=self._name,
+            name=descriptor.name,
             value=self._base_value,
             default_value=self._default_value,
-            min_value=self._min_value,
-            max_value=self._max_value,
-            unit=self._unit,
-            automation_lane=self._automation_lane,
+            min_value=descriptor.min_value,
+            max_value=descriptor.max_value,
+            unit=descriptor.unit,
+            automation_lane=self.automation_lane,
         )
 
     @classmethod
@@ -235,14 +344,42 @@ class Parameter(IParameter):
         return param
 
     def _clamp(self, value: Any) -> Any:
-        if self._min_value is not None and value < self._min_value:
-            return self._min_value
-        if self._max_value is not None and value > self._max_value:
-            return self._max_value
+        descriptor = self._descriptor
+        min_value = descriptor.min_value
+        if min_value is not None and value < min_value:
+            return min_value
+        max_value = descriptor.max_value
+        if max_value is not None and value > max_value:
+            return max_value
         return value
 
+    def _build_lane_cache(self):
+        # one stable sort for however many points were added since the last
+        # read; the lane itself is left in order too
+        lane_points = self._automation_lane.points
+        lane_points.sort(key=attrgetter("beat"))
+        points = tuple(lane_points)
+        count = len(points)
+        self._lane_points = points
+        self._lane_beats = [p.beat for p in points]
+        self._lane_arrays = (
+            np.array(self._lane_beats, dtype=np.float64),
+            np.fromiter((p.value for p in points),
+                        dtype=np.float64,
+                        count=count),
+            np.fromiter((_CURVE_CODES.get(p.curve_type, _CURVE_HOLD)
+                         for p in points),
+                        dtype=np.uint8,
+                        count=count),
+            np.fromiter((p.curve_shape for p in points),
+                        dtype=np.float64,
+                        count=count),
+        )
+
     def _interpolate_automation(self, beat: float) -> Any:
-        points = sorted(self._automation_lane.points, key=lambda p: p.beat)
+        if self._lane_points is None:
+            self._build_lane_cache()
+        points = self._lane_points
 
         if not points:
             return self._base_value
@@ -253,27 +390,55 @@ class Parameter(IParameter):
         if beat >= points[-1].beat:
             return points[-1].value
 
-        for i in range(len(points) - 1):
-            p1 = points[i]
-            p2 = points[i + 1]
-
-            if p1.beat <= beat <= p2.beat:
-                t = (beat - p1.beat) / (p2.beat -
-                                        p1.beat) if p2.beat != p1.beat else 0.0
-
-                if p1.curve_type == AutomationCurveType.LINEAR:
-                    return p1.value + (p2.value - p1.value) * t
-                elif p1.curve_type == AutomationCurveType.EXPONENTIAL:
-                    curve = p1.curve_shape
-                    if curve > 0:
-                        t = t**(1 + curve * 2)
-                    else:
-                        t = 1 - (1 - t)**(1 - curve * 2)
-                    return p1.value + (p2.value - p1.value) * t
-                else:
-                    return p1.value
-
-        return self._base_value
+        # p1 is the last point at or before the beat, p2 the next one
+        i = bisect_right(self._lane_beats, beat)
+        p1 = points[i - 1]
+        p2 = points[i]
+        t = (beat - p1.beat) / (p2.beat - p1.beat)
+
+        if p1.curve_type == AutomationCurveType.LINEAR:
+            return p1.value + (p2.value - p1.value) * t
+        elif p1.curve_type == AutomationCurveType.EXPONENTIAL:
+            curve = p1.curve_shape
+            if curve > 0:
+                t = t**(1 + curve * 2)
+            else:
+                t = 1 - (1 - t)**(1 - curve * 2)
+            return p1.value + (p2.value - p1.value) * t
+        else:
+            return p1.value
+
+    def _interpolate_automation_block(self, beats: np.ndarray) -> np.ndarray:
+        # the same curves as _interpolate_automation, one segment lookup
+        # and one formula evaluation for the whole block
+        point_beats, point_values, curves, shapes = self._lane_arrays
+        if len(point_beats) == 1:
+            return np.full(beats.shape, point_values[0], dtype=np.float64)
+
+        idx = np.searchsorted(point_beats, beats, side="right") - 1
+        np.clip(idx, 0, len(point_beats) - 2, out=idx)
+        b1 = point_beats[idx]
+        v1 = point_values[idx]
+        dv = point_values[idx + 1] - v1
+        span = point_beats[idx + 1] - b1
+        t = np.divide(beats - b1,
+                      span,
+                      out=np.zeros(beats.shape, dtype=np.float64),
+                      where=span > 0)
+        np.clip(t, 0.0, 1.0, out=t)
+
+        curve = curves[idx]
+        shape = shapes[idx]
+        rising = shape > 0
+        exponent = np.where(rising, 1 + shape * 2, 1 - shape * 2)
+        shaped = np.where(rising, t**exponent, 1 - (1 - t)**exponent)
+        t = np.where(curve == _CURVE_EXPONENTIAL, shaped, t)
+        t[curve == _CURVE_HOLD] = 0.0
+
+        values = v1 + dv * t
+        values[beats <= point_beats[0]] = point_values[0]
+        values[beats >= point_beats[-1]] = point_values[-1]
+        return values
 
     def _on_mount(self, event_bus: IEventBus):
         self._event_bus = event_bus
@@ -281,8 +446,9 @@ class Parameter(IParameter):
     def _on_unmount(self):
         self._event_bus = None
 
-    def _get_children(self) -> List[ILifecycleAware]:
-        return []
+    def _get_children(self) -> Tuple[ILifecycleAware, ...]:
+        return ()
 
     def __repr__(self) -> str:
-        return f"Parameter(name='{self._name}', value={self._base_value}, min value={self._min_value}), max value={self._max_value}"
+        d = self._descriptor
+        return f"Parameter(name='{d.name}', value={self._base_value}, min value={d.min_value}), max value={d.max_value}"
@@ -1,9 +1,10 @@
 from pathlib import Path
 import json
+import os
 from dataclasses import asdict
 from typing import Dict, List, Optional, Union
 from ...interfaces.system import IPluginCache
-from ...models import PluginDescriptor, CachedPluginInfo, PluginDescriptor
+from ...models import PluginDescriptor, CachedPluginInfo
 
 
 class PluginCache(IPluginCache):
@@ -11,13 +12,25 @@ class PluginCache(IPluginCache):
     def __init__(self,
                  cache_file_path: Path = Path.home() / ".muzaicache.json"):
         self._cache_file = Path(cache_file_path)
+        self._blacklist_file = self._cache_file.with_name(
+            self._cache_file.name + ".blacklist")
+        self._fingerprint_file = self._cache_file.with_name(
+            self._cache_file.name + ".fingerprint")
         self._cache: Dict[str, CachedPluginInfo] = {}
+        self._blacklist: Dict[str, float] = {}
+        self._fingerprint: Optional[str] = None
         print(f"Cache file will be stored at: {self._cache_file}")
 
     def load(self) -> None:
+        self._load_blacklist()
         if not self._cache_file.exists():
             self._cache = {}
+            self._fingerprint = None
             return
+        try:
+            self._fingerprint = self._fingerprint_file.read_text().strip()
+        except OSError:
+            self._fingerprint = None
         try:
             with open(self._cache_file, 'r') as f:
                 data = json.load(f)
@@ -36,18 +49,52 @@ class PluginCache(IPluginCache):
 
     def persist(self) -> None:
         try:
-            data_to_persist = {
-                path: {
-                    'descriptor': asdict(info.descriptor),
-                    'file_mod_time': info.file_mod_time
-                }
-                for path, info in self._cache.items()
-            }
-            with open(self._cache_file, 'w') as f:
-                json.dump(data_to_persist, f, indent=4)
+            tmp_file = self._cache_file.with_name(self._cache_file.name +
+                                                  ".tmp")
+            # Entries are encoded one at a time so the whole cache is never
+            # duplicated in memory as a single dict.
+            with open(tmp_file, 'w') as f:
+                f.write('{')
+                for i, (path, info) in enumerate(self._cache.items()):
+                    if i:
+                        f.write(',')
+                    f.write(json.dumps(path))
+                    f.write(':')
+                    json.dump(
+                        {
+                            'descriptor': asdict(info.descriptor),
+                            'file_mod_time': info.file_mod_time
+                        }, f)
+                f.write('}')
+            os.replace(tmp_file, self._cache_file)
+
+            with open(self._blacklist_file, 'w') as f:
+                json.dump(self._blacklist, f, indent=4)
+
+            if self._fingerprint is not None:
+                self._fingerprint_file.write_text(self._fingerprint)
+            else:
+                self._fingerprint_file.unlink(missing_ok=True)
         except Exception as e:
             print(f"Error: Could not persist cache. Reason: {e}")
 
+    def _load_blacklist(self) -> None:
+        if not self._blacklist_file.exists():
+            self._blacklist = {}
+            return
+        try:
+            with open(self._blacklist_file, 'r') as f:
+                self._blacklist = {
+                    path: float(mtime)
+                    for path, mtime in json.load(f).items()
+                }
+        except (json.JSONDecodeError, AttributeError, TypeError,
+                ValueError) as e:
+            print(
+                f"Warning: Could not load plugin blacklist, ignoring it. Error: {e}"
+            )
+            self._blacklist = {}
+
     def get_valid_entry(self,
                         path: Union[Path | str]) -> Optional[CachedPluginInfo]:
         path_str = path if type(path) is str else str(path.resolve())
@@ -71,7 +118,26 @@ class PluginCache(IPluginCache):
     def get_all_cached_paths(self) -> List[Path]:
         return [Path(p) for p in self._cache.keys()]
 
+    def get_all_entries(self) -> List[CachedPluginInfo]:
+        return list(self._cache.values())
+
     def remove_entry(self, path: Path) -> None:
         path_str = str(path.resolve())
         if path_str in self._cache:
             del self._cache[path_str]
+
+    def is_blacklisted(self, path: Path, file_mod_time: float) -> bool:
+        # A reinstalled or updated plugin gets a second chance
+        return self._blacklist.get(str(path.resolve())) == file_mod_time
+
+    def add_to_blacklist(self, path: Path, file_mod_time: float) -> None:
+        self._blacklist[str(path.resolve())] = file_mod_time
+
+    def remove_from_blacklist(self, path: Path) -> None:
+        self._blacklist.pop(str(path.resolve()), None)
+
+    def get_fingerprint(self) -> Optional[str]:
+        return self._fingerprint
+
+    def set_fingerprint(self, fingerprint: Optional[str]) -> None:
+        self._fingerprint = fingerprint
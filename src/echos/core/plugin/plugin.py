@@ -1,10 +1,10 @@
 import uuid
-from typing import Any, Dict, List, Optional
-from echos.interfaces.system import IPluginRegistry
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 from ..parameter import Parameter
-from ...interfaces.system import IPlugin, IParameter, IEventBus
-from ...models import PluginDescriptor, Port, PluginDescriptor
-from ...models.event_model import PluginEnabledChanged
+from ...interfaces.system import IPlugin, IParameter, IEventBus, IPluginRegistry
+from ...models import PluginDescriptor, Port
+from ...models.event_model import PluginEnabledChanged, PluginLatencyChanged
 from ...models.state_model import PluginState
 
 
@@ -19,6 +19,7 @@ class Plugin(IPlugin):
         self._descriptor = descriptor
         self._event_bus = event_bus
         self._is_enabled = True
+        self._latency_samples = self._compute_latency()
         self._parameters: Dict[str, IParameter] = {
             name:
             Parameter(
@@ -28,6 +29,7 @@ class Plugin(IPlugin):
             )
             for name, default_value in descriptor.default_parameters.items()
         }
+        self._parameters_view = MappingProxyType(self._parameters)
 
     @property
     def descriptor(self):
@@ -45,25 +47,44 @@ class Plugin(IPlugin):
     def is_enabled(self) -> bool:
         return self._is_enabled
 
+    @property
+    def latency_samples(self) -> int:
+        return self._latency_samples
+
     def set_enabled(self, enabled: bool):
         if self._is_enabled != enabled:
             self._is_enabled = enabled
             self._event_bus.publish(
-                PluginEnabledChanged(plugin_id=self.node_id,
+                PluginEnabledChanged(plugin_id=self._plugin_instance_id,
                                      is_enabled=enabled))
+            self._refresh_latency()
 
-    def get_parameters(self) -> Dict[str, IParameter]:
-        return self._parameters
+    def get_parameters(self) -> Mapping[str, IParameter]:
+        return self._parameters_view
 
     def get_ports(self, port_type: Optional[str] = None) -> List[Port]:
         return self.descriptor.available_ports
 
     def get_latency_samples(self) -> int:
+        return self._latency_samples
 
-        if self.is_enabled and self.descriptor.reports_latency:
-            return self.descriptor.latency_samples
+    def _compute_latency(self) -> int:
+        if self._is_enabled and self._descriptor.reports_latency:
+            return self._descriptor.latency_samples
         return 0
 
+    def _refresh_latency(self):
+        latency = self._compute_latency()
+        if latency == self._latency_samples:
+            return
+        self._latency_samples = latency
+        if self.is_mounted:
+            self._event_bus.publish(
+                PluginLatencyChanged(
+                    plugin_id=self._plugin_instance_id,
+                    latency_samples=latency,
+                ))
+
     def _on_mount(self, event_bus: IEventBus):
         self._event_bus = event_bus
 
@@ -71,7 +92,7 @@ class Plugin(IPlugin):
         self._event_bus = None
 
     def _get_children(self):
-        return list(self._parameters.values())
+        return self._parameters.values()
 
     def get_parameter_values(self) -> Dict[str, Any]:
 
@@ -111,6 +132,7 @@ class Plugin(IPlugin):
                      event_bus=None,
                      node_id=state.instance_id)
         plugin._is_enabled = state.is_enabled
+        plugin._latency_samples = plugin._compute_latency()
 
         # Restore parameter values
         for param_name, param_state in state.parameters.items():
@@ -1,6 +1,6 @@
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Optional, Tuple
 from .scanner import PluginScanner
 from .cache import PluginCache
 from ...interfaces.system import IPluginRegistry
@@ -15,25 +15,39 @@ class PluginRegistry(IPluginRegistry):
 
         self._registry_by_id: Dict[str, PluginDescriptor] = {}
         self._registry_by_path: Dict[Path, PluginDescriptor] = {}
+        self._all_plugins: Optional[Tuple[PluginDescriptor, ...]] = None
+        self._loaded = False
 
     def load(self) -> None:
         print("Loading registry from cache...")
         self._cache.load()
         self.clear()
 
-        for path in self._cache.get_all_cached_paths():
-            cached_info = self._cache.get_entry(path)
-            if cached_info:
-                self._add_to_memory(cached_info.descriptor)
+        for cached_info in self._cache.get_all_entries():
+            self._add_to_memory(cached_info.descriptor)
 
+        self._loaded = True
         print(f"Registry loaded with {len(self._registry_by_id)} plugins.")
 
+    def invalidate(self) -> None:
+        self._loaded = False
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self.load()
+
     def update(self, force_rescan: bool = False) -> None:
+        self._ensure_loaded()
         print("\n--- Starting Registry Update ---")
         start_time = time.time()
 
         search_paths = self._scanner.get_default_search_paths()
         paths_on_disk = set(self._scanner.scan_plugin_paths(search_paths))
+        fingerprint = self._scanner.fingerprint(paths_on_disk)
+        if not force_rescan and fingerprint == self._cache.get_fingerprint():
+            print("--- Plugins unchanged, skipping rescan ---")
+            return
+
         cached_paths = set(self._cache.get_all_cached_paths())
 
         for path in (cached_paths - paths_on_disk):
@@ -42,7 +56,11 @@ class PluginRegistry(IPluginRegistry):
 
         for path in paths_on_disk:
             try:
-                current_mod_time = path.stat().st_mtime
+                current_mod_time = self._scanner.plugin_mod_time(path)
+                if not force_rescan and self._cache.is_blacklisted(
+                        path, current_mod_time):
+                    continue
+
                 cached_entry = self._cache.get_valid_entry(path)
 
                 is_new = cached_entry is None
@@ -56,6 +74,7 @@ class PluginRegistry(IPluginRegistry):
                 if path in cached_paths:
                     self._remove_plugin(path)
 
+        self._cache.set_fingerprint(fingerprint)
         self._cache.persist()
         end_time = time.time()
         print(
@@ -73,6 +92,7 @@ class PluginRegistry(IPluginRegistry):
                                                file_mod_time=mod_time)
 
                 self._cache.store_entry(path, cached_info)
+                self._cache.remove_from_blacklist(path)
 
                 self._remove_from_memory(path)
                 self._add_to_memory(descriptor)
@@ -86,17 +106,20 @@ class PluginRegistry(IPluginRegistry):
             print(f"    -> Failed: {scan_result.error}")
 
             self._remove_plugin(path)
+            self._cache.add_to_blacklist(path, mod_time)
 
     def _add_to_memory(self, descriptor: PluginDescriptor):
         path = Path(descriptor.path).resolve()
         self._registry_by_id[descriptor.unique_plugin_id] = descriptor
         self._registry_by_path[path] = descriptor
+        self._all_plugins = None
 
     def _remove_from_memory(self, path: Path):
         resolved_path = path.resolve()
         descriptor = self._registry_by_path.pop(resolved_path, None)
         if descriptor:
             self._registry_by_id.pop(descriptor.unique_plugin_id, None)
+            self._all_plugins = None
 
     def _remove_plugin(self, path: Path):
         self._remove_from_memory(path)
@@ -105,12 +128,18 @@ class PluginRegistry(IPluginRegistry):
     def clear(self):
         self._registry_by_id.clear()
         self._registry_by_path.clear()
+        self._all_plugins = None
 
-    def list_all(self) -> List[PluginDescriptor]:
-        return list(self._registry_by_id.values())
+    def list_all(self) -> Tuple[PluginDescriptor, ...]:
+        self._ensure_loaded()
+        if self._all_plugins is None:
+            self._all_plugins = tuple(self._registry_by_id.values())
+        return self._all_plugins
 
     def find_by_id(self, unique_plugin_id: str) -> Optional[PluginDescriptor]:
+        self._ensure_loaded()
         return self._registry_by_id.get(unique_plugin_id)
 
     def find_by_path(self, path: Path) -> Optional[PluginDescriptor]:
+        self._ensure_loaded()
         return self._registry_by_path.get(path.resolve())
@@ -1,8 +1,11 @@
 import uuid
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import json
 import os
 import platform
+import re
 import sys
 import subprocess
 from typing import List
@@ -11,6 +14,8 @@ from ...models import PluginScanResult
 
 class PluginScanner:
 
+    _PLUGIN_EXT_RE = re.compile(r'\.(?:vst3|component)\Z', re.IGNORECASE)
+
     def __init__(self, worker_path: Path, timeout: int = 10):
         self.timeout = timeout
         self.plugin_extensions = {".vst3", ".component"}
@@ -24,19 +29,67 @@ class PluginScanner:
     def scan_plugin_paths(self, paths: List[Path]) -> List[Path]:
 
         found_plugins = []
+        folders = [folder for folder in paths if folder.exists()]
+        if not folders:
+            return found_plugins
+
+        # scandir/stat release the GIL, so independent roots walk concurrently
+        with ThreadPoolExecutor(max_workers=len(folders)) as executor:
+            futures = [(folder,
+                        executor.submit(self._find_plugin_files, folder))
+                       for folder in folders]
+            for folder, future in futures:
+                try:
+                    found_plugins.extend(future.result())
+                except Exception as e:
+                    print(f"Warning: Error scanning {folder}: {e}")
 
-        for folder in paths:
-            if not folder.exists():
-                continue
+        return found_plugins
 
+    def plugin_mod_time(self, plugin_path: Path) -> float:
+        # a bundle is a directory, and an update may replace only the
+        # binary deep inside it, so the newest mtime in the bundle counts
+        newest = plugin_path.stat().st_mtime
+        if plugin_path.is_dir():
+            for root, dirs, files in os.walk(plugin_path):
+                for name in dirs + files:
+                    try:
+                        mtime = os.stat(os.path.join(root, name),
+                                        follow_symlinks=False).st_mtime
+                    except OSError:
+                        continue
+                    if mtime > newest:
+                        newest = mtime
+        return newest
+
+    def fingerprint(self, plugin_paths: List[Path]) -> str:
+        digest = hashlib.sha1()
+        for path in sorted(plugin_paths):
             try:
-                for root, dirs, _ in os.walk(folder):
-                    for d in dirs:
-                        path = Path(root) / d
-                        if path.suffix.lower() in self.plugin_extensions:
-                            found_plugins.append(path)
-            except Exception as e:
-                print(f"Warning: Error scanning {folder}: {e}")
+                mtime = self.plugin_mod_time(path)
+                digest.update(f"{path}:{mtime!r};".encode())
+            except OSError:
+                digest.update(f"{path}:missing;".encode())
+        return digest.hexdigest()
+
+    def _find_plugin_files(self, directory: Path) -> List[Path]:
+
+        found_plugins = []
+        stack = [str(directory)]
+
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if self._PLUGIN_EXT_RE.search(entry.name):
+                            # A plugin bundle is opaque, never descend into it
+                            found_plugins.append(Path(entry.path))
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+            except OSError:
+                continue
 
         return found_plugins
 
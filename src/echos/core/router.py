@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import networkx as nx
 
 from ..interfaces.system import IRouter, IPlugin, IEventBus, INode
@@ -12,13 +12,34 @@ class Router(IRouter):
     def __init__(self):
         super().__init__()
         self._nodes: Dict[str, INode] = {}
-        self._connections: List[Connection] = []
+        # insertion-ordered set of connections; Connection is frozen and
+        # hashable, so membership and removal are O(1)
+        self._connections: Dict[Connection, None] = {}
+        # per-node adjacency, kept in step with _connections
+        self._inputs: Dict[str, List[Connection]] = {}
+        self._outputs: Dict[str, List[Connection]] = {}
         self._graph = nx.DiGraph()
+        self._generation = 0
+        # None means the cached order is stale and must be re-sorted
+        self._processing_order: Optional[Tuple[str, ...]] = None
+        # bumped whenever the cached order is replaced or dropped
+        self._order_version = 0
+        # layers move with every structural edit, so they follow generation
+        self._layers_generation = -1
+        self._processing_layers: Tuple[Tuple[str, ...], ...] = ()
 
     @property
     def nodes(self):
         return self._nodes
 
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @property
+    def processing_order_version(self) -> int:
+        return self._order_version
+
     def add_node(self, node: 'INode'):
         if isinstance(node, IPlugin):
             raise ValueError(
@@ -29,7 +50,13 @@ class Router(IRouter):
             print(f"Router: Node {node_id[:8]} already exists")
             return
         self._nodes[node_id] = node
+        self._inputs[node_id] = []
+        self._outputs[node_id] = []
         self._graph.add_node(node_id)
+        self._generation += 1
+        # an isolated node can run anywhere, appending keeps the order valid
+        if self._processing_order is not None:
+            self._set_processing_order(self._processing_order + (node_id, ))
 
         if self.is_mounted:
             node.mount(self._event_bus)
@@ -40,22 +67,37 @@ class Router(IRouter):
                     node_type=node.node_type,
                 ))
 
+    def add_nodes(self, nodes: List['INode']):
+        # append the new ids to the cached order once instead of rebuilding
+        # the tuple per node
+        order = self._processing_order
+        self._set_processing_order(None)
+        before = len(self._nodes)
+        for node in nodes:
+            self.add_node(node)
+        if order is not None:
+            added = list(self._nodes)[before:]
+            self._set_processing_order(order + tuple(added))
+
     def remove_node(self, node_id: str):
 
         if node_id not in self._nodes:
             return
 
-        connections_to_remove = [
-            c for c in self._connections
-            if c.source_port.owner_node_id == node_id
-            or c.dest_port.owner_node_id == node_id
-        ]
+        connections_to_remove = self._inputs[node_id] + self._outputs[node_id]
 
         for conn in connections_to_remove:
-            self.disconnect(conn.source_port, conn.dest_port)
+            self.disconnect(conn.source_node_id, conn.dest_node_id,
+                            conn.source_port_id, conn.dest_port_id)
 
         node = self._nodes.pop(node_id)
+        del self._inputs[node_id]
+        del self._outputs[node_id]
         self._graph.remove_node(node_id)
+        self._generation += 1
+        if self._processing_order is not None:
+            self._set_processing_order(tuple(
+                n for n in self._processing_order if n != node_id))
         node.unmount()
 
         if self.is_mounted:
@@ -116,7 +158,15 @@ class Router(IRouter):
             return False
 
         self._graph.add_edge(source_node_id, dest_node_id)
-        self._connections.append(new_connection)
+        self._connections[new_connection] = None
+        self._outputs[source_node_id].append(new_connection)
+        self._inputs[dest_node_id].append(new_connection)
+        self._generation += 1
+        # only an edge pointing backwards in the current order needs a resort
+        order = self._processing_order
+        if order is not None and order.index(source_node_id) > order.index(
+                dest_node_id):
+            self._set_processing_order(None)
 
         if self.is_mounted:
             from ..models.event_model import ConnectionAdded
@@ -124,6 +174,18 @@ class Router(IRouter):
 
         return True
 
+    def connect_many(self, connections: List[Connection]) -> List[bool]:
+        # skip the per-edge order check and sort once on the next read
+        order = self._processing_order
+        self._set_processing_order(None)
+        results = [
+            self.connect(c.source_node_id, c.dest_node_id, c.source_port_id,
+                         c.dest_port_id) for c in connections
+        ]
+        if not any(results):
+            self._set_processing_order(order)
+        return results
+
     def disconnect(self,
                    source_node_id: str,
                    dest_node_id: str,
@@ -136,13 +198,16 @@ class Router(IRouter):
         if connection_to_remove not in self._connections:
             return False
 
-        self._connections.remove(connection_to_remove)
+        del self._connections[connection_to_remove]
+        outputs = self._outputs[source_node_id]
+        outputs.remove(connection_to_remove)
+        self._inputs[dest_node_id].remove(connection_to_remove)
 
-        if not any(c.source_node_id == source_node_id
-                   and c.dest_node_id == dest_node_id
-                   for c in self._connections):
+        if not any(c.dest_node_id == dest_node_id for c in outputs):
             if self._graph.has_edge(source_node_id, dest_node_id):
                 self._graph.remove_edge(source_node_id, dest_node_id)
+        # removing an edge never breaks a topological order, keep the cache
+        self._generation += 1
 
         if self.is_mounted:
             from ..models.event_model import ConnectionRemoved
@@ -153,34 +218,56 @@ class Router(IRouter):
 
     def get_all_connections(self) -> List[Connection]:
 
-        return self._connections.copy()
+        return list(self._connections)
 
     def get_inputs_for_node(self, node_id: str) -> List[Connection]:
 
-        if node_id not in self._nodes:
-            return []
-        return [
-            c for c in self._connections
-            if c.dest_port.owner_node_id == node_id
-        ]
+        return list(self._inputs.get(node_id, ()))
 
     def get_outputs_for_node(self, node_id: str) -> List[Connection]:
 
-        if node_id not in self._nodes:
-            return []
-        return [
-            c for c in self._connections
-            if c.source_port.owner_node_id == node_id
-        ]
-
-    def get_processing_order(self) -> List[str]:
-
-        try:
-            return list(nx.topological_sort(self._graph))
-        except nx.NetworkXError:
-            print(
-                "Router: Graph has cycles, cannot determine processing order")
-            return []
+        return list(self._outputs.get(node_id, ()))
+
+    def get_processing_order(self) -> Tuple[str, ...]:
+
+        if self._processing_order is None:
+            try:
+                self._processing_order = tuple(
+                    nx.topological_sort(self._graph))
+            except nx.NetworkXUnfeasible:
+                print(
+                    "Router: Graph has cycles, cannot determine processing order"
+                )
+                return ()
+        return self._processing_order
+
+    def get_processing_layers(self) -> Tuple[Tuple[str, ...], ...]:
+
+        if self._layers_generation != self._generation:
+            try:
+                self._processing_layers = tuple(
+                    tuple(layer)
+                    for layer in nx.topological_generations(self._graph))
+            except nx.NetworkXUnfeasible:
+                print(
+                    "Router: Graph has cycles, cannot determine processing layers"
+                )
+                return ()
+            self._layers_generation = self._generation
+        return self._processing_layers
+
+    def _set_processing_order(self, order: Optional[Tuple[str, ...]]):
+        self._processing_order = order
+        self._order_version += 1
+
+    def invalidate_order(self):
+        self._set_processing_order(None)
+        self._layers_generation = -1
+
+    def _would_create_cycle(self, source_node_id: str,
+                            dest_node_id: str) -> bool:
+        return (source_node_id == dest_node_id
+                or nx.has_path(self._graph, dest_node_id, source_node_id))
 
     def has_cycle(self) -> bool:
 
@@ -193,7 +280,7 @@ class Router(IRouter):
     def to_state(self) -> RouterState:
         return RouterState(
             nodes=[node.to_state() for node in self._nodes.values()],
-            connections=self._connections[:],
+            connections=list(self._connections),
         )
 
     @classmethod
@@ -206,8 +293,8 @@ class Router(IRouter):
     def _on_unmount(self):
         self._event_bus = None
 
-    def _get_children(self) -> List[ILifecycleAware]:
-        return list(self._nodes.values())
+    def _get_children(self):
+        return self._nodes.values()
 
     def __repr__(self) -> str:
         return (f"Router(nodes={len(self._nodes)}, "
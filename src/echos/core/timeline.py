@@ -1,8 +1,12 @@
 from typing import List, Tuple
 import bisect
+
+import numpy as np
+
 from .event_bus import EventBus
 from ..interfaces.system import IDomainTimeline
-from ..models import Tempo, TimeSignature
+from ..models import Tempo, TimeSignature, TempoMap
+from ..models.timeline_model import segment_index
 from ..models.state_model import TimelineState
 
 
@@ -17,6 +21,11 @@ class Timeline(IDomainTimeline):
         self._time_signatures: List[TimeSignature] = time_signatures or [
             TimeSignature(beat=0.0, numerator=4, denominator=4)
         ]
+        self._version = 0
+        # last answers of the tempo / signature lookups, tried first
+        self._tempo_hint = 0
+        self._signature_hint = 0
+        self._rebuild_tempo_map()
 
     @property
     def timeline_state(self):
@@ -36,6 +45,8 @@ class Timeline(IDomainTimeline):
         self._validate_state(new_state)
         self._tempos = new_state.tempos
         self._time_signatures = new_state.time_signatures
+        self._rebuild_tempo_map()
+        self._version += 1
         self._sync_timeline_state()
         return old_state
 
@@ -101,87 +112,44 @@ class Timeline(IDomainTimeline):
         if len(new_state.time_signatures) < original_len:
             self.set_state(new_state)
 
-    def beats_to_seconds(self, target_beats: float) -> float:
-
-        if target_beats < 0:
-            return 0.0
-
-        total_seconds = 0.0
-        current_beat = 0.0
-
-        relevant_events = [e for e in self._tempos if e.beat <= target_beats]
-        if not relevant_events or target_beats > relevant_events[-1].beat:
-            relevant_events.append(
-                Tempo(beat=target_beats,
-                      bpm=self.get_tempo_at_beat(target_beats)))
-
-        for i in range(len(relevant_events) - 1):
-            start_event = relevant_events[i]
-            end_event = relevant_events[i + 1]
-            segment_end = min(end_event.beat, target_beats)
-
-            if segment_end > current_beat:
-                beats_in_segment = segment_end - current_beat
-                total_seconds += (beats_in_segment / start_event.bpm) * 60.0
+    @property
+    def tempo_map_version(self) -> int:
+        return self._version
 
-            current_beat = segment_end
-            if current_beat >= target_beats:
-                break
+    @property
+    def tempo_map(self) -> TempoMap:
+        return self._tempo_map
 
-        return total_seconds
+    def beats_to_seconds(self, target_beats: float) -> float:
+        return self._tempo_map.beats_to_seconds(target_beats)
 
     def seconds_to_beats(self, target_seconds: float) -> float:
+        return self._tempo_map.seconds_to_beats(target_seconds)
 
-        if target_seconds < 0:
-            return 0.0
-
-        total_beats = 0.0
-        current_seconds = 0.0
-        current_beat = 0.0
-
-        events_with_end = self._tempos + [
-            Tempo(beat=float('inf'), bpm=self._tempos[-1].bpm)
-        ]
-
-        for i in range(len(events_with_end) - 1):
-            start_event = events_with_end[i]
-            end_event = events_with_end[i + 1]
-            tempo = start_event.bpm
+    def beats_to_seconds_array(self, beats: np.ndarray) -> np.ndarray:
+        return self._tempo_map.beats_to_seconds_array(beats)
 
-            if tempo <= 0:
-                continue
+    def seconds_to_beats_array(self, seconds: np.ndarray) -> np.ndarray:
+        return self._tempo_map.seconds_to_beats_array(seconds)
 
-            segment_beats = end_event.beat - current_beat
-            segment_seconds = (segment_beats / tempo) * 60.0
-
-            if current_seconds + segment_seconds >= target_seconds:
-                remaining_seconds = target_seconds - current_seconds
-                beats_in_remaining = (remaining_seconds * tempo) / 60.0
-                total_beats += beats_in_remaining
-                return total_beats
-            else:
-                total_beats += segment_beats
-                current_seconds += segment_seconds
-                current_beat = end_event.beat
-
-        return total_beats
+    def _rebuild_tempo_map(self):
+        # the map is immutable and swapped in with a single rebind, so a
+        # reader on another thread always sees one consistent snapshot
+        self._tempo_map = TempoMap.from_tempos(self._tempos)
+        self._signature_beats = tuple(ts.beat for ts in self._time_signatures)
 
     def get_tempo_at_beat(self, beat: float) -> float:
-
-        idx = bisect.bisect_right(self._tempos, beat, key=lambda t: t.beat)
-        return self._tempos[idx - 1]
+        idx = self._tempo_map.segment_index(beat, self._tempo_hint)
+        self._tempo_hint = idx
+        return self._tempos[idx]
 
     def get_time_signature_at_beat(self, beat: float) -> TimeSignature:
         if not self._time_signatures:
             return TimeSignature(beat=0.0, numerator=4, denominator=4)
 
-        idx = bisect.bisect_right(self._time_signatures,
-                                  beat,
-                                  key=lambda t: t.beat)
-        if idx == 0:
-            return self._time_signatures[0]
-
-        return self._time_signatures[idx - 1]
+        idx = segment_index(self._signature_beats, beat, self._signature_hint)
+        self._signature_hint = idx
+        return self._time_signatures[idx]
 
     def to_state(self):
         return self.timeline_state
@@ -221,4 +189,4 @@ class Timeline(IDomainTimeline):
         self._event_bus = None
 
     def _get_children(self):
-        return []
+        return ()
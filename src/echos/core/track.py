@@ -1,14 +1,45 @@
 import uuid
-from typing import List, Optional, Dict
+from operator import attrgetter
+from typing import List, Mapping, Optional, Dict, Tuple
 import dataclasses
 from .mixer import MixerChannel
 from ..interfaces.system import ITrack
-from ..models import AnyClip, PortType, PortDirection, Port
+from ..models import AnyClip, Note, PortType, PortDirection, Port
 from ..models.state_model import TrackState
-from ..interfaces.system.ilifecycle import ILifecycleAware, IEventBus
+from ..interfaces.system import ILifecycleAware, IEventBus
 from ..interfaces.system.iparameter import IParameter
 
 
+_NOTE_FIELDS = tuple(f.name for f in dataclasses.fields(Note))
+_NOTE_COLUMNS = attrgetter(*_NOTE_FIELDS)
+# clip type -> its scalar field names, read once per type
+_CLIP_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+
+def _clip_to_dict(clip: AnyClip) -> dict:
+    # dataclasses.asdict deep-copies field by field and cannot handle the
+    # set of notes at all; notes go out column-wise, one list per field,
+    # ordered by start beat
+    names = _CLIP_FIELDS.get(type(clip))
+    if names is None:
+        names = _CLIP_FIELDS[type(clip)] = tuple(
+            f.name for f in dataclasses.fields(clip) if f.name != "notes")
+    record = {}
+    for name in names:
+        value = getattr(clip, name)
+        record[name] = value.copy() if isinstance(value, dict) else value
+    notes = getattr(clip, "notes", None)
+    if notes is not None:
+        rows = map(_NOTE_COLUMNS,
+                   sorted(notes, key=attrgetter("start_beat")))
+        columns = list(zip(*rows)) or [()] * len(_NOTE_FIELDS)
+        record["notes"] = {
+            name: list(column)
+            for name, column in zip(_NOTE_FIELDS, columns)
+        }
+    return record
+
+
 class Track(ITrack):
 
     def __init__(self, name: str, node_id: Optional[str] = None):
@@ -87,9 +118,15 @@ class Track(ITrack):
             return True
         return False
 
-    def get_parameters(self) -> Dict[str, IParameter]:
+    def get_parameters(self) -> Mapping[str, IParameter]:
         return self._mixer_channel.get_parameters()
 
+    def get_parameter_handle(self, name: str) -> int:
+        return self._mixer_channel.get_parameter_handle(name)
+
+    def get_parameter_by_handle(self, handle: int) -> IParameter:
+        return self._mixer_channel.get_parameter_by_handle(handle)
+
     def to_state(self) -> TrackState:
         return TrackState(
             node_id=self._node_id,
@@ -113,7 +150,7 @@ class Track(ITrack):
             "node_id": self._node_id,
             "name": self._name,
             "color": self._color,
-            "clips": [dataclasses.asdict(c) for c in self.clips],
+            "clips": [_clip_to_dict(c) for c in self.clips],
             "mixer_channel": self._mixer_channel.to_dict()
         }
 
@@ -1,17 +1,51 @@
 # file: src/MuzaiCore/services/facade.py
 import inspect
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple, Callable
 from .interfaces import IDAWManager, IService
 from .models import ToolResponse, PluginDescriptor
 
 
+@lru_cache(maxsize=None)
+def _sig_of(func) -> inspect.Signature:
+    sig = inspect.signature(func)
+    # drop 'self' so the signature matches the bound method
+    return sig.replace(parameters=list(sig.parameters.values())[1:])
+
+
+@lru_cache(maxsize=None)
+def _doc_of(obj) -> str:
+    return inspect.getdoc(obj) or ''
+
+
+def _signature(method) -> inspect.Signature:
+    func = getattr(method, '__func__', None)
+    if func is None:
+        return inspect.signature(method)
+    return _sig_of(func)
+
+
+def _docstring(method) -> str:
+    return _doc_of(getattr(method, '__func__', method))
+
+
 class DAWFacade:
 
+    # tools that take project_id but must not get the active project injected
+    _NO_INJECT_PROJECT_ID = frozenset({('project', 'create_project'),
+                                       ('project', 'load_project_from_state')})
+    _NO_INJECT_CATEGORIES = frozenset({'system'})
+
     def __init__(self, manager: IDAWManager, services: Dict[str, IService]):
 
         self._manager = manager
         self._services = services
         self._active_project_id: Optional[str] = None
+        self._method_table: Dict[str, Dict[str, Tuple[
+            Callable, Optional[inspect.Signature], bool]]] = {}
+        # the service set is fixed once constructed, so help is too
+        self._help_cache: Dict[Tuple[Optional[str], Optional[str]],
+                               ToolResponse] = {}
 
         for name, service in self._services.items():
             if hasattr(self, name):
@@ -20,6 +54,27 @@ class DAWFacade:
                     f"Service name '{name}' conflicts with an existing DAWFacade attribute."
                 )
             setattr(self, name, service)
+            self._method_table[name] = self._build_method_entries(
+                name, service)
+
+    @classmethod
+    def _build_method_entries(
+            cls, category: str, service: IService) -> Dict[str, Tuple[
+                Callable, Optional[inspect.Signature], bool]]:
+        inject_allowed = category not in cls._NO_INJECT_CATEGORIES
+        entries = {}
+        for name, method in inspect.getmembers(service, inspect.ismethod):
+            if name.startswith('_'):
+                continue
+            try:
+                sig = _signature(method)
+            except ValueError:
+                sig = None
+            needs_pid = (inject_allowed and sig is not None
+                         and 'project_id' in sig.parameters
+                         and (category, name) not in cls._NO_INJECT_PROJECT_ID)
+            entries[name] = (method, sig, needs_pid)
+        return entries
 
     def _get_active_project_id(self) -> str:
 
@@ -62,7 +117,7 @@ class DAWFacade:
 
         descriptions = {}
         for name, service in self._services.items():
-            doc = inspect.getdoc(service) or f"Tools for {name} operations."
+            doc = _doc_of(type(service)) or f"Tools for {name} operations."
 
             descriptions[name] = doc.split('\n')[0]
         return descriptions
@@ -73,18 +128,11 @@ class DAWFacade:
     def get_available_methods(self) -> Dict[str, List[str]]:
 
         available_methods = {}
-        for cat_name, service_obj in self._services.items():
-            methods = []
-            for name, method in inspect.getmembers(service_obj,
-                                                   inspect.ismethod):
-
-                if not name.startswith('_'):
-                    try:
-                        sig = str(inspect.signature(method))
-                        methods.append(f"{name}{sig}")
-                    except ValueError:
-
-                        methods.append(f"{name}()")
+        for cat_name, entries in self._method_table.items():
+            methods = [
+                f"{name}{sig}" if sig is not None else f"{name}()"
+                for name, (_, sig, _) in entries.items()
+            ]
             available_methods[cat_name] = sorted(methods)
         return available_methods
 
@@ -96,25 +144,21 @@ class DAWFacade:
                     f"Invalid tool name format: '{tool_name}'. Expected 'category.method'."
                 )
             category, method = tool_name.split('.', 1)
-            service = self._services.get(category)
-            if not service:
+            entries = self._method_table.get(category)
+            if entries is None:
                 return ToolResponse("error", None,
                                     f"Unknown service category: '{category}'")
 
-            method_func = getattr(service, method, None)
-            if not method_func or not callable(
-                    method_func) or method.startswith('_'):
+            entry = entries.get(method)
+            if not entry:
                 return ToolResponse(
                     "error", None,
                     f"Unknown or private method: '{method}' in category '{category}'"
                 )
 
-            sig = inspect.signature(method_func)
-            if 'project_id' in sig.parameters and 'project_id' not in kwargs:
-                # Exclude specific methods like project creation/loading and system services
-                if not (category == 'project' and method in ['create_project', 'load_project_from_state']) \
-                   and not category == 'system':
-                    kwargs['project_id'] = self._get_active_project_id()
+            method_func, _, needs_pid = entry
+            if needs_pid and 'project_id' not in kwargs:
+                kwargs['project_id'] = self._get_active_project_id()
 
             return method_func(**kwargs)
 
@@ -135,6 +179,17 @@ class DAWFacade:
                  category: Optional[str] = None,
                  method: Optional[str] = None) -> ToolResponse:
 
+        key = (category, method)
+        response = self._help_cache.get(key)
+        if response is None:
+            response = self._build_help(category, method)
+            if response.status == "success":
+                self._help_cache[key] = response
+        return response.copy()
+
+    def _build_help(self, category: Optional[str],
+                    method: Optional[str]) -> ToolResponse:
+
         if not category:
             return ToolResponse(
                 "success", {
@@ -162,16 +217,15 @@ class DAWFacade:
                     f"Use get_help(category='{category}', method='name') for details on a specific method."
                 }, f"Available methods in '{category}'")
 
-        service = self._services.get(category)
-        method_func = getattr(service, method, None)
-        if not method_func or not callable(method_func) or method.startswith(
-                '_'):
+        entry = self._method_table[category].get(method)
+        if not entry:
             return ToolResponse(
                 "error", None,
                 f"Unknown or private method: '{method}' in '{category}'")
 
-        doc = inspect.getdoc(method_func) or "No documentation available."
-        signature = str(inspect.signature(method_func))
+        method_func, sig, _ = entry
+        doc = _docstring(method_func) or "No documentation available."
+        signature = str(sig) if sig is not None else "()"
 
         return ToolResponse(
             "success", {
@@ -1,6 +1,6 @@
 # file: src/MuzaiCore/services/IEditingService.py
 from abc import ABC, abstractmethod
-from typing import Any, List, Dict
+from typing import Any, List, Dict, Union
 from echos.models import ToolResponse
 from .ibase_service import IService
 
@@ -29,5 +29,6 @@ class IEditingService(IService):
 
     @abstractmethod
     def add_notes_to_clip(self, project_id: str, clip_id: str,
-                          notes: List[Dict[str, Any]]) -> ToolResponse:
+                          notes: Union[List[Dict[str, Any]],
+                                       Dict[str, List[Any]]]) -> ToolResponse:
         pass
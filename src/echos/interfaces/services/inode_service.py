@@ -1,6 +1,6 @@
 # file: src/MuzaiCore/services/INodeService.py
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional, Tuple
 from echos.models import ToolResponse
 from .ibase_service import IService
 
@@ -20,6 +20,11 @@ class INodeService(IService):
     def create_bus_track(self, project_id: str, name: str) -> ToolResponse:
         pass
 
+    @abstractmethod
+    def create_tracks(self, project_id: str,
+                      specs: List[Tuple[str, str]]) -> ToolResponse:
+        pass
+
     @abstractmethod
     def create_vca_track(self, project_id: str, name: str) -> ToolResponse:
         pass
@@ -46,6 +51,12 @@ class INodeService(IService):
                              plugin_instance_id: str) -> ToolResponse:
         pass
 
+    @abstractmethod
+    def reorder_insert_plugins(
+            self, project_id: str, target_node_id: str,
+            plugin_instance_ids: List[str]) -> ToolResponse:
+        pass
+
     @abstractmethod
     def list_nodes(self,
                    project_id: str,
@@ -4,7 +4,7 @@ from .iengine import IEngine, IEngineController
 from .ievent_bus import IEventBus
 from .ifactory import IEngineFactory, INodeFactory
 from .ilifecycle import ILifecycleAware
-from .inode import ITrack, INode, IMixerChannel
+from .inode import ITrack, INode
 from .imixer import IMixerChannel
 from .iplugin import IPlugin, IPluginCache, IPluginInstanceManager, IPluginRegistry
 from .iparameter import IParameter
@@ -29,7 +29,6 @@ __all__ = [
     "INode",
     "INodeFactory",
     "IParameter",
-    "IProjectSerializer",
     "IPlugin",
     "IPluginCache",
     "IPluginInstanceManager",
@@ -1,11 +1,14 @@
 # file: src/MuzaiCore/interfaces/IAudioEngine.py
+from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from .ilifecycle import ILifecycleAware
-from .isync import ISyncController
-from .itimeline import IEngineTimeline
-from ...models.engine_model import TransportStatus
+from ...models.engine_model import TransportSnapshot, TransportStatus
+
+if TYPE_CHECKING:
+    from .isync import ISyncController
+    from .itimeline import IEngineTimeline
 
 
 class IEngine(ILifecycleAware, ABC):
@@ -65,6 +68,12 @@ class IEngine(ILifecycleAware, ABC):
     def transport_status(self) -> TransportStatus:
         pass
 
+    @abstractmethod
+    def transport_snapshot(self) -> TransportSnapshot:
+        # one consistent read of the transport instead of five property
+        # lookups that the audio thread may advance in between
+        pass
+
 
 class IEngineController(ILifecycleAware, ABC):
 
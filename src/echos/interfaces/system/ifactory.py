@@ -1,9 +1,12 @@
+from __future__ import annotations
 from abc import ABC, abstractmethod
-from .inode import ITrack
-from .iplugin import IPlugin
-from .iengine import IEngine
-from .iplugin import IPluginRegistry
-from ...models import PluginDescriptor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .inode import ITrack
+    from .iplugin import IPlugin, IPluginRegistry
+    from .iengine import IEngine
+    from ...models import PluginDescriptor
 
 
 class IEngineFactory(ABC):
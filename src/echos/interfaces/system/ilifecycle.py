@@ -1,11 +1,16 @@
+from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from .ievent_bus import IEventBus
+from typing import TYPE_CHECKING, Optional, Reversible
 from ...models.lifecycle_model import LifecycleState
 
+if TYPE_CHECKING:
+    from .ievent_bus import IEventBus
+
 
 class ILifecycleAware(ABC):
 
+    __slots__ = ("_lifecycle_state", "_event_bus")
+
     def __init__(self):
         self._lifecycle_state = LifecycleState.CREATED
         self._event_bus: Optional['IEventBus'] = None
@@ -30,22 +35,41 @@ class ILifecycleAware(ABC):
             raise RuntimeError(
                 f"{self.__class__.__name__}: Cannot mount disposed component")
 
+        # iterative pre-order walk; a (node, True) entry is popped once the
+        # node's whole subtree has been mounted and marks it MOUNTED
+        stack = [(self, False)]
+        node = self
         try:
-            self._lifecycle_state = LifecycleState.MOUNTING
-            self._event_bus = event_bus
-
-            self._on_mount(event_bus)
-
-            for child in self._get_children():
-                if isinstance(child, ILifecycleAware):
-                    print(f"mount: {child}")
-                    child.mount(event_bus)
-
-            self._lifecycle_state = LifecycleState.MOUNTED
+            while stack:
+                node, expanded = stack.pop()
+                if expanded:
+                    node._lifecycle_state = LifecycleState.MOUNTED
+                    continue
+                if node._lifecycle_state == LifecycleState.MOUNTED:
+                    continue
+                if node._lifecycle_state == LifecycleState.DISPOSED:
+                    raise RuntimeError(f"{node.__class__.__name__}: "
+                                       "Cannot mount disposed component")
+
+                node._lifecycle_state = LifecycleState.MOUNTING
+                node._event_bus = event_bus
+                node._on_mount(event_bus)
+
+                stack.append((node, True))
+                children = node._get_children()
+                if children:
+                    stack.extend(
+                        (child, False) for child in reversed(children))
 
         except Exception as e:
-            self._lifecycle_state = LifecycleState.CREATED
-            self._event_bus = None
+            # the failing node and its unfinished ancestors fall back to
+            # CREATED; finished subtrees stay mounted as before
+            stack.append((node, True))
+            for pending, expanded in stack:
+                if (expanded and pending._lifecycle_state
+                        == LifecycleState.MOUNTING):
+                    pending._lifecycle_state = LifecycleState.CREATED
+                    pending._event_bus = None
             raise RuntimeError(
                 f"{self.__class__.__name__}: Mount failed: {e}") from e
 
@@ -53,22 +77,36 @@ class ILifecycleAware(ABC):
 
         if self._lifecycle_state != LifecycleState.MOUNTED:
             return
-        try:
-            self._lifecycle_state = LifecycleState.UNMOUNTING
-
-            for child in reversed(self._get_children()):
-                if isinstance(child, ILifecycleAware):
-                    child.unmount()
-
-            self._on_unmount()
 
-            self._event_bus = None
-            self._lifecycle_state = LifecycleState.CREATED
-
-        except Exception as e:
-            self._event_bus = None
-            self._lifecycle_state = LifecycleState.CREATED
-            print(f"{self.__class__.__name__}: Unmount error: {e}")
+        # iterative post-order walk; children are pushed in order so they
+        # pop, and unmount, in reverse. They are read live: routers and
+        # mixers attach new ones after mount, so a snapshot taken at mount
+        # time would miss them.
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if not expanded:
+                if node._lifecycle_state != LifecycleState.MOUNTED:
+                    continue
+                node._lifecycle_state = LifecycleState.UNMOUNTING
+                try:
+                    children = node._get_children()
+                except Exception as e:
+                    node._event_bus = None
+                    node._lifecycle_state = LifecycleState.CREATED
+                    print(f"{node.__class__.__name__}: Unmount error: {e}")
+                    continue
+                stack.append((node, True))
+                if children:
+                    stack.extend((child, False) for child in children)
+                continue
+
+            try:
+                node._on_unmount()
+            except Exception as e:
+                print(f"{node.__class__.__name__}: Unmount error: {e}")
+            node._event_bus = None
+            node._lifecycle_state = LifecycleState.CREATED
 
     def dispose(self):
 
@@ -85,6 +123,10 @@ class ILifecycleAware(ABC):
         pass
 
     @abstractmethod
-    def _get_children(self) -> List['ILifecycleAware']:
+    def _get_children(self) -> Reversible['ILifecycleAware']:
+        # may be a live view such as dict.values(): the walks copy it onto
+        # their stack before visiting any child, so it is never iterated
+        # while a child's hooks run. Leaves return an empty tuple, which the
+        # walks skip without building anything
 
-        return []
+        return ()
@@ -1,10 +1,13 @@
 # file: src/MuzaiCore/interfaces/IDAWManager.py
+from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from .iproject import IProject
-from .ifactory import INodeFactory, IPluginRegistry
-from ...models.state_model import ProjectState
+if TYPE_CHECKING:
+    from .iproject import IProject
+    from .ifactory import INodeFactory
+    from .iplugin import IPluginRegistry
+    from ...models.state_model import ProjectState
 
 
 class IDAWManager(ABC):
@@ -1,10 +1,16 @@
+from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import (TYPE_CHECKING, Any, ContextManager, Dict, List, Mapping,
+                    Optional)
 from .ilifecycle import ILifecycleAware
-from .iparameter import IParameter
-from .iplugin import IPlugin
 from .iserializable import ISerializable
-from ...models import Send
+from ...models.mixer_model import InsertChainView
+
+if TYPE_CHECKING:
+    from .iparameter import IParameter
+    from .iplugin import IPlugin
+    from ...models import Send
+    import numpy as np
 
 
 class IMixerChannel(
@@ -39,7 +45,27 @@ class IMixerChannel(
         pass
 
     @abstractmethod
-    def get_parameters(self) -> Dict[str, IParameter]:
+    def get_insert(self, plugin_instance_id: str) -> Optional[IPlugin]:
+        pass
+
+    def insert_chain_view(self) -> InsertChainView:
+        # enabled flags and latencies of the inserts as arrays, for code
+        # that walks the whole chain; implementations may cache it
+        return InsertChainView.from_inserts(self.inserts)
+
+    @abstractmethod
+    def get_parameters(self) -> Mapping[str, IParameter]:
+        # a read-only view, shared between calls
+        pass
+
+    @abstractmethod
+    def get_parameter_handle(self, name: str) -> int:
+        # handles index get_parameter_by_handle and stay valid until the
+        # set of parameters changes (inserts or sends added, moved, removed)
+        pass
+
+    @abstractmethod
+    def get_parameter_by_handle(self, handle: int) -> IParameter:
         pass
 
     @abstractmethod
@@ -54,6 +80,19 @@ class IMixerChannel(
     def move_insert(self, plugin_instance_id: str, new_index: int) -> bool:
         pass
 
+    @abstractmethod
+    def batch_moves(self) -> ContextManager[None]:
+        # moves made inside the block are announced once, as the final
+        # order, when the outermost block exits
+        pass
+
+    @abstractmethod
+    def fill_gain_ramp(self, out: np.ndarray, start_beat: float,
+                       end_beat: float) -> np.ndarray:
+        # writes the fader's linear gain for one block into `out`, one value
+        # per sample, so a processor applies it with a single multiply
+        pass
+
     @abstractmethod
     def add_send(
         self,
@@ -1,10 +1,13 @@
+from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import TYPE_CHECKING, List, Mapping
 from .ilifecycle import ILifecycleAware
 from .iserializable import ISerializable
-from .iparameter import IParameter
-from .imixer import IMixerChannel
-from ...models import AnyClip
+
+if TYPE_CHECKING:
+    from .iparameter import IParameter
+    from .imixer import IMixerChannel
+    from ...models import AnyClip
 
 
 class INode(
@@ -24,7 +27,17 @@ class INode(
         pass
 
     @abstractmethod
-    def get_parameters(self) -> Dict[str, IParameter]:
+    def get_parameters(self) -> Mapping[str, IParameter]:
+        pass
+
+    @abstractmethod
+    def get_parameter_handle(self, name: str) -> int:
+        # handles index get_parameter_by_handle and stay valid until the
+        # set of parameters changes (inserts or sends added, moved, removed)
+        pass
+
+    @abstractmethod
+    def get_parameter_by_handle(self, handle: int) -> IParameter:
         pass
 
     @abstractmethod
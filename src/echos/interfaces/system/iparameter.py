@@ -1,32 +1,43 @@
 # file: src/MuzaiCore/interfaces/system/iparameter.py
+from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Sequence
 from .ilifecycle import ILifecycleAware
-from ...models.parameter_model import AutomationLane
-from ...models.engine_model import TransportContext
+
+if TYPE_CHECKING:
+    from ...models.parameter_model import AutomationLane, ParameterDescriptor
+    from ...models.engine_model import TransportContext
+    import numpy as np
 
 
 class IParameter(ILifecycleAware, ABC):
 
+    # projects hold parameters by the thousand; implementations should
+    # declare __slots__ as well so instances carry no __dict__
+    __slots__ = ()
+
     @property
     @abstractmethod
-    def name(self) -> str:
+    def descriptor(self) -> ParameterDescriptor:
+        # the static half of a parameter; may be shared between parameters
+        # with the same name, range and unit
         pass
 
     @property
-    @abstractmethod
+    def name(self) -> str:
+        return self.descriptor.name
+
+    @property
     def min_value(self) -> Optional[Any]:
-        pass
+        return self.descriptor.min_value
 
     @property
-    @abstractmethod
     def max_value(self) -> Optional[Any]:
-        pass
+        return self.descriptor.max_value
 
     @property
-    @abstractmethod
     def unit(self) -> str:
-        pass
+        return self.descriptor.unit
 
     @property
     @abstractmethod
@@ -41,6 +52,14 @@ class IParameter(ILifecycleAware, ABC):
     def get_value_at(self, context: TransportContext) -> Any:
         pass
 
+    @abstractmethod
+    def get_values_at(self,
+                      beats: np.ndarray,
+                      out: Optional[np.ndarray] = None) -> np.ndarray:
+        # one value per beat in `beats`, written into `out` when given;
+        # lets a backend sample a whole block of automation in one call
+        pass
+
     @property
     @abstractmethod
     def automation_lane(self) -> AutomationLane:
@@ -56,6 +75,18 @@ class IParameter(ILifecycleAware, ABC):
     ):
         pass
 
+    @abstractmethod
+    def add_automation_points_batch(
+        self,
+        beats: Sequence[float],
+        values: Sequence[Any],
+        curve_types: Optional[Sequence[str]] = None,
+        curve_shapes: Optional[Sequence[float]] = None,
+    ):
+        # appends many points and sorts once; prefer it over repeated
+        # add_automation_point calls when recording
+        pass
+
     @abstractmethod
     def remove_automation_point_at(
         self,
@@ -1,7 +1,11 @@
 # file: src/MuzaiCore/interfaces/IPersistence.py
+from __future__ import annotations
 from abc import ABC, abstractmethod
-from ...models.state_model import ProjectState
-from .iproject import IProject
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .iproject import IProject
+    from ...models.state_model import ProjectState
 
 
 class IProjectSerializer(ABC):
@@ -1,10 +1,13 @@
+from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
 from pathlib import Path
 from .ilifecycle import ILifecycleAware
-from .iparameter import IParameter
 from .iserializable import ISerializable
-from ...models import PluginDescriptor, CachedPluginInfo
+
+if TYPE_CHECKING:
+    from .iparameter import IParameter
+    from ...models import PluginDescriptor, CachedPluginInfo
 
 
 class IPlugin(
@@ -28,8 +31,15 @@ class IPlugin(
     def is_enabled(self) -> bool:
         pass
 
+    @property
+    @abstractmethod
+    def latency_samples(self) -> int:
+        # cached; a change is announced with PluginLatencyChanged rather
+        # than discovered by polling
+        pass
+
     @abstractmethod
-    def get_parameters(self) -> Dict[str, IParameter]:
+    def get_parameters(self) -> Mapping[str, IParameter]:
         pass
 
     @abstractmethod
@@ -63,10 +73,34 @@ class IPluginCache(ABC):
     def get_all_cached_paths(self) -> List[Path]:
         pass
 
+    @abstractmethod
+    def get_all_entries(self) -> List[CachedPluginInfo]:
+        pass
+
     @abstractmethod
     def remove_entry(self, path: Path) -> None:
         pass
 
+    @abstractmethod
+    def is_blacklisted(self, path: Path, file_mod_time: float) -> bool:
+        pass
+
+    @abstractmethod
+    def add_to_blacklist(self, path: Path, file_mod_time: float) -> None:
+        pass
+
+    @abstractmethod
+    def remove_from_blacklist(self, path: Path) -> None:
+        pass
+
+    @abstractmethod
+    def get_fingerprint(self) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def set_fingerprint(self, fingerprint: Optional[str]) -> None:
+        pass
+
 
 class IPluginRegistry(ABC):
 
@@ -79,7 +113,7 @@ class IPluginRegistry(ABC):
         pass
 
     @abstractmethod
-    def list_all(self) -> List[PluginDescriptor]:
+    def list_all(self) -> Tuple[PluginDescriptor, ...]:
         pass
 
     @abstractmethod
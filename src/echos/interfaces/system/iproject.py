@@ -1,13 +1,17 @@
 # file: src/MuzaiCore/interfaces/IProject.py
+from __future__ import annotations
 from abc import ABC, abstractmethod
-from .irouter import IRouter
-from .itimeline import IDomainTimeline
-from .icommand import ICommandManager
-from .ievent_bus import IEventBus
+from typing import TYPE_CHECKING
 from .ilifecycle import ILifecycleAware
-from .iengine import IEngineController
 from .iserializable import ISerializable
 
+if TYPE_CHECKING:
+    from .irouter import IRouter
+    from .itimeline import IDomainTimeline
+    from .icommand import ICommandManager
+    from .ievent_bus import IEventBus
+    from .iengine import IEngineController
+
 
 class IProject(
         ILifecycleAware,
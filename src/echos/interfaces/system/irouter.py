@@ -1,10 +1,13 @@
+from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import List
-from .inode import ITrack
+from typing import TYPE_CHECKING, List, Tuple
 from .ilifecycle import ILifecycleAware
-from .ievent_bus import IEventBus
 from .iserializable import ISerializable
-from ...models import Port, Connection
+
+if TYPE_CHECKING:
+    from .inode import ITrack
+    from .ievent_bus import IEventBus
+    from ...models import Port, Connection
 
 
 class IRouter(
@@ -21,6 +24,10 @@ class IRouter(
     def add_node(self, node: ITrack):
         pass
 
+    @abstractmethod
+    def add_nodes(self, nodes: List[ITrack]):
+        pass
+
     @abstractmethod
     def remove_node(self, node_id: str):
         pass
@@ -29,20 +36,41 @@ class IRouter(
     def connect(self, source_port: Port, dest_port: Port) -> bool:
         pass
 
+    @abstractmethod
+    def connect_many(self, connections: List[Connection]) -> List[bool]:
+        pass
+
     @abstractmethod
     def disconnect(self, source_port: Port, dest_port: Port) -> bool:
         pass
 
+    @property
+    @abstractmethod
+    def processing_order_version(self) -> int:
+        pass
+
+    @abstractmethod
+    def get_processing_order(self) -> Tuple[str, ...]:
+        # returns the same tuple until processing_order_version changes
+        pass
+
+    @abstractmethod
+    def get_processing_layers(self) -> Tuple[Tuple[str, ...], ...]:
+        pass
+
     @abstractmethod
-    def get_processing_order(self) -> List[str]:
+    def invalidate_order(self):
         pass
 
     @abstractmethod
     def get_inputs_for_node(self, node_id: str) -> List[Connection]:
+        # answered from a per-node index in O(degree), not by scanning
+        # every connection; callers get their own list
         pass
 
     @abstractmethod
     def get_all_connections(self) -> List[Connection]:
+        # Connection is frozen and hashable; routers may keep it in sets
         pass
 
     def _on_mount(self, event_bus: IEventBus):
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Callable, Dict, Tuple
 from .ilifecycle import ILifecycleAware
 from ...models import event_model
 
@@ -36,6 +37,11 @@ class IMixerSync(ABC):
     def on_insert_moved(self, event: event_model.InsertMoved):
         pass
 
+    @abstractmethod
+    def on_insert_chain_reordered(self,
+                                  event: event_model.InsertChainReordered):
+        pass
+
     @abstractmethod
     def on_plugin_enabled_changed(
         self,
@@ -43,6 +49,11 @@ class IMixerSync(ABC):
     ):
         pass
 
+    @abstractmethod
+    def on_plugin_latency_changed(self,
+                                  event: event_model.PluginLatencyChanged):
+        pass
+
     @abstractmethod
     def on_parameter_changed(
         self,
@@ -50,6 +61,13 @@ class IMixerSync(ABC):
     ):
         pass
 
+    @abstractmethod
+    def on_parameters_changed(
+        self,
+        event: event_model.ParametersChanged,
+    ):
+        pass
+
 
 class ITransportSync(ABC):
 
@@ -102,5 +120,36 @@ class ISyncController(
         ABC,
 ):
 
+    # event type -> name of the handler method. Resolved against the
+    # instance once, so mount and unmount share the same bound handlers;
+    # a backend extends it for events outside the interface
+    _HANDLER_SPECS: Tuple[Tuple[type, str], ...] = (
+        (event_model.ProjectLoaded, "on_project_loaded"),
+        (event_model.ProjectClosed, "on_project_closed"),
+        (event_model.NodeAdded, "on_node_added"),
+        (event_model.NodeRemoved, "on_node_removed"),
+        (event_model.ConnectionAdded, "on_connection_added"),
+        (event_model.ConnectionRemoved, "on_connection_removed"),
+        (event_model.InsertAdded, "on_insert_added"),
+        (event_model.InsertRemoved, "on_insert_removed"),
+        (event_model.InsertMoved, "on_insert_moved"),
+        (event_model.InsertChainReordered, "on_insert_chain_reordered"),
+        (event_model.PluginEnabledChanged, "on_plugin_enabled_changed"),
+        (event_model.PluginLatencyChanged, "on_plugin_latency_changed"),
+        (event_model.ParameterChanged, "on_parameter_changed"),
+        (event_model.ParametersChanged, "on_parameters_changed"),
+        (event_model.TimelineStateChanged, "on_timeline_state_changed"),
+        (event_model.ClipAdded, "on_clip_added"),
+        (event_model.ClipRemoved, "on_clip_removed"),
+        (event_model.NoteAdded, "on_notes_added"),
+        (event_model.NoteRemoved, "on_notes_removed"),
+    )
+
+    def _event_handlers(self) -> Dict[type, Callable]:
+        return {
+            event_type: getattr(self, name)
+            for event_type, name in self._HANDLER_SPECS
+        }
+
     def _get_children(self):
-        return []
+        return ()
@@ -1,10 +1,14 @@
+from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import List
-from .ievent_bus import IEventBus
+from typing import TYPE_CHECKING, List
 from .ilifecycle import ILifecycleAware
 from .iserializable import ISerializable
-from ...models.timeline_model import Tempo, TimeSignature
-from ...models.state_model import TimelineState
+
+if TYPE_CHECKING:
+    import numpy as np
+    from .ievent_bus import IEventBus
+    from ...models.timeline_model import Tempo, TimeSignature, TempoMap
+    from ...models.state_model import TimelineState
 
 
 class IReadonlyTimeline(ABC):
@@ -19,6 +23,13 @@ class IReadonlyTimeline(ABC):
     def time_signatures(self) -> List[TimeSignature]:
         pass
 
+    @property
+    @abstractmethod
+    def tempo_map_version(self) -> int:
+        # bumped on every tempo or meter change, so anything derived from
+        # them can be cached against the version it was computed at
+        pass
+
     @abstractmethod
     def get_tempo_at_beat(self, beat: float) -> float:
         pass
@@ -37,6 +48,11 @@ class IWritableTimeline(ABC):
 
 class IMusicalTimeConverter(ABC):
 
+    @property
+    @abstractmethod
+    def tempo_map(self) -> TempoMap:
+        pass
+
     @abstractmethod
     def beats_to_seconds(self, beats: float) -> float:
         pass
@@ -45,6 +61,14 @@ class IMusicalTimeConverter(ABC):
     def seconds_to_beats(self, seconds: float) -> float:
         pass
 
+    @abstractmethod
+    def beats_to_seconds_array(self, beats: np.ndarray) -> np.ndarray:
+        pass
+
+    @abstractmethod
+    def seconds_to_beats_array(self, seconds: np.ndarray) -> np.ndarray:
+        pass
+
 
 class IDomainTimeline(
         ILifecycleAware,
@@ -1,6 +1,6 @@
 from .api_model import ToolResponse
 from .clip_model import AnyClip, AudioClip, Clip, MIDIClip, Note
-from .engine_model import TransportContext, TransportStatus
+from .engine_model import TransportContext, TransportSnapshot, TransportStatus
 from .event_model import (
     BaseEvent,
     ClipAdded,
@@ -8,6 +8,7 @@ from .event_model import (
     ConnectionAdded,
     ConnectionRemoved,
     InsertAdded,
+    InsertChainReordered,
     InsertMoved,
     InsertRemoved,
     NodeAdded,
@@ -16,7 +17,9 @@ from .event_model import (
     NoteAdded,
     NoteRemoved,
     ParameterChanged,
+    ParametersChanged,
     PluginEnabledChanged,
+    PluginLatencyChanged,
     ProjectClosed,
     ProjectLoaded,
     SendAdded,
@@ -26,17 +29,18 @@ from .event_model import (
     TimelineStateChanged,
 )
 from .lifecycle_model import LifecycleState
-from .mixer_model import Send
+from .mixer_model import InsertChainView, Send
 from .node_model import TrackRecordMode, VCAControlMode
 from .parameter_model import (
     AutomationCurveType,
     AutomationLane,
     AutomationPoint,
+    ParameterDescriptor,
     ParameterType,
 )
 from .plugin_model import CachedPluginInfo, PluginCategory, PluginDescriptor, PluginScanResult
 from .router_model import Connection, Port, PortDirection, PortType
-from .timeline_model import Tempo, TimeSignature
+from .timeline_model import Tempo, TimeSignature, TempoMap
 
 __all__ = [
     # api_model
@@ -49,6 +53,7 @@ __all__ = [
     "Note",
     # engine_model
     "TransportContext",
+    "TransportSnapshot",
     "TransportStatus",
     # event_model
     "BaseEvent",
@@ -57,6 +62,7 @@ __all__ = [
     "ConnectionAdded",
     "ConnectionRemoved",
     "InsertAdded",
+    "InsertChainReordered",
     "InsertMoved",
     "InsertRemoved",
     "NodeAdded",
@@ -65,7 +71,9 @@ __all__ = [
     "NoteAdded",
     "NoteRemoved",
     "ParameterChanged",
+    "ParametersChanged",
     "PluginEnabledChanged",
+    "PluginLatencyChanged",
     "ProjectClosed",
     "ProjectLoaded",
     "SendAdded",
@@ -76,6 +84,7 @@ __all__ = [
     # lifecycle_model
     "LifecycleState",
     # mixer_model
+    "InsertChainView",
     "Send",
     # node_model
     "TrackRecordMode",
@@ -84,6 +93,7 @@ __all__ = [
     "AutomationCurveType",
     "AutomationLane",
     "AutomationPoint",
+    "ParameterDescriptor",
     "ParameterType",
     # plugin_model
     "CachedPluginInfo",
@@ -96,5 +106,6 @@ __all__ = [
     "PortType",
     # timeline_model
     "Tempo",
+    "TempoMap",
     "TimeSignature",
 ]
@@ -2,8 +2,22 @@ from dataclasses import dataclass
 from typing import Optional, Dict, Any
 
 
+def _copy_containers(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _copy_containers(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_containers(item) for item in value]
+    return value
+
+
 @dataclass(frozen=True)
 class ToolResponse:
     status: str
     data: Optional[Dict[str, Any]]
     message: str
+
+    def copy(self) -> 'ToolResponse':
+        # fresh dicts and lists all the way down, so a response kept in a
+        # cache is never changed through one handed to a caller
+        return ToolResponse(self.status, _copy_containers(self.data),
+                            self.message)
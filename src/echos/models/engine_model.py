@@ -8,9 +8,18 @@ class TransportStatus(Enum):
     PAUSED = "paused"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class TransportContext:
     current_beat: float
     sample_rate: int
     block_size: int
     tempo: float
+
+
+@dataclass(frozen=True, slots=True)
+class TransportSnapshot:
+    current_beat: float
+    is_playing: bool
+    sample_rate: int
+    block_size: int
+    status: TransportStatus
@@ -1,7 +1,7 @@
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, List
+from typing import Any, List, Tuple
 
 from .clip_model import Note, AnyClip
 from .router_model import Connection
@@ -10,52 +10,55 @@ from .timeline_model import Tempo, TimeSignature
 from .state_model import TimelineState
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseEvent:
+    # events are slotted: one is built per change and most are dropped as
+    # soon as the handlers return, so there is no per-instance __dict__.
+    # They stay mutable because EventPool refills recycled instances.
 
     timestamp: datetime = field(default_factory=datetime.now)
     event_id: uuid.UUID = field(default_factory=uuid.uuid4)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ProjectLoaded(BaseEvent):
     timeline_state: TimelineState
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ProjectClosed(BaseEvent):
     pass
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class NodeAdded(BaseEvent):
     node_id: str
     node_type: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class NodeRemoved(BaseEvent):
     node_id: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class NodeRenamed:
     node_id: str
     old_name: str
     new_name: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ConnectionAdded(BaseEvent):
     connection: "Connection"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ConnectionRemoved(BaseEvent):
     connection: "Connection"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class InsertAdded(BaseEvent):
     owner_node_id: str
     plugin_instance_id: str
@@ -63,14 +66,14 @@ class InsertAdded(BaseEvent):
     index: int
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class InsertRemoved(BaseEvent):
 
     owner_node_id: str
     plugin_instance_id: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class InsertMoved(BaseEvent):
 
     owner_node_id: str
@@ -79,14 +82,29 @@ class InsertMoved(BaseEvent):
     new_index: int
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
+class InsertChainReordered(BaseEvent):
+    # the chain's full order after a batch of moves, sent once in place of
+    # one InsertMoved per move
+    owner_node_id: str
+    plugin_instance_ids: Tuple[str, ...]
+
+
+@dataclass(kw_only=True, slots=True)
 class PluginEnabledChanged(BaseEvent):
 
     plugin_id: str
     is_enabled: bool
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
+class PluginLatencyChanged(BaseEvent):
+
+    plugin_id: str
+    latency_samples: int
+
+
+@dataclass(kw_only=True, slots=True)
 class ParameterChanged(BaseEvent):
 
     owner_node_id: str
@@ -94,57 +112,66 @@ class ParameterChanged(BaseEvent):
     new_value: Any
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
+class ParametersChanged(BaseEvent):
+    # one flush of batched changes, column by column: entry i is
+    # (owner_node_ids[i], param_names[i], new_values[i])
+    owner_node_ids: Tuple[str, ...]
+    param_names: Tuple[str, ...]
+    new_values: Tuple[Any, ...]
+
+
+@dataclass(kw_only=True, slots=True)
 class TimelineStateChanged(BaseEvent):
     timeline_state: TimelineState
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TempoChanged(BaseEvent):
     tempos: tuple[Tempo]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TimeSignatureChanged(BaseEvent):
     time_signatures: tuple[TimeSignature]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ClipAdded(BaseEvent):
 
     owner_track_id: str
     clip: AnyClip
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ClipRemoved(BaseEvent):
 
     owner_track_id: str
     clip_id: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class NoteAdded(BaseEvent):
 
     owner_clip_id: str
     notes: List[Note]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class NoteRemoved(BaseEvent):
 
     owner_clip_id: str
     notes: List[Note]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SendAdded(BaseEvent):
 
     owner_node_id: str
     send: Send
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SendRemoved(BaseEvent):
 
     owner_node_id: str
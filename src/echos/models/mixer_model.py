@@ -1,4 +1,7 @@
 from dataclasses import dataclass
+from typing import Sequence, Tuple
+
+import numpy as np
 
 
 @dataclass
@@ -9,3 +12,29 @@ class Send:
     level: "IParameter"
     is_post_fader: bool = True
     is_enabled: bool = True
+
+
+@dataclass(slots=True)
+class InsertChainView:
+    # the insert chain column by column, indexed by insert position
+    plugin_ids: Tuple[str, ...]
+    enabled: np.ndarray  # bool
+    latency: np.ndarray  # int32, reported latency in samples
+
+    @classmethod
+    def from_inserts(cls, inserts: Sequence["IPlugin"]) -> "InsertChainView":
+        count = len(inserts)
+        return cls(
+            plugin_ids=tuple(p.plugin_instance_id for p in inserts),
+            enabled=np.fromiter((p.is_enabled for p in inserts),
+                                dtype=np.bool_,
+                                count=count),
+            latency=np.fromiter(
+                (p.descriptor.latency_samples
+                 if p.descriptor.reports_latency else 0 for p in inserts),
+                dtype=np.int32,
+                count=count),
+        )
+
+    def total_latency(self) -> int:
+        return int(self.latency[self.enabled].sum())
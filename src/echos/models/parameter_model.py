@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import Any, List, Optional
 from enum import Enum
 
 
@@ -22,6 +22,15 @@ class AutomationCurveType:
     BEZIER = "bezier"
 
 
+@dataclass(frozen=True, slots=True)
+class ParameterDescriptor:
+
+    name: str
+    min_value: Optional[Any] = None
+    max_value: Optional[Any] = None
+    unit: str = ""
+
+
 @dataclass
 class AutomationPoint:
 
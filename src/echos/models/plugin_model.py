@@ -15,7 +15,7 @@ class PluginCategory(Enum):
     EFFECT = "effect"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PluginDescriptor:
 
     unique_plugin_id: str
@@ -30,7 +30,7 @@ class PluginDescriptor:
     default_parameters: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class CachedPluginInfo:
     descriptor: PluginDescriptor
     file_mod_time: float
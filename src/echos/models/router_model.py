@@ -14,7 +14,7 @@ class PortDirection(Enum):
     OUTPUT = "output"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Port:
 
     port_id: str
@@ -23,7 +23,7 @@ class Port:
     channels: int = 2
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Connection:
 
     source_node_id: str
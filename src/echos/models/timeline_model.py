@@ -1,4 +1,22 @@
+import bisect
 from dataclasses import dataclass
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+def segment_index(starts: Sequence[float], value: float, hint: int = 0) -> int:
+    # index of the segment containing value, given sorted segment starts.
+    # Playback queries move forward, so the hint (the previous answer) or
+    # the segment after it is checked before falling back to a bisect.
+    count = len(starts)
+    if 0 <= hint < count and starts[hint] <= value:
+        following = hint + 1
+        if following == count or value < starts[following]:
+            return hint
+        if following + 1 == count or value < starts[following + 1]:
+            return following
+    return max(bisect.bisect_right(starts, value) - 1, 0)
 
 
 @dataclass
@@ -12,3 +30,56 @@ class TimeSignature:
     beat: float
     numerator: int
     denominator: int
+
+
+@dataclass(frozen=True, slots=True)
+class TempoMap:
+    # parallel tables, one row per tempo segment
+    beats: Tuple[float, ...]
+    seconds: Tuple[float, ...]
+    bpms: Tuple[float, ...]
+
+    @classmethod
+    def from_tempos(cls, tempos: Sequence[Tempo]) -> "TempoMap":
+        # piecewise-constant tempo: the second at which each segment starts
+        # is integrated once here, so conversions are a bisect away
+        beats = [t.beat for t in tempos]
+        bpms = [t.bpm for t in tempos]
+        seconds = [0.0]
+        for i in range(1, len(beats)):
+            seconds.append(seconds[-1] +
+                           (beats[i] - beats[i - 1]) * 60.0 / bpms[i - 1])
+        return cls(beats=tuple(beats),
+                   seconds=tuple(seconds),
+                   bpms=tuple(bpms))
+
+    def segment_index(self, beat: float, hint: int = 0) -> int:
+        return segment_index(self.beats, beat, hint)
+
+    def beats_to_seconds(self, target_beats: float) -> float:
+        if target_beats < 0:
+            return 0.0
+        idx = bisect.bisect_right(self.beats, target_beats) - 1
+        return self.seconds[idx] + (target_beats -
+                                    self.beats[idx]) * 60.0 / self.bpms[idx]
+
+    def seconds_to_beats(self, target_seconds: float) -> float:
+        if target_seconds < 0:
+            return 0.0
+        idx = bisect.bisect_right(self.seconds, target_seconds) - 1
+        return self.beats[idx] + (target_seconds -
+                                  self.seconds[idx]) * self.bpms[idx] / 60.0
+
+    def beats_to_seconds_array(self, beats: np.ndarray) -> np.ndarray:
+        beats = np.maximum(np.asarray(beats, dtype=np.float64), 0.0)
+        starts = np.asarray(self.beats)
+        idx = np.searchsorted(starts, beats, side="right") - 1
+        return np.asarray(self.seconds)[idx] + (beats - starts[idx]) * (
+            60.0 / np.asarray(self.bpms)[idx])
+
+    def seconds_to_beats_array(self, seconds: np.ndarray) -> np.ndarray:
+        seconds = np.maximum(np.asarray(seconds, dtype=np.float64), 0.0)
+        starts = np.asarray(self.seconds)
+        idx = np.searchsorted(starts, seconds, side="right") - 1
+        return np.asarray(self.beats)[idx] + (seconds - starts[idx]) * (
+            np.asarray(self.bpms)[idx] / 60.0)
@@ -1,5 +1,5 @@
 # file: src/MuzaiCore/services/editing_service.py
-from typing import Any, List, Dict
+from typing import Any, List, Dict, Mapping, Union
 from ..agent.tools import tool
 from ..interfaces import IDAWManager, IEditingService, ITrack
 from ..models import ToolResponse, Note, MIDIClip
@@ -135,6 +135,15 @@ class EditingService(IEditingService):
                     {"pitch": 60, "velocity": 100, "start_beat": 0.0, "duration_beats": 1.0},
                     {"pitch": 64, "velocity": 100, "start_beat": 1.0, "duration_beats": 1.0}
                 ]
+            )''', '''add_notes_to_clip(
+                project_id='...',
+                clip_id='...',
+                notes={
+                    "pitch": [60, 64],
+                    "velocity": [100, 100],
+                    "start_beat": [0.0, 1.0],
+                    "duration_beats": [1.0, 1.0]
+                }
             )'''
           ])
     def add_notes_to_clip(
@@ -142,7 +151,7 @@ class EditingService(IEditingService):
         project_id: str,
         track_id: str,
         clip_id: str,
-        notes: List[Dict[str, Any]],
+        notes: Union[List[Dict[str, Any]], Dict[str, List[Any]]],
     ) -> ToolResponse:
 
         project = self._manager.get_project(project_id)
@@ -167,16 +176,25 @@ class EditingService(IEditingService):
                                 f"Clip '{clip_id}' is not a MIDI clip.")
 
         try:
-            notes_to_add = []
-            for n in notes:
-                if isinstance(n, Note):
-                    notes_to_add.append(n)
-                elif isinstance(n, dict):
-                    notes_to_add.append(Note(**n))
-                else:
-                    raise ValueError()
-
-        except TypeError as e:
+            if isinstance(notes, Mapping):
+                # column layout, as Track.to_dict writes it: one list per
+                # Note field, rows aligned by index
+                names = tuple(notes)
+                notes_to_add = [
+                    Note(**dict(zip(names, row)))
+                    for row in zip(*notes.values(), strict=True)
+                ]
+            else:
+                notes_to_add = []
+                for n in notes:
+                    if isinstance(n, Note):
+                        notes_to_add.append(n)
+                    elif isinstance(n, dict):
+                        notes_to_add.append(Note(**n))
+                    else:
+                        raise ValueError(f"unsupported note {n!r}")
+
+        except (TypeError, ValueError) as e:
             return ToolResponse("error", None, f"Invalid note data: {e}")
 
         from echos.core.history.commands.editing_commands import AddNotesToClipCommand
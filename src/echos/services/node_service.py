@@ -1,8 +1,12 @@
-from typing import Optional
+from typing import List, Optional, Tuple
 from ..agent.tools import tool
 from ..interfaces import IDAWManager, INodeService
 from ..models import ToolResponse
-from ..core.history.commands.node_commands import CreateTrackCommand, RenameNodeCommand
+from ..core.history.commands.node_commands import (
+    CreateTrackCommand,
+    RenameNodeCommand,
+    ReorderInsertPluginsCommand,
+)
 
 
 class NodeService(INodeService):
@@ -31,7 +35,7 @@ class NodeService(INodeService):
         project.command_manager.execute_command(command)
 
         if command.is_executed:
-            track = command._created_track
+            track = command.created_track
             return ToolResponse(
                 "success", {
                     "node_id": track.node_id,
@@ -88,6 +92,57 @@ class NodeService(INodeService):
                                   "BusTrack",
                                   track_id=track_id)
 
+    _TRACK_TYPES = {
+        "instrument": "InstrumentTrack",
+        "audio": "AudioTrack",
+        "bus": "BusTrack",
+    }
+
+    @tool(category="node",
+          description="Create several tracks as one undoable operation",
+          returns="Created tracks information",
+          examples=[
+              "create_tracks(project_id='...', specs=[('instrument', 'Bass'), "
+              "('audio', 'Vocals'), ('bus', 'Reverb Bus')])"
+          ])
+    def create_tracks(self, project_id: str,
+                      specs: List[Tuple[str, str]]) -> ToolResponse:
+        project = self._manager.get_project(project_id)
+        if not project:
+            return ToolResponse("error", None,
+                                f"Project '{project_id}' not found.")
+
+        for track_kind, _ in specs:
+            if track_kind not in self._TRACK_TYPES:
+                return ToolResponse("error", None,
+                                    f"Unsupported track type '{track_kind}'.")
+
+        node_factory = self._manager.node_factory
+        command_manager = project.command_manager
+        command_manager.begin_macro_command(f"Create {len(specs)} tracks")
+        created = []
+        for track_kind, name in specs:
+            command = CreateTrackCommand(
+                router=project.router,
+                node_factory=node_factory,
+                track_type=self._TRACK_TYPES[track_kind],
+                name=name,
+                track_id=None)
+            command_manager.execute_command(command)
+            if not command.is_executed:
+                command_manager.cancel_macro_command()
+                return ToolResponse("error", None, command.error)
+            track = command.created_track
+            created.append({
+                "node_id": track.node_id,
+                "name": track.name,
+                "type": track.node_type
+            })
+        command_manager.end_macro_command()
+
+        return ToolResponse("success", {"tracks": created},
+                            f"Created {len(created)} tracks.")
+
     @tool(category="node",
           description="Create a VCA track for volume control automation",
           returns="Created track information")
@@ -178,6 +233,37 @@ class NodeService(INodeService):
         return ToolResponse("error", None,
                             "Remove plugin not implemented via service yet")
 
+    @tool(category="plugin",
+          description="Reorder the plugins in a track's effect chain",
+          returns="New plugin order",
+          examples=[
+              "reorder_insert_plugins(project_id='...', target_node_id='...', "
+              "plugin_instance_ids=['...', '...'])"
+          ])
+    def reorder_insert_plugins(
+            self, project_id: str, target_node_id: str,
+            plugin_instance_ids: List[str]) -> ToolResponse:
+        project = self._manager.get_project(project_id)
+        if not project:
+            return ToolResponse("error", None,
+                                f"Project '{project_id}' not found.")
+
+        target_node = project.router.nodes.get(target_node_id)
+        if not target_node:
+            return ToolResponse(
+                "error", None,
+                f"Node '{target_node_id}' not found in project '{project_id}'."
+            )
+
+        command = ReorderInsertPluginsCommand(target_node,
+                                              plugin_instance_ids)
+        project.command_manager.execute_command(command)
+        if command.is_executed:
+            return ToolResponse(
+                "success", {"plugin_instance_ids": list(plugin_instance_ids)},
+                command.description)
+        return ToolResponse("error", None, command.error)
+
     @tool(category="track",
           description="List all tracks in the project",
           returns="List of tracks with their information",
@@ -1,4 +1,5 @@
 # file: src/MuzaiCore/services/query_service.py
+from dataclasses import asdict
 from ..interfaces import IDAWManager, IQueryService, INode
 from ..models import ToolResponse
 
@@ -35,7 +36,7 @@ class QueryService(IQueryService):
             project.get_statistics(),
             "nodes": [node_to_dict(n) for n in project.get_all_nodes()],
             "connections":
-            [c.__dict__ for c in project.router.get_all_connections()]
+            [asdict(c) for c in project.router.get_all_connections()]
         }
         return ToolResponse("success", tree, "Full project tree retrieved.")
 
@@ -1,8 +1,14 @@
 # file: src/MuzaiCore/services/system_service.py
-from typing import Optional
+from typing import Dict, Optional, Tuple
 import dataclasses
 from ..interfaces import IDAWManager, ISystemService, IPluginRegistry
-from ..models import ToolResponse
+from ..models import ToolResponse, PluginDescriptor, PluginCategory
+
+
+def _category_of(descriptor: PluginDescriptor) -> str:
+    if descriptor.is_instrument:
+        return PluginCategory.INSTRUMENT.value
+    return PluginCategory.EFFECT.value
 
 
 class SystemService(ISystemService):
@@ -10,35 +16,49 @@ class SystemService(ISystemService):
     def __init__(self, manager: IDAWManager):
         self._manager = manager
         self._plugin_registry: IPluginRegistry = manager.plugin_registry
+        # responses built from the registry, keyed by request and tagged
+        # with the registry tuple / descriptor they were built from. The
+        # registry replaces those objects whenever its contents change.
+        self._plugin_list_cache: Dict[Optional[str],
+                                      Tuple[tuple, ToolResponse]] = {}
+        self._plugin_details_cache: Dict[str, Tuple[PluginDescriptor,
+                                                    ToolResponse]] = {}
 
     def list_available_plugins(self,
                                category: Optional[str] = None) -> ToolResponse:
-        plugins = self._plugin_registry.list_plugins()
-        if category:
-            plugins = [p for p in plugins if p.category.value == category]
+        plugins = self._plugin_registry.list_all()
+        cached = self._plugin_list_cache.get(category)
+        if cached is not None and cached[0] is plugins:
+            return cached[1].copy()
+
         data = [{
             "id": p.unique_plugin_id,
             "name": p.name,
             "vendor": p.vendor,
-            "category": p.category.value
-        } for p in plugins]
-        return ToolResponse("success", {"plugins": data},
-                            f"Found {len(data)} available plugins.")
+            "category": _category_of(p)
+        } for p in plugins if not category or _category_of(p) == category]
+        response = ToolResponse("success", {"plugins": data},
+                                f"Found {len(data)} available plugins.")
+        self._plugin_list_cache[category] = (plugins, response)
+        return response.copy()
 
     def get_plugin_details(self, plugin_unique_id: str) -> ToolResponse:
-        descriptor = self._plugin_registry.get_plugin_descriptor(
-            plugin_unique_id)
+        descriptor = self._plugin_registry.find_by_id(plugin_unique_id)
         if not descriptor:
             return ToolResponse("error", None,
                                 f"Plugin '{plugin_unique_id}' not found.")
+        cached = self._plugin_details_cache.get(plugin_unique_id)
+        if cached is not None and cached[0] is descriptor:
+            return cached[1].copy()
 
         # Dataclasses.asdict is useful for serialization
         data = dataclasses.asdict(descriptor)
-        # Convert enum to string for clean JSON output
-        data['category'] = descriptor.category.value
-        return ToolResponse(
+        data['category'] = _category_of(descriptor)
+        response = ToolResponse(
             "success", data,
             f"Details for plugin '{descriptor.name}' retrieved.")
+        self._plugin_details_cache[plugin_unique_id] = (descriptor, response)
+        return response.copy()
 
     def get_system_info(self) -> ToolResponse:
         info = {
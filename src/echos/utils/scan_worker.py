@@ -2,9 +2,9 @@
 插件扫描工作脚本 - 在隔离的子进程中运行
 此脚本会被主进程调用来安全地扫描单个插件
 """
+import os
 import sys
 import json
-from pathlib import Path
 from typing import Dict, List, Any
 
 
@@ -64,20 +64,25 @@ def scan_plugin(plugin_path: str) -> dict:
 
     import pedalboard as pb
 
-    path = Path(plugin_path)
+    plugin_format = os.path.splitext(plugin_path)[1]
 
     plugin = pb.load_plugin(plugin_path)
 
-    unique_id = f"{plugin.manufacturer_name}::{plugin.name}::{path.suffix}"
+    unique_id = f"{plugin.manufacturer_name}::{plugin.name}::{plugin_format}"
 
     parameters = {}
     for p_name, p in plugin.parameters.items():
         try:
+            # each attribute read crosses into the plugin host, so fetch once
+            p_range = getattr(p, 'range', None)
+            if p_range is not None:
+                p_min, p_max = float(p_range[0]), float(p_range[1])
+            else:
+                p_min, p_max = 0.0, 1.0
             parameters[p_name] = {
-                "min": float(p.range[0]) if hasattr(p, 'range') else 0.0,
-                "max": float(p.range[1]) if hasattr(p, 'range') else 1.0,
-                "default":
-                float(p.raw_value) if hasattr(p, 'raw_value') else 0.0
+                "min": p_min,
+                "max": p_max,
+                "default": float(getattr(p, 'raw_value', 0.0))
             }
         except (AttributeError, TypeError, ValueError):
             parameters[p_name] = {"min": 0.0, "max": 1.0, "default": 0.0}
@@ -90,7 +95,7 @@ def scan_plugin(plugin_path: str) -> dict:
         "vendor": plugin.manufacturer_name,
         "path": plugin_path,
         "is_instrument": plugin.is_instrument,
-        "plugin_format": path.suffix,
+        "plugin_format": plugin_format,
         "reports_latency": reports_latency,
         "latency_samples": latency_samples,
         "default_parameters": parameters
@@ -0,0 +1,70 @@
+from echos.core import DAWManager
+from echos.backends.pedalboard import (PedalboardEngineFactory,
+                                       PedalboardNodeFactory)
+from echos.services import EditingService, NodeService
+
+
+class TestAddNotesToClip:
+
+    def setup_method(self):
+        self.manager = DAWManager(
+            project_serializer=None,
+            plugin_registry=None,
+            engine_factory=PedalboardEngineFactory(),
+            node_factory=PedalboardNodeFactory(),
+        )
+        self.project = self.manager.create_project("Test Project")
+        self.service = EditingService(self.manager)
+
+        result = NodeService(self.manager).create_instrument_track(
+            self.project.project_id, "Piano")
+        self.track_id = result.data["node_id"]
+        result = self.service.create_midi_clip(self.project.project_id,
+                                               self.track_id,
+                                               start_beat=0.0,
+                                               duration_beats=4.0)
+        self.clip_id = result.data["clip_id"]
+        self.clip = self.project.router.nodes[self.track_id].clips[0]
+
+    def _add(self, notes):
+        return self.service.add_notes_to_clip(self.project.project_id,
+                                              self.track_id, self.clip_id,
+                                              notes)
+
+    def _note_fields(self):
+        return sorted((n.pitch, n.velocity, n.start_beat, n.duration_beats)
+                      for n in self.clip.notes)
+
+    def test_columns_and_rows_add_the_same_notes(self):
+        rows = [{
+            "pitch": 60,
+            "velocity": 100,
+            "start_beat": 0.0,
+            "duration_beats": 1.0
+        }, {
+            "pitch": 64,
+            "velocity": 90,
+            "start_beat": 1.0,
+            "duration_beats": 0.5
+        }]
+        columns = {key: [row[key] for row in rows] for key in rows[0]}
+
+        result = self._add(columns)
+        assert result.status == "success"
+        assert result.data["notes_added"] == 2
+        from_columns = self._note_fields()
+
+        self.clip.notes.clear()
+        assert self._add(rows).status == "success"
+        assert self._note_fields() == from_columns
+
+    def test_ragged_columns_are_rejected(self):
+        result = self._add({
+            "pitch": [60, 62, 64],
+            "velocity": [100, 100],
+            "start_beat": [0.0, 1.0, 2.0],
+            "duration_beats": [1.0, 1.0, 1.0],
+        })
+
+        assert result.status == "error"
+        assert len(self.clip.notes) == 0
@@ -0,0 +1,123 @@
+import dataclasses
+
+import pedalboard as pb
+import pytest
+
+from echos.core import EventBus
+from echos.core.plugin import Plugin
+from echos.backends.pedalboard import PedalboardEngine
+from echos.backends.pedalboard.messages import SetParameter
+from echos.models import PluginDescriptor, TransportStatus
+
+
+class TestStoppedEngineMessages:
+
+    def setup_method(self):
+        self.engine = PedalboardEngine(sample_rate=48000, block_size=512)
+        self.engine._render_graph.add_node("track_1", "AudioTrack")
+        self.node = self.engine._render_graph.get_node("track_1")
+
+    def test_edits_apply_without_audio_stream(self):
+        self.engine.post_command(
+            SetParameter(owner_node_id="track_1",
+                         parameter_path="mixer.pan",
+                         value=0.5))
+
+        assert self.node.pan == 0.5
+        assert len(self.engine._rt_message_queue) == 0
+
+    def test_edits_beyond_ring_capacity_are_not_dropped(self):
+        capacity = self.engine._rt_message_queue._mask + 1
+        for i in range(capacity + 10):
+            self.engine.post_command(
+                SetParameter(owner_node_id="track_1",
+                             parameter_path="mixer.pan",
+                             value=i / (capacity + 10)))
+
+        stats = self.engine.get_performance_stats()
+        assert stats['dropped_rt_messages'] == 0
+        assert self.node.pan == (capacity + 9) / (capacity + 10)
+
+
+class TestTransportSnapshot:
+
+    def setup_method(self):
+        self.engine = PedalboardEngine(sample_rate=48000, block_size=512)
+
+    def _assert_matches_properties(self, snapshot):
+        assert snapshot.current_beat == self.engine.current_beat
+        assert snapshot.is_playing == self.engine.is_playing
+        assert snapshot.sample_rate == self.engine.sample_rate
+        assert snapshot.block_size == self.engine.block_size
+        assert snapshot.status == self.engine.transport_status
+
+    def test_stopped_snapshot(self):
+        snapshot = self.engine.transport_snapshot()
+
+        self._assert_matches_properties(snapshot)
+        assert snapshot.status == TransportStatus.STOPPED
+        assert not snapshot.is_playing
+
+    def test_snapshot_follows_transport(self):
+        self.engine.seek(6.5)
+        self._assert_matches_properties(self.engine.transport_snapshot())
+
+        self.engine._status = TransportStatus.PLAYING
+        self.engine._process_audio_block()
+        snapshot = self.engine.transport_snapshot()
+        self._assert_matches_properties(snapshot)
+        assert snapshot.is_playing
+        assert snapshot.current_beat > 6.5
+
+        self.engine.pause()
+        self._assert_matches_properties(self.engine.transport_snapshot())
+
+    def test_snapshot_is_immutable(self):
+        snapshot = self.engine.transport_snapshot()
+        self.engine.seek(4.0)
+
+        assert snapshot.current_beat == 0.0
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.current_beat = 1.0
+
+
+class _Compressor(pb.Compressor):
+    name = "compressor"
+
+
+class TestPluginLatencySync:
+
+    def setup_method(self):
+        self.event_bus = EventBus()
+        self.engine = PedalboardEngine(sample_rate=48000, block_size=512)
+        self.engine.sync_controller.mount(self.event_bus)
+
+        graph = self.engine._render_graph
+        graph.add_node("track_1", "AudioTrack")
+        self.node = graph.get_node("track_1")
+        self.node.add_plugin(_Compressor(), "comp", 0)
+        graph._plugin_to_node_map["comp"] = "track_1"
+
+        descriptor = PluginDescriptor(unique_plugin_id="comp",
+                                      name="Compressor",
+                                      vendor="test",
+                                      path="/plugins/comp",
+                                      is_instrument=False,
+                                      plugin_format="vst3",
+                                      latency_samples=256)
+        self.plugin = Plugin(descriptor, self.event_bus,
+                             plugin_instance_id="comp")
+        self.plugin.mount(self.event_bus)
+
+    def teardown_method(self):
+        self.engine.sync_controller.unmount()
+
+    def test_latency_changes_reach_the_render_graph(self):
+        self.plugin.set_enabled(False)
+        self.engine.refresh()
+        assert self.node.latency_samples == 0
+
+        self.plugin.set_enabled(True)
+        self.engine.refresh()
+        assert self.node.latency_samples == 256
+        assert self.engine._render_graph.get_total_latency() == 256
@@ -0,0 +1,83 @@
+from types import SimpleNamespace
+
+from echos.facade import DAWFacade
+from echos.models import PluginDescriptor
+from echos.services import NodeService, SystemService
+
+
+class _Registry:
+
+    def __init__(self, descriptors):
+        self.descriptors = tuple(descriptors)
+
+    def list_all(self):
+        return self.descriptors
+
+    def find_by_id(self, unique_plugin_id):
+        for descriptor in self.descriptors:
+            if descriptor.unique_plugin_id == unique_plugin_id:
+                return descriptor
+        return None
+
+
+def _descriptor(unique_id, is_instrument=False):
+    return PluginDescriptor(unique_plugin_id=unique_id,
+                            name=unique_id,
+                            vendor="test",
+                            path=f"/plugins/{unique_id}",
+                            is_instrument=is_instrument,
+                            plugin_format="vst3",
+                            default_parameters={"gain": 0.0})
+
+
+class TestCachedResponses:
+
+    def setup_method(self):
+        self.registry = _Registry(
+            [_descriptor("synth", is_instrument=True),
+             _descriptor("delay")])
+        manager = SimpleNamespace(plugin_registry=self.registry)
+        self.system = SystemService(manager)
+        self.facade = DAWFacade(manager, {
+            "system": self.system,
+            "node": NodeService(manager),
+        })
+
+    def test_help_is_repeatable_after_caller_mutation(self):
+        first = self.facade.get_help("node")
+        first.data["methods"].clear()
+        first.data["category"] = "changed"
+
+        second = self.facade.get_help("node")
+        assert second.data["category"] == "node"
+        assert any(
+            m.startswith("create_tracks(") for m in second.data["methods"])
+
+    def test_plugin_list_is_repeatable_after_caller_mutation(self):
+        first = self.system.list_available_plugins()
+        first.data["plugins"][0]["name"] = "changed"
+        first.data["plugins"].pop()
+
+        second = self.system.list_available_plugins()
+        assert [p["name"] for p in second.data["plugins"]] == [
+            "synth", "delay"
+        ]
+
+    def test_plugin_list_follows_registry_changes(self):
+        self.system.list_available_plugins()
+        self.registry.descriptors = self.registry.descriptors[:1]
+
+        result = self.system.list_available_plugins()
+        assert [p["id"] for p in result.data["plugins"]] == ["synth"]
+
+    def test_plugin_list_filters_by_category(self):
+        result = self.system.list_available_plugins("effect")
+        assert [p["id"] for p in result.data["plugins"]] == ["delay"]
+
+    def test_plugin_details_are_repeatable_after_caller_mutation(self):
+        first = self.system.get_plugin_details("delay")
+        first.data["default_parameters"]["gain"] = 6.0
+
+        second = self.system.get_plugin_details("delay")
+        assert second.data["default_parameters"] == {"gain": 0.0}
+        assert second.data["category"] == "effect"
@@ -0,0 +1,56 @@
+from echos.backends.common.message_queue import RealTimeMessageQueue
+
+
+class TestRealTimeMessageQueue:
+
+    def _drain(self, queue):
+        drained = []
+        queue.drain(drained.append)
+        return drained
+
+    def test_capacity_rounds_up_to_power_of_two(self):
+        queue = RealTimeMessageQueue(capacity=5)
+        for i in range(8):
+            queue.push(i)
+        assert len(queue) == 8
+        assert queue.get_dropped_count() == 0
+
+    def test_fifo_across_wrap(self):
+        queue = RealTimeMessageQueue(capacity=4)
+        for round_start in range(0, 40, 3):
+            batch = list(range(round_start, round_start + 3))
+            for item in batch:
+                queue.push(item)
+            assert self._drain(queue) == batch
+        assert queue.is_empty()
+
+    def test_full_queue_drops_newest_and_counts(self):
+        queue = RealTimeMessageQueue(capacity=4)
+        for i in range(6):
+            queue.push(i)
+
+        assert queue.get_dropped_count() == 2
+        assert self._drain(queue) == [0, 1, 2, 3]
+
+        queue.push(6)
+        assert self._drain(queue) == [6]
+
+    def test_drain_releases_slots(self):
+        queue = RealTimeMessageQueue(capacity=4)
+        queue.push(object())
+        self._drain(queue)
+        assert all(slot is None for slot in queue._slots)
+
+    def test_message_pushed_by_handler_is_kept(self):
+        queue = RealTimeMessageQueue(capacity=4)
+        drained = []
+
+        def handler(message):
+            drained.append(message)
+            if message == 0:
+                queue.push(1)
+
+        queue.push(0)
+        queue.drain(handler)
+        assert drained == [0]
+        assert self._drain(queue) == [1]
@@ -0,0 +1,277 @@
+import numpy as np
+import pedalboard as pb
+import pytest
+
+from echos.core import EventBus
+from echos.core.mixer import MixerChannel
+from echos.core.plugin import Plugin
+from echos.core.history.commands.node_commands import (
+    ReorderInsertPluginsCommand)
+from echos.backends.pedalboard import (PedalboardEngine,
+                                       PedalboardNodeFactory)
+from echos.models import PluginDescriptor, TransportContext, event_model
+from echos.models.parameter_model import AutomationCurveType
+
+
+class _Gain(pb.Gain):
+    name = "gain"
+
+
+class _Delay(pb.Delay):
+    name = "delay"
+
+
+class _Reverb(pb.Reverb):
+    name = "reverb"
+
+
+class _Synth(pb.Gain):
+    name = "synth"
+    is_instrument = True
+
+
+def _descriptor(unique_id: str, is_instrument: bool = False):
+    return PluginDescriptor(unique_plugin_id=unique_id,
+                            name=unique_id,
+                            vendor="test",
+                            path=f"/plugins/{unique_id}",
+                            is_instrument=is_instrument,
+                            plugin_format="vst3")
+
+
+class TestInsertReorder:
+
+    def setup_method(self):
+        self.event_bus = EventBus()
+        self.engine = PedalboardEngine(sample_rate=48000, block_size=512)
+        self.engine.sync_controller.mount(self.event_bus)
+
+        self.mixer = MixerChannel("track_1")
+        self.plugins = [
+            Plugin(_descriptor(name), None, plugin_instance_id=name)
+            for name in ("gain", "delay", "reverb")
+        ]
+        for plugin in self.plugins:
+            self.mixer.add_insert(plugin)
+
+        graph = self.engine._render_graph
+        graph.add_node("track_1", "AudioTrack")
+        self.node = graph.get_node("track_1")
+        self.instances = {
+            "gain": _Gain(),
+            "delay": _Delay(),
+            "reverb": _Reverb(),
+        }
+        for index, name in enumerate(("gain", "delay", "reverb")):
+            self.node.add_plugin(self.instances[name], name, index)
+
+        self.events = []
+        self.event_bus.subscribe(event_model.InsertMoved, self.events.append)
+        self.event_bus.subscribe(event_model.InsertChainReordered,
+                                 self.events.append)
+        self.mixer.mount(self.event_bus)
+
+    def teardown_method(self):
+        self.engine.sync_controller.unmount()
+
+    def _pedalboard_order(self):
+        by_instance = {id(p): name for name, p in self.instances.items()}
+        return [by_instance[id(p)] for p in self.node.pedalboard]
+
+    def test_batched_moves_reorder_pedalboard(self):
+        with self.mixer.batch_moves():
+            self.mixer.move_insert("reverb", 0)
+            self.mixer.move_insert("gain", 2)
+
+        assert len(self.events) == 1
+        assert isinstance(self.events[0], event_model.InsertChainReordered)
+        assert self.events[0].plugin_instance_ids == ("reverb", "delay",
+                                                      "gain")
+
+        self.engine.refresh()
+        assert self._pedalboard_order() == ["reverb", "delay", "gain"]
+        assert self.engine._render_graph._stats['plugins_moved'] == 1
+
+    def test_unbatched_move_publishes_insert_moved(self):
+        self.mixer.move_insert("reverb", 0)
+
+        assert len(self.events) == 1
+        assert isinstance(self.events[0], event_model.InsertMoved)
+        self.engine.refresh()
+        assert self._pedalboard_order() == ["reverb", "gain", "delay"]
+
+    def test_remove_insert_removes_plugin_from_pedalboard(self):
+        assert self.mixer.remove_insert("delay")
+
+        assert [p.plugin_instance_id
+                for p in self.mixer.inserts] == ["gain", "reverb"]
+        self.engine.refresh()
+        assert self._pedalboard_order() == ["gain", "reverb"]
+        assert "delay" not in self.node.plugin_instance_map
+
+    def test_instrument_track_reorder_skips_instrument(self):
+        graph = self.engine._render_graph
+        graph.add_node("track_2", "InstrumentTrack")
+        node = graph.get_node("track_2")
+        instrument = _Synth()
+        node.add_plugin(instrument, "synth", 0)
+        node.add_plugin(self.instances["gain"], "gain", 1)
+        node.add_plugin(self.instances["delay"], "delay", 2)
+
+        graph.reorder_plugins_in_node("track_2", ["synth", "delay", "gain"])
+
+        assert node.instrument is instrument
+        assert list(node.pedalboard) == [
+            self.instances["delay"], self.instances["gain"]
+        ]
+
+
+class TestReorderInsertPluginsCommand:
+
+    def setup_method(self):
+        self.track = PedalboardNodeFactory().create_audio_track("Vocals")
+        for name in ("gain", "delay", "reverb"):
+            self.track.mixer_channel.add_insert(
+                Plugin(_descriptor(name), None, plugin_instance_id=name))
+
+    def _order(self):
+        return [p.plugin_instance_id for p in self.track.mixer_channel.inserts]
+
+    def test_execute_and_undo(self):
+        command = ReorderInsertPluginsCommand(self.track,
+                                              ["reverb", "gain", "delay"])
+        assert command.execute()
+        assert self._order() == ["reverb", "gain", "delay"]
+
+        assert command.undo()
+        assert self._order() == ["gain", "delay", "reverb"]
+
+    def test_rejects_incomplete_order(self):
+        command = ReorderInsertPluginsCommand(self.track, ["reverb", "gain"])
+        assert not command.execute()
+        assert self._order() == ["gain", "delay", "reverb"]
+
+
+class TestFillGainRamp:
+
+    def setup_method(self):
+        self.mixer = MixerChannel("track_1")
+
+    def test_automated_gain_matches_scalar_reads(self):
+        volume = self.mixer.volume
+        volume.add_automation_point(0.0, -100.0)
+        volume.add_automation_point(1.0, -6.0)
+        volume.add_automation_point(2.0, 6.0,
+                                    AutomationCurveType.EXPONENTIAL, 0.5)
+        out = np.empty(512, dtype=np.float32)
+
+        self.mixer.fill_gain_ramp(out, 0.5, 2.5)
+
+        beats = np.linspace(0.5, 2.5, 512, endpoint=False)
+        expected = []
+        for beat in beats:
+            db = volume.get_value_at(
+                TransportContext(current_beat=float(beat),
+                                 sample_rate=48000,
+                                 block_size=512,
+                                 tempo=120.0))
+            expected.append(10**(db / 20.0) if db > -96 else 0.0)
+        np.testing.assert_allclose(out, expected, rtol=1e-6)
+
+    def test_fader_change_glides_over_one_block(self):
+        out = np.empty(64, dtype=np.float32)
+        self.mixer.fill_gain_ramp(out, 0.0, 1.0)
+        np.testing.assert_array_equal(out, np.ones(64, dtype=np.float32))
+
+        self.mixer.volume.set_value(-6.0)
+        self.mixer.fill_gain_ramp(out, 1.0, 2.0)
+        target = 10**(-6.0 / 20.0)
+        assert np.all(np.diff(out) < 0)
+        assert out[-1] == pytest.approx(target)
+
+        self.mixer.fill_gain_ramp(out, 2.0, 3.0)
+        np.testing.assert_allclose(out, np.full(64, target), rtol=1e-6)
+
+    def test_silent_fader_is_zero_gain(self):
+        self.mixer.volume.set_value(-100.0)
+        out = np.empty(16, dtype=np.float32)
+        self.mixer.fill_gain_ramp(out, 0.0, 1.0)
+        np.testing.assert_array_equal(out, np.zeros(16, dtype=np.float32))
+
+
+class TestParameterHandles:
+
+    def setup_method(self):
+        self.mixer = MixerChannel("track_1")
+        self.mixer.add_insert(
+            Plugin(PluginDescriptor(unique_plugin_id="comp",
+                                    name="Compressor",
+                                    vendor="test",
+                                    path="/plugins/comp",
+                                    is_instrument=False,
+                                    plugin_format="vst3",
+                                    default_parameters={"ratio": 2.0}),
+                   None,
+                   plugin_instance_id="comp"))
+
+    def test_handles_resolve_to_named_parameters(self):
+        parameters = self.mixer.get_parameters()
+        assert "insert_0_ratio" in parameters
+        for name, parameter in parameters.items():
+            handle = self.mixer.get_parameter_handle(name)
+            assert self.mixer.get_parameter_by_handle(handle) is parameter
+
+    def test_handles_follow_structure_changes(self):
+        self.mixer.remove_insert("comp")
+        assert "insert_0_ratio" not in self.mixer.get_parameters()
+        with pytest.raises(KeyError):
+            self.mixer.get_parameter_handle("insert_0_ratio")
+
+    def test_set_parameter_by_name(self):
+        self.mixer.set_parameter("insert_0_ratio", 4.0)
+        assert self.mixer.get_parameters()["insert_0_ratio"].value == 4.0
+
+    def test_track_delegates_to_mixer(self):
+        track = PedalboardNodeFactory().create_audio_track("Vocals")
+        handle = track.get_parameter_handle("volume")
+        assert track.get_parameter_by_handle(handle) is (
+            track.mixer_channel.volume)
+
+
+class TestInsertChainView:
+
+    def setup_method(self):
+        self.event_bus = EventBus()
+        self.mixer = MixerChannel("track_1")
+        self.plugins = [
+            Plugin(_descriptor(name), self.event_bus, plugin_instance_id=name)
+            for name in ("gain", "delay", "reverb")
+        ]
+        for plugin in self.plugins:
+            self.mixer.add_insert(plugin)
+
+    def _expected(self):
+        inserts = self.mixer.inserts
+        return ([p.plugin_instance_id for p in inserts],
+                [p.is_enabled for p in inserts])
+
+    def test_view_matches_inserts(self):
+        view = self.mixer.insert_chain_view()
+        ids, enabled = self._expected()
+        assert list(view.plugin_ids) == ids
+        assert view.enabled.tolist() == enabled
+        assert view.latency.tolist() == [0, 0, 0]
+
+    def test_bypass_is_refreshed_in_place(self):
+        view = self.mixer.insert_chain_view()
+        self.plugins[1].set_enabled(False)
+
+        assert self.mixer.insert_chain_view() is view
+        assert view.enabled.tolist() == self._expected()[1]
+
+    def test_view_is_rebuilt_after_reorder(self):
+        self.mixer.insert_chain_view()
+        self.mixer.move_insert("reverb", 0)
+
+        assert list(self.mixer.insert_chain_view().plugin_ids) == (
+            self._expected()[0])
@@ -0,0 +1,68 @@
+from echos.core import DAWManager
+from echos.backends.pedalboard import (PedalboardEngineFactory,
+                                       PedalboardNodeFactory)
+from echos.services import NodeService
+
+
+class _FailingAudioTrackFactory(PedalboardNodeFactory):
+
+    def create_audio_track(self, name: str):
+        raise RuntimeError("audio tracks unavailable")
+
+
+class TestCreateTracks:
+
+    def setup_method(self):
+        self._setup(PedalboardNodeFactory())
+
+    def _setup(self, node_factory):
+        self.manager = DAWManager(
+            project_serializer=None,
+            plugin_registry=None,
+            engine_factory=PedalboardEngineFactory(),
+            node_factory=node_factory,
+        )
+        self.project = self.manager.create_project("Test Project")
+        self.service = NodeService(self.manager)
+        self.base_node_count = len(self.project.router.nodes)
+
+    def test_creates_tracks_in_one_undo_step(self):
+        result = self.service.create_tracks(self.project.project_id,
+                                            [("instrument", "Lead"),
+                                             ("audio", "Vocals"),
+                                             ("bus", "Reverb Bus")])
+
+        assert result.status == "success"
+        assert [t["type"] for t in result.data["tracks"]] == [
+            "InstrumentTrack", "AudioTrack", "BusTrack"
+        ]
+        assert len(self.project.router.nodes) == self.base_node_count + 3
+        assert self.project.command_manager.get_undo_history() == [
+            "Create 3 tracks"
+        ]
+
+        self.project.command_manager.undo()
+        assert len(self.project.router.nodes) == self.base_node_count
+
+        self.project.command_manager.redo()
+        assert len(self.project.router.nodes) == self.base_node_count + 3
+
+    def test_failed_track_rolls_back_earlier_tracks(self):
+        self._setup(_FailingAudioTrackFactory())
+
+        result = self.service.create_tracks(self.project.project_id,
+                                            [("instrument", "Lead"),
+                                             ("bus", "Reverb Bus"),
+                                             ("audio", "Vocals")])
+
+        assert result.status == "error"
+        assert len(self.project.router.nodes) == self.base_node_count
+        assert self.project.command_manager.get_undo_history() == []
+
+    def test_unknown_track_kind_creates_nothing(self):
+        result = self.service.create_tracks(self.project.project_id,
+                                            [("instrument", "Lead"),
+                                             ("vca", "Master VCA")])
+
+        assert result.status == "error"
+        assert len(self.project.router.nodes) == self.base_node_count
@@ -0,0 +1,164 @@
+import threading
+
+import numpy as np
+import pytest
+
+from echos.core import Parameter
+from echos.core.parameter import ParameterBatchUpdater
+from echos.models import TransportContext
+from echos.models.parameter_model import AutomationCurveType
+
+_POINTS = [
+    (0.0, -12.0, AutomationCurveType.LINEAR, 0.0),
+    (2.0, 0.0, AutomationCurveType.EXPONENTIAL, 0.6),
+    (4.0, -24.0, AutomationCurveType.EXPONENTIAL, -0.4),
+    (5.5, -6.0, AutomationCurveType.SQUARE, 0.0),
+    (7.0, 3.0, AutomationCurveType.LINEAR, 0.0),
+    (7.0, 6.0, AutomationCurveType.LINEAR, 0.0),
+    (9.0, -3.0, AutomationCurveType.LINEAR, 0.0),
+]
+
+
+def _parameter():
+    return Parameter(owner_node_id="track_1",
+                     name="volume",
+                     default_value=0.0,
+                     min_value=-60.0,
+                     max_value=6.0,
+                     unit="dB")
+
+
+def _scalar_values(parameter, beats):
+    return np.array([
+        parameter.get_value_at(
+            TransportContext(current_beat=float(beat),
+                             sample_rate=48000,
+                             block_size=512,
+                             tempo=120.0)) for beat in beats
+    ])
+
+
+class TestBlockAutomation:
+
+    def setup_method(self):
+        self.parameter = _parameter()
+        # added out of order on purpose; the lane sorts on first read
+        for beat, value, curve_type, curve_shape in reversed(_POINTS):
+            self.parameter.add_automation_point(beat, value, curve_type,
+                                                curve_shape)
+        self.beats = np.concatenate([
+            np.linspace(-1.0, 10.0, 997),
+            [p[0] for p in _POINTS],
+        ])
+
+    def test_get_values_at_matches_get_value_at(self):
+        expected = _scalar_values(self.parameter, self.beats)
+        np.testing.assert_allclose(self.parameter.get_values_at(self.beats),
+                                   expected,
+                                   rtol=1e-12,
+                                   atol=1e-12)
+
+    def test_get_values_at_fills_out(self):
+        out = np.empty(len(self.beats))
+        result = self.parameter.get_values_at(self.beats, out=out)
+        assert result is out
+        np.testing.assert_allclose(out,
+                                   _scalar_values(self.parameter, self.beats))
+
+    def test_single_point_lane(self):
+        parameter = _parameter()
+        parameter.add_automation_point(3.0, -9.0)
+        np.testing.assert_array_equal(parameter.get_values_at(self.beats),
+                                      _scalar_values(parameter, self.beats))
+
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_without_automation_returns_base_value(self, enabled):
+        parameter = _parameter()
+        parameter.set_value(-3.0)
+        if not enabled:
+            parameter.add_automation_point(0.0, -30.0)
+            parameter.enable_automation(False)
+
+        np.testing.assert_array_equal(parameter.get_values_at(self.beats),
+                                      np.full(len(self.beats), -3.0))
+        np.testing.assert_array_equal(parameter.get_values_at(self.beats),
+                                      _scalar_values(parameter, self.beats))
+
+
+class TestBatchedAutomationPoints:
+
+    def test_batch_matches_point_by_point(self):
+        single = _parameter()
+        batched = _parameter()
+        for beat, value, curve_type, curve_shape in _POINTS:
+            single.add_automation_point(beat, value, curve_type, curve_shape)
+        beats, values, curve_types, curve_shapes = zip(*_POINTS)
+        batched.add_automation_points_batch(beats, values, curve_types,
+                                            curve_shapes)
+
+        assert batched.automation_lane.points == single.automation_lane.points
+
+    def test_batch_clamps_and_defaults_to_linear(self):
+        parameter = _parameter()
+        parameter.add_automation_points_batch([1.0, 0.0], [12.0, -90.0])
+
+        points = parameter.automation_lane.points
+        assert [(p.beat, p.value) for p in points] == [(0.0, -60.0),
+                                                        (1.0, 6.0)]
+        assert all(p.curve_type == AutomationCurveType.LINEAR
+                   for p in points)
+
+
+class _BlockingBus:
+    # holds the first publish until released, like a slow subscriber on
+    # the flush thread
+
+    def __init__(self):
+        self.published = []
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def publish(self, event):
+        if not self.entered.is_set():
+            self.entered.set()
+            self.release.wait(timeout=5.0)
+        self.published.append(event.new_values)
+
+
+class TestBatchUpdaterFlush:
+
+    def setup_method(self):
+        self.bus = _BlockingBus()
+        self.updater = ParameterBatchUpdater(self.bus)
+
+    def test_caller_flush_cannot_overtake_in_flight_batch(self):
+        self.updater.queue_change("track_1", "volume", -6.0)
+        in_flight = threading.Thread(target=self.updater.flush_now)
+        in_flight.start()
+        assert self.bus.entered.wait(timeout=5.0)
+
+        self.updater.queue_change("track_1", "volume", -3.0)
+        caller = threading.Thread(target=self.updater.flush_now)
+        caller.start()
+        caller.join(timeout=0.05)
+        self.bus.release.set()
+        in_flight.join(timeout=5.0)
+        caller.join(timeout=5.0)
+
+        assert self.bus.published == [(-6.0, ), (-3.0, )]
+
+    def test_flush_waits_for_in_flight_batch(self):
+        self.updater.queue_change("track_1", "volume", -6.0)
+        in_flight = threading.Thread(target=self.updater.flush_now)
+        in_flight.start()
+        assert self.bus.entered.wait(timeout=5.0)
+
+        caller = threading.Thread(target=self.updater.flush_now)
+        caller.start()
+        caller.join(timeout=0.05)
+        assert caller.is_alive()
+
+        self.bus.release.set()
+        caller.join(timeout=5.0)
+        in_flight.join(timeout=5.0)
+        assert self.bus.published == [(-6.0, )]
@@ -0,0 +1,57 @@
+import os
+
+from echos.core.plugin.scanner import PluginScanner
+
+
+class TestPluginFingerprint:
+
+    def _scanner(self, tmp_path):
+        worker = tmp_path / "worker.py"
+        worker.write_text("")
+        return PluginScanner(worker)
+
+    def _bundle(self, root, *parts):
+        bundle = root.joinpath(*parts)
+        binary = bundle / "Contents" / "x86_64-linux" / "plugin.so"
+        binary.parent.mkdir(parents=True)
+        binary.write_bytes(b"v1")
+        return bundle, binary
+
+    def _touch(self, path, mtime):
+        os.utime(path, (mtime, mtime))
+
+    def test_finds_deeply_nested_bundles(self, tmp_path):
+        scanner = self._scanner(tmp_path)
+        root = tmp_path / "plugins"
+        bundle, _ = self._bundle(root, "vendor", "suite", "Synth.vst3")
+
+        assert scanner.scan_plugin_paths([root]) == [bundle]
+
+    def test_binary_replaced_inside_bundle_changes_fingerprint(
+            self, tmp_path):
+        scanner = self._scanner(tmp_path)
+        root = tmp_path / "plugins"
+        bundle, binary = self._bundle(root, "vendor", "suite", "Synth.vst3")
+        for path in (binary, binary.parent, bundle / "Contents", bundle):
+            self._touch(path, 1_000_000)
+
+        paths = scanner.scan_plugin_paths([root])
+        before = scanner.fingerprint(paths)
+        assert scanner.fingerprint(paths) == before
+
+        binary.write_bytes(b"v2")
+        self._touch(binary, 2_000_000)
+
+        assert scanner.plugin_mod_time(bundle) == 2_000_000
+        assert scanner.fingerprint(paths) != before
+
+    def test_added_bundle_changes_fingerprint(self, tmp_path):
+        scanner = self._scanner(tmp_path)
+        root = tmp_path / "plugins"
+        self._bundle(root, "vendor", "Synth.vst3")
+        before = scanner.fingerprint(scanner.scan_plugin_paths([root]))
+
+        self._bundle(root, "vendor", "suite", "Delay.vst3")
+
+        after = scanner.fingerprint(scanner.scan_plugin_paths([root]))
+        assert after != before
@@ -0,0 +1,158 @@
+import random
+
+import networkx as nx
+
+from echos.core.router import Router
+from echos.backends.pedalboard import PedalboardNodeFactory
+from echos.models import Connection
+
+
+def _assert_valid_order(router):
+    order = router.get_processing_order()
+    assert sorted(order) == sorted(router.nodes)
+    position = {node_id: i for i, node_id in enumerate(order)}
+    for connection in router.get_all_connections():
+        assert position[connection.source_node_id] < position[
+            connection.dest_node_id]
+
+
+class TestProcessingOrder:
+
+    def setup_method(self):
+        self.factory = PedalboardNodeFactory()
+        self.router = Router()
+
+    def _add_track(self, name):
+        track = self.factory.create_audio_track(name)
+        self.router.add_node(track)
+        return track.node_id
+
+    def test_order_stays_valid_through_random_edits(self):
+        rng = random.Random(7)
+        node_ids = [self._add_track(f"track_{i}") for i in range(8)]
+        _assert_valid_order(self.router)
+
+        for step in range(300):
+            action = rng.random()
+            if action < 0.5 and len(node_ids) > 1:
+                source, dest = rng.sample(node_ids, 2)
+                self.router.connect(source, dest)
+            elif action < 0.8:
+                connections = self.router.get_all_connections()
+                if connections:
+                    c = rng.choice(connections)
+                    assert self.router.disconnect(c.source_node_id,
+                                                  c.dest_node_id)
+            elif action < 0.9 and len(node_ids) > 2:
+                node_id = node_ids.pop(rng.randrange(len(node_ids)))
+                self.router.remove_node(node_id)
+            else:
+                node_ids.append(self._add_track(f"track_{step}"))
+            _assert_valid_order(self.router)
+
+    def test_backward_edge_reorders(self):
+        a = self._add_track("a")
+        b = self._add_track("b")
+        c = self._add_track("c")
+        self.router.get_processing_order()
+
+        assert self.router.connect(c, a)
+        order = self.router.get_processing_order()
+        assert order.index(c) < order.index(a)
+        assert set(order) == {a, b, c}
+
+    def test_cycle_is_rejected(self):
+        a = self._add_track("a")
+        b = self._add_track("b")
+        assert self.router.connect(a, b)
+        assert not self.router.connect(b, a)
+        _assert_valid_order(self.router)
+
+    def test_layers_match_topological_generations(self):
+        ids = [self._add_track(f"track_{i}") for i in range(5)]
+        self.router.connect(ids[0], ids[2])
+        self.router.connect(ids[1], ids[2])
+        self.router.connect(ids[2], ids[4])
+
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self.router.nodes)
+        graph.add_edges_from((c.source_node_id, c.dest_node_id)
+                             for c in self.router.get_all_connections())
+        expected = [set(layer) for layer in nx.topological_generations(graph)]
+        assert [set(layer) for layer in self.router.get_processing_layers()
+                ] == expected
+
+
+class TestConnectionIndex:
+
+    def setup_method(self):
+        factory = PedalboardNodeFactory()
+        self.router = Router()
+        self.ids = []
+        for i in range(4):
+            track = factory.create_audio_track(f"track_{i}")
+            self.router.add_node(track)
+            self.ids.append(track.node_id)
+
+    def _assert_index_matches(self):
+        connections = self.router.get_all_connections()
+        for node_id in self.ids:
+            if node_id not in self.router.nodes:
+                continue
+            assert self.router.get_inputs_for_node(node_id) == [
+                c for c in connections if c.dest_node_id == node_id
+            ]
+            assert self.router.get_outputs_for_node(node_id) == [
+                c for c in connections if c.source_node_id == node_id
+            ]
+
+    def test_connections_keep_insertion_order(self):
+        a, b, c, d = self.ids
+        pairs = [(a, c), (b, c), (a, d), (c, d), (b, d)]
+        for source, dest in pairs:
+            assert self.router.connect(source, dest)
+        assert not self.router.connect(a, c)
+
+        assert self.router.disconnect(b, c)
+        assert not self.router.disconnect(b, c)
+        assert self.router.connect(b, c)
+
+        expected = [(a, c), (a, d), (c, d), (b, d), (b, c)]
+        assert [(x.source_node_id, x.dest_node_id)
+                for x in self.router.get_all_connections()] == expected
+        self._assert_index_matches()
+
+    def test_remove_node_drops_its_connections(self):
+        a, b, c, d = self.ids
+        for source, dest in [(a, b), (b, c), (a, c), (c, d)]:
+            self.router.connect(source, dest)
+
+        self.router.remove_node(b)
+
+        assert [(x.source_node_id, x.dest_node_id)
+                for x in self.router.get_all_connections()] == [(a, c),
+                                                                (c, d)]
+        self._assert_index_matches()
+
+    def test_connect_many_matches_single_connects(self):
+        a, b, c, d = self.ids
+        single = Router()
+        for node in self.router.get_all_nodes():
+            single.add_node(node)
+        connections = [
+            Connection(a, b, "main_out", "main_in"),
+            Connection(b, c, "main_out", "main_in"),
+            Connection(c, a, "main_out", "main_in"),
+            Connection(a, b, "main_out", "main_in"),
+        ]
+
+        results = self.router.connect_many(connections)
+        expected = [
+            single.connect(x.source_node_id, x.dest_node_id)
+            for x in connections
+        ]
+
+        assert results == expected == [True, True, False, False]
+        assert self.router.get_all_connections() == (
+            single.get_all_connections())
+        _assert_valid_order(self.router)
@@ -0,0 +1,139 @@
+import bisect
+import random
+
+import numpy as np
+import pytest
+
+from echos.core import Timeline
+from echos.backends.pedalboard.timeline import RealTimeTimeline
+from echos.models import Tempo, TempoMap, TimeSignature
+from echos.models.state_model import TimelineState
+from echos.models.timeline_model import segment_index
+
+_TEMPOS = [
+    Tempo(beat=0.0, bpm=120.0),
+    Tempo(beat=8.0, bpm=90.0),
+    Tempo(beat=12.5, bpm=174.0),
+    Tempo(beat=40.0, bpm=60.0),
+]
+_SIGNATURES = [
+    TimeSignature(beat=0.0, numerator=4, denominator=4),
+    TimeSignature(beat=16.0, numerator=7, denominator=8),
+    TimeSignature(beat=30.0, numerator=3, denominator=4),
+]
+
+
+def _bisect_index(starts, value):
+    return max(bisect.bisect_right(starts, value) - 1, 0)
+
+
+def _loop_beats_to_seconds(tempos, target):
+    # the integration the tempo map replaced: walk the segments in order
+    seconds = 0.0
+    for tempo, following in zip(tempos, tempos[1:] + [None]):
+        end = target if following is None else min(target, following.beat)
+        if end <= tempo.beat:
+            break
+        seconds += (end - tempo.beat) * 60.0 / tempo.bpm
+    return seconds
+
+
+class TestSegmentIndex:
+
+    @pytest.mark.parametrize("starts", [
+        (0.0, ),
+        (0.0, 4.0),
+        (0.0, 4.0, 4.0, 9.5, 20.0),
+        tuple(float(i) for i in range(0, 64, 3)),
+    ])
+    def test_any_hint_matches_bisect(self, starts):
+        rng = random.Random(3)
+        values = [rng.uniform(-5.0, starts[-1] + 5.0) for _ in range(200)]
+        values += list(starts)
+        for value in values:
+            expected = _bisect_index(starts, value)
+            for hint in range(-2, len(starts) + 2):
+                assert segment_index(starts, value, hint) == expected
+
+    def test_forward_playback_hints(self):
+        starts = tuple(t.beat for t in _TEMPOS)
+        hint = 0
+        for beat in np.arange(0.0, 50.0, 0.01):
+            hint = segment_index(starts, beat, hint)
+            assert hint == _bisect_index(starts, beat)
+
+
+class TestTempoMap:
+
+    def setup_method(self):
+        self.tempo_map = TempoMap.from_tempos(_TEMPOS)
+        self.beats = np.concatenate([
+            np.linspace(-2.0, 60.0, 1001),
+            [t.beat for t in _TEMPOS],
+        ])
+
+    def test_beats_to_seconds_matches_segment_walk(self):
+        for beat in self.beats:
+            assert self.tempo_map.beats_to_seconds(beat) == pytest.approx(
+                _loop_beats_to_seconds(_TEMPOS, max(beat, 0.0)))
+
+    def test_round_trip(self):
+        for beat in self.beats[self.beats >= 0]:
+            seconds = self.tempo_map.beats_to_seconds(beat)
+            assert self.tempo_map.seconds_to_beats(seconds) == pytest.approx(
+                beat)
+
+    def test_arrays_match_scalars(self):
+        np.testing.assert_allclose(
+            self.tempo_map.beats_to_seconds_array(self.beats),
+            [self.tempo_map.beats_to_seconds(b) for b in self.beats])
+        seconds = np.linspace(-1.0, 80.0, 1001)
+        np.testing.assert_allclose(
+            self.tempo_map.seconds_to_beats_array(seconds),
+            [self.tempo_map.seconds_to_beats(s) for s in seconds])
+
+
+@pytest.mark.parametrize("timeline_type", [Timeline, RealTimeTimeline])
+class TestTimelineLookups:
+
+    def _timeline(self, timeline_type):
+        timeline = timeline_type()
+        timeline.set_state(
+            TimelineState(tempos=list(_TEMPOS),
+                          time_signatures=list(_SIGNATURES)))
+        return timeline
+
+    def test_hinted_lookups_match_bisect(self, timeline_type):
+        timeline = self._timeline(timeline_type)
+        tempo_starts = [t.beat for t in _TEMPOS]
+        signature_starts = [s.beat for s in _SIGNATURES]
+        rng = random.Random(11)
+        beats = list(np.arange(0.0, 50.0, 0.25))
+        beats += [rng.uniform(0.0, 50.0) for _ in range(200)]
+
+        for beat in beats:
+            assert timeline.get_tempo_at_beat(beat) == _TEMPOS[_bisect_index(
+                tempo_starts, beat)]
+            assert timeline.get_time_signature_at_beat(
+                beat) == _SIGNATURES[_bisect_index(signature_starts, beat)]
+
+    def test_lookups_follow_tempo_changes(self, timeline_type):
+        timeline = self._timeline(timeline_type)
+        assert timeline.get_tempo_at_beat(45.0) == _TEMPOS[-1]
+
+        timeline.set_state(
+            TimelineState(tempos=[Tempo(beat=0.0, bpm=100.0)],
+                          time_signatures=list(_SIGNATURES)))
+        assert timeline.get_tempo_at_beat(45.0) == Tempo(beat=0.0,
+                                                         bpm=100.0)
+
+    def test_array_conversions_match_scalars(self, timeline_type):
+        timeline = self._timeline(timeline_type)
+        beats = np.linspace(0.0, 60.0, 513)
+        np.testing.assert_allclose(
+            timeline.beats_to_seconds_array(beats),
+            [timeline.beats_to_seconds(b) for b in beats])
+        seconds = np.linspace(0.0, 80.0, 513)
+        np.testing.assert_allclose(
+            timeline.seconds_to_beats_array(seconds),
+            [timeline.seconds_to_beats(s) for s in seconds])